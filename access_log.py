@@ -0,0 +1,57 @@
+"""
+gunicorn JSON 접근 로그
+access_log_format 문자열에 atom 값을 그대로 끼워 넣으면 경로/쿼리의 `"`, `\\`
+때문에 JSON이 깨지므로, atom 값을 extra 필드로 넘겨 structured_logging의
+JSONFormatter가 직렬화하게 합니다.
+
+    GUNICORN_ACCESS_LOG_FORMAT=json gunicorn --config gunicorn.conf.py wsgi:app
+"""
+
+from gunicorn import glogging
+
+from structured_logging import JSONFormatter
+
+# JSON 필드 이름: gunicorn atom
+ACCESS_LOG_FIELDS = {
+    "remote_addr": "h",
+    "method": "m",
+    "path": "U",
+    "query": "q",
+    "status": "s",
+    "bytes": "B",
+    "user_agent": "a",
+    "server_timing": "{server-timing}o",
+}
+
+
+class JSONAccessLogger(glogging.Logger):
+    """접근 로그를 요청당 JSON 한 줄로 기록하는 gunicorn 로거"""
+
+    def setup(self, cfg):
+        super().setup(cfg)
+        for handler in self.access_log.handlers:
+            handler.setFormatter(JSONFormatter())
+
+    def access(self, resp, req, environ, request_time):
+        if not (
+            self.cfg.accesslog
+            or self.cfg.logconfig
+            or self.cfg.logconfig_dict
+            or self.cfg.logconfig_json
+            or (self.cfg.syslog and not self.cfg.disable_redirect_access_to_syslog)
+        ):
+            return
+
+        atoms = self.atoms(resp, req, environ, request_time)
+        extra = {field: atoms.get(atom) for field, atom in ACCESS_LOG_FIELDS.items()}
+        try:
+            extra["status"] = int(extra["status"])
+        except (TypeError, ValueError):
+            pass
+        extra["duration_ms"] = round(request_time.total_seconds() * 1000, 3)
+        try:
+            self.access_log.info(
+                "%s %s %s", extra["method"], extra["path"], extra["status"], extra=extra
+            )
+        except Exception:
+            self.exception("접근 로그 기록 실패")
@@ -4,47 +4,268 @@
 FE에서 차트 사양을 가져올 수 있는 REST API를 제공합니다.
 """
 
-from flask import Flask, jsonify, request
+import os
+import queue
+import time
+from functools import lru_cache, wraps
+
+from flask import (
+    Flask,
+    current_app,
+    g,
+    jsonify,
+    make_response,
+    request,
+    stream_with_context,
+)
 from flask_cors import CORS
 from flask_restx import Api, Resource, fields
 
+import server_timing
+from chart_registry import CHART_REGISTRY
+from chart_resources import (
+    CACHEABLE_PATH_PREFIXES,
+    DATA_CACHE_MAX_AGE,
+    IMMUTABLE_CACHE_CONTROL,
+    build_manifest,
+    chart_style_path,
+    chart_url_version,
+    data_url_version,
+    last_modified,
+    request_datasets,
+    split_chart_spec,
+    versioned_chart_path,
+    versioned_data_path,
+)
 from chart_specs import (
-    AGE_GENDER_DATA,
-    AREA_POPULATION_DATA,
-    BAR_CHART_DATA,
-    CLOSING_RATE_DATA,
-    GENDER_PIE_DATA,
-    GROWTH_RATE_DATA,
-    LINE_CHART_DATA,
-    NET_GROWTH_RATE_DATA,
-    OPENING_CLOSING_RATE_DATA,
-    TIME_PERIOD_DATA,
-    YEARLY_TREND_DATA,
-    get_chartjs_age_gender_config,
-    get_chartjs_area_population_config,
-    get_chartjs_bar_chart_config,
-    get_chartjs_closing_rate_config,
-    get_chartjs_growth_rate_config,
-    get_chartjs_line_chart_config,
-    get_chartjs_net_growth_rate_config,
-    get_chartjs_opening_closing_rate_config,
-    get_chartjs_pie_chart_config,
-    get_chartjs_time_period_config,
-    get_chartjs_yearly_trend_config,
-    get_echarts_bar_chart_option,
-    get_echarts_line_chart_option,
-    get_echarts_pie_chart_option,
-    get_plotly_bar_chart_figure,
-    get_plotly_line_chart_figure,
-    get_plotly_pie_chart_figure,
-    get_vega_lite_bar_chart_spec,
-    get_vega_lite_line_chart_spec,
-    get_vega_lite_pie_chart_spec,
+    DATA_WATCH_INTERVAL,
+    DATASET_NAMES,
+    DATASET_VERSIONS,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    PAGINATED_DATASETS,
+    data_response_key,
+    get_data_version,
+    get_dataset,
+    get_datasets_version,
+    get_rows_page,
+    readiness,
+    start_data_watcher,
+    warm_up_spec_cache,
+)
+from compression import (
+    MIN_COMPRESS_SIZE,
+    SUPPORTED_ENCODINGS,
+    CompressedVariantCache,
+    PrecompressedBody,
+    compress,
+)
+from event_broker import DATA_EVENTS, format_sse, subscribe_data_events
+from json_encoder import dumps as json_dumps
+from metrics import observe_request, register_cache_stats, render_metrics
+from profiling import ProfilingMiddleware
+from rate_limit import AccessController, ConcurrencyLimiter, Rejection
+from response_utils import (
+    content_hash,
+    decode_cursor,
+    encode_cursor,
+    parse_field_paths,
+    project_fields,
 )
 
 app = Flask(__name__)
 CORS(app)  # CORS 활성화
 
+# 관리자 키로 요청한 프로파일링과 일부 요청 샘플링 (PROFILE_* 환경변수)
+app.wsgi_app = ProfilingMiddleware(app.wsgi_app)
+
+# 데이터 버전별 압축 결과 캐시 (차트/데이터 API 응답용)
+COMPRESSED_RESPONSES = CompressedVariantCache(
+    maxsize=int(os.environ.get("COMPRESSION_CACHE_SIZE", "256"))
+)
+register_cache_stats(
+    lambda: {"compression": (COMPRESSED_RESPONSES.hits, COMPRESSED_RESPONSES.misses)}
+)
+
+
+# 요청 메트릭 훅은 가장 먼저 등록해, 시작 시각은 다른 before_request보다 먼저 재고
+# 응답 크기는 (after_request는 등록 역순으로 실행되므로) 압축이 끝난 뒤에 잽니다.
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """라우트별 요청 수, 처리 시간, 응답 크기를 기록합니다."""
+    started = g.get("request_started")
+    if started is not None:
+        observe_request(
+            request.method,
+            request.url_rule.rule if request.url_rule else None,
+            response.status_code,
+            time.perf_counter() - started,
+            response.content_length,
+        )
+    return response
+
+
+# 단계별 처리 시간 기록도 메트릭 다음으로 등록해, Server-Timing 헤더는
+# 압축이 끝난 뒤 (메트릭 기록 직전에) 붙입니다.
+@app.before_request
+def start_server_timing():
+    server_timing.start()
+
+
+@app.after_request
+def set_server_timing(response):
+    """단계별 처리 시간을 Server-Timing 헤더로 추가합니다."""
+    timing = server_timing.stop()
+    if timing is not None:
+        response.headers["Server-Timing"] = timing.header_value()
+        # 다른 출처의 프론트엔드에서도 Resource Timing API로 읽을 수 있게 허용
+        response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+
+@app.teardown_request
+def stop_server_timing(exc):
+    """응답을 만들지 못한 요청의 기록이 다음 요청으로 넘어가지 않게 정리합니다."""
+    server_timing.stop()
+
+
+# API 키 확인, 키별 속도 제한, 동시 처리 수 제한 (환경변수로 설정)
+ACCESS_CONTROL = AccessController.from_env()
+
+
+def error_response(status, message):
+    """flask-restx 에러 형식과 같은 {"message": ...} 에러 응답"""
+    response = jsonify({"message": message})
+    response.status_code = status
+    return response
+
+
+def rejection_response(rejection):
+    """요청 제한으로 거절할 때의 에러 응답"""
+    response = error_response(rejection.status, rejection.message)
+    if rejection.retry_after is not None:
+        response.headers["Retry-After"] = str(rejection.retry_after)
+    return response
+
+
+@app.before_request
+def enforce_access_limits():
+    """API 키와 요청 한도를 확인하고, 서버가 포화 상태면 바로 거절합니다."""
+    if not ACCESS_CONTROL.applies_to(request.path):
+        return None
+
+    rejection = ACCESS_CONTROL.check(
+        request.headers.get("X-API-KEY"), request.remote_addr
+    )
+    if rejection is None and ACCESS_CONTROL.holds_slot(request.path):
+        rejection = ACCESS_CONTROL.acquire()
+        g.holds_slot = rejection is None
+    if rejection is not None:
+        return rejection_response(rejection)
+    return None
+
+
+@app.after_request
+def release_access_slot_on_close(response):
+    """응답 전송이 끝나면 (스트리밍 응답은 스트림이 닫히면) 처리 슬롯을 반환합니다."""
+    if g.pop("holds_slot", False):
+        response.call_on_close(ACCESS_CONTROL.release)
+    return response
+
+
+@app.teardown_request
+def release_access_slot(exc):
+    """응답을 만들지 못하고 끝난 요청의 처리 슬롯을 반환합니다."""
+    if g.pop("holds_slot", False):
+        ACCESS_CONTROL.release()
+
+
+@app.before_request
+def check_not_modified():
+    """데이터셋 로드 시각 기준으로 If-Modified-Since 요청에 304를 바로 응답합니다."""
+    if request.method not in ("GET", "HEAD"):
+        return None
+
+    datasets = request_datasets(
+        request.path, request.view_args or {}, request.args.get("type", "all")
+    )
+    if not datasets:
+        return None
+
+    g.last_modified = modified_at = last_modified(datasets)
+
+    # If-None-Match가 있으면 ETag 검증이 우선 (RFC 9110)
+    if_modified_since = request.if_modified_since
+    if (
+        if_modified_since is None
+        or "If-None-Match" in request.headers
+        or modified_at > if_modified_since.timestamp()
+    ):
+        return None
+
+    response = app.response_class(status=304)
+    response.last_modified = modified_at
+    return response
+
+
+@app.after_request
+def set_last_modified(response):
+    """데이터셋 기반 응답에 Last-Modified 헤더를 추가합니다."""
+    last_modified = g.get("last_modified")
+    if (
+        last_modified is not None
+        and response.status_code == 200
+        and response.last_modified is None
+    ):
+        response.last_modified = last_modified
+    return response
+
+
+@app.after_request
+def compress_response(response):
+    """Accept-Encoding에 따라 JSON 응답을 gzip/brotli로 압축합니다."""
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or response.mimetype != "application/json"
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_SIZE:
+        return response
+
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    if encoding is None:
+        return response
+
+    with server_timing.stage("compress"):
+        if request.path.startswith(CACHEABLE_PATH_PREFIXES):
+            # 같은 데이터 버전의 같은 요청은 한 번 압축한 결과를 재사용
+            cache_key = (request.full_path, get_data_version())
+            compressed = COMPRESSED_RESPONSES.get_or_compress(cache_key, encoding, body)
+        else:
+            compressed = compress(body, encoding)
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+
+    # 인코딩별로 바이트가 다르므로 강한 ETag는 약한 ETag로 변경
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
 # Swagger API 설정
 api = Api(
     app,
@@ -55,8 +276,21 @@ api = Api(
     default="charts",
     default_label="차트 관련 API",
     authorizations={"apikey": {"type": "apiKey", "in": "header", "name": "X-API-KEY"}},
+    security="apikey" if ACCESS_CONTROL.api_keys else None,
 )
 
+
+@api.representation("application/json")
+def output_json(data, code, headers=None):
+    """flask-restx 응답을 orjson으로 직렬화합니다 (NumPy/pandas 값, NaN → null 처리)."""
+    server_timing.record("dispatch")
+    with server_timing.stage("encode"):
+        body = json_dumps(data, indent=current_app.debug) + b"\n"
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
+
+
 # API 모델 정의
 chart_response_model = api.model(
     "ChartResponse",
@@ -77,6 +311,165 @@ error_model = api.model(
 # 차트 네임스페이스
 charts_ns = api.namespace("api/charts", description="차트 사양 관련 API")
 data_ns = api.namespace("api/data", description="원본 데이터 관련 API")
+versioned_ns = api.namespace(
+    "api/v", description="데이터/코드 버전이 포함된 불변(immutable) URL API (CDN 캐시용)"
+)
+
+FIELDS_PARAM_DESCRIPTION = (
+    "응답에 포함할 필드 경로 (쉼표 구분, 예: data.datasets,options.plugins.title). "
+    "'*'는 모든 키와 일치합니다."
+)
+
+
+def with_field_projection(func):
+    """?fields= 파라미터가 있으면 직렬화 전에 응답을 해당 필드만 남기도록 줄입니다."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        fields_param = request.args.get("fields")
+        if not fields_param or isinstance(result, app.response_class):
+            # 스트리밍 응답은 항목별로 직접 필드 선택을 적용
+            return result
+
+        paths = parse_field_paths(fields_param)
+        if isinstance(result, tuple):
+            # (본문, 상태 코드, 헤더) 형태의 응답은 본문에만 적용
+            return (project_fields(result[0], paths),) + result[1:]
+        return project_fields(result, paths)
+
+    return wrapper
+
+
+MAX_POINTS_PARAM_DESCRIPTION = "최대 점 개수 (라인 차트는 LTTB, 막대 차트는 min/max 방식으로 다운샘플링)"
+
+
+TOP_PARAM_DESCRIPTION = "상위 N개 카테고리만 남기고 나머지는 '기타'로 묶음"
+
+
+def chart_options():
+    """요청 쿼리 파라미터에서 차트 빌더 옵션을 읽습니다."""
+    max_points = request.args.get("max_points", type=int)
+    if max_points is not None and max_points < 2:
+        api.abort(400, "max_points는 2 이상이어야 합니다")
+
+    top = request.args.get("top", type=int)
+    if top is not None and top < 1:
+        api.abort(400, "top은 1 이상이어야 합니다")
+
+    return {"max_points": max_points, "top": top}
+
+
+# Swagger enum (레지스트리 기준)
+LIBRARY_ENUM = CHART_REGISTRY.libraries()
+CHART_TYPE_ENUM = CHART_REGISTRY.chart_types()
+
+
+def resolve_chart(library, chart_type):
+    """라이브러리/차트 타입에 해당하는 레지스트리 항목을 찾습니다 (없으면 400)."""
+    entry = CHART_REGISTRY.get(library, chart_type)
+    if entry is None:
+        if library not in LIBRARY_ENUM:
+            api.abort(400, f"지원하지 않는 라이브러리: {library}")
+        api.abort(400, f"지원하지 않는 차트 타입: {chart_type}")
+    return entry
+
+
+def build_chart(entry, options):
+    """의존 데이터셋 버전별 캐시를 거쳐 차트 사양을 생성합니다."""
+    return CHART_REGISTRY.build(entry, options, get_datasets_version(entry.datasets))
+
+
+def build_library_charts(library, options):
+    """라이브러리의 모든 차트 사양을 {응답 키: 사양} 형태로 생성합니다."""
+    return {
+        entry.response_key: build_chart(entry, options)
+        for entry in CHART_REGISTRY.entries(library)
+    }
+
+
+def paginate_dataset(data_type):
+    """목록형 데이터셋을 limit/cursor 기준으로 한 페이지만 잘라 반환합니다."""
+    if data_type not in PAGINATED_DATASETS:
+        api.abort(
+            400,
+            f"페이지네이션을 지원하지 않는 데이터 타입: {data_type} "
+            f"(지원: {', '.join(PAGINATED_DATASETS)})",
+        )
+
+    limit = request.args.get("limit", DEFAULT_PAGE_LIMIT, type=int)
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        api.abort(400, f"limit은 1 이상 {MAX_PAGE_LIMIT} 이하여야 합니다")
+
+    version = DATASET_VERSIONS[data_type]
+    offset = 0
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            cursor_version, offset = decode_cursor(cursor)
+        except ValueError as e:
+            api.abort(400, str(e))
+        if cursor_version != version:
+            api.abort(400, "데이터가 갱신되어 커서가 만료되었습니다. 처음부터 다시 요청하세요")
+
+    items, total = get_rows_page(data_type, offset, limit)
+    next_offset = offset + len(items)
+    return {
+        "type": data_type,
+        "items": items,
+        "limit": limit,
+        "total": total,
+        "next_cursor": encode_cursor(version, next_offset)
+        if next_offset < total
+        else None,
+    }
+
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_ndjson():
+    """?stream=1 또는 Accept 헤더로 NDJSON 스트리밍을 요청했는지 확인합니다."""
+    if request.args.get("stream") in ("1", "true"):
+        return True
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def stream_charts(entries, options):
+    """
+    차트 사양을 생성(또는 캐시 조회)하는 즉시 한 줄씩 NDJSON으로 내보냅니다.
+
+    전체 응답을 메모리에 모으지 않으므로 첫 바이트까지의 시간과 요청당 메모리가
+    차트 개수와 무관합니다. 생성에 실패한 차트는 error 줄로 알리고 계속 진행합니다.
+    """
+    fields_param = request.args.get("fields")
+    paths = parse_field_paths(fields_param) if fields_param else None
+
+    def generate():
+        for entry in entries:
+            line = {"library": entry.library, "chart_type": entry.chart_type}
+            try:
+                spec = build_chart(entry, options)
+            except Exception as e:
+                line["error"] = f"차트 사양 생성 실패: {str(e)}"
+            else:
+                line["spec"] = project_fields(spec, paths) if paths else spec
+            yield json_dumps(line) + b"\n"
+
+    response = app.response_class(
+        stream_with_context(generate()), mimetype=NDJSON_MIMETYPE
+    )
+    response.vary.add("Accept")
+    # 프록시(nginx)가 스트림을 버퍼링하지 않도록 설정
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+class ProjectableResource(Resource):
+    """?fields= 필드 선택을 지원하는 리소스 기본 클래스"""
+
+    method_decorators = [with_field_projection]
 
 
 @app.route("/")
@@ -93,330 +486,312 @@ def index():
                 "echarts": "/api/charts/echarts",
                 "plotly": "/api/charts/plotly",
                 "chartjs": "/api/charts/chartjs",
+                "manifest": "/api/manifest",
+                "events": "/api/events",
             },
         }
     )
 
 
 @charts_ns.route("/")
-class AllCharts(Resource):
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+@api.param("max_points", MAX_POINTS_PARAM_DESCRIPTION, type=int)
+@api.param("top", TOP_PARAM_DESCRIPTION, type=int)
+@api.param("stream", "1이면 차트별로 한 줄씩 NDJSON 스트리밍 (Accept: application/x-ndjson과 동일)")
+class AllCharts(ProjectableResource):
     @api.doc("get_all_charts")
     @api.response(200, "Success", chart_response_model)
+    @api.produces(["application/json", NDJSON_MIMETYPE])
     def get(self):
         """모든 차트 라이브러리의 사양을 반환"""
-        return {
-            "message": "모든 차트 사양 조회 성공",
-            "data": {
-                "vega_lite": {
-                    "line_chart": get_vega_lite_line_chart_spec(),
-                    "bar_chart": get_vega_lite_bar_chart_spec(),
-                    "pie_chart": get_vega_lite_pie_chart_spec(),
-                },
-                "echarts": {
-                    "line_chart": get_echarts_line_chart_option(),
-                    "bar_chart": get_echarts_bar_chart_option(),
-                    "pie_chart": get_echarts_pie_chart_option(),
-                },
-                "plotly": {
-                    "line_chart": get_plotly_line_chart_figure(),
-                    "bar_chart": get_plotly_bar_chart_figure(),
-                    "pie_chart": get_plotly_pie_chart_figure(),
-                },
-                "chartjs": {
-                    "line_chart": get_chartjs_line_chart_config(),
-                    "bar_chart": get_chartjs_bar_chart_config(),
-                    "pie_chart": get_chartjs_pie_chart_config(),
-                    "area_population": get_chartjs_area_population_config(),
-                    "age_gender": get_chartjs_age_gender_config(),
-                    "time_period": get_chartjs_time_period_config(),
-                    "yearly_trend": get_chartjs_yearly_trend_config(),
-                    "growth_rate": get_chartjs_growth_rate_config(),
-                    "closing_rate": get_chartjs_closing_rate_config(),
-                    "opening_closing_rate": get_chartjs_opening_closing_rate_config(),
-                    "net_growth_rate": get_chartjs_net_growth_rate_config(),
+        options = chart_options()
+        if wants_ndjson():
+            return stream_charts(CHART_REGISTRY.entries(), options)
+
+        return (
+            {
+                "message": "모든 차트 사양 조회 성공",
+                "data": {
+                    library: build_library_charts(library, options)
+                    for library in CHART_REGISTRY.libraries()
                 },
             },
-        }
-
-
-@charts_ns.route("/vega_lite")
-class VegaLiteCharts(Resource):
-    @api.doc("get_vega_lite_charts")
+            200,
+            {"Vary": "Accept"},
+        )
+
+
+@charts_ns.route("/<library>")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+@api.param("max_points", MAX_POINTS_PARAM_DESCRIPTION, type=int)
+@api.param("top", TOP_PARAM_DESCRIPTION, type=int)
+class LibraryCharts(ProjectableResource):
+    @api.doc("get_library_charts")
+    @api.param("library", "차트 라이브러리", enum=LIBRARY_ENUM)
     @api.param(
-        "type", "차트 타입 (line, bar, pie, all)", enum=["line", "bar", "pie", "all"]
+        "type",
+        "차트 타입 (라이브러리에서 지원하지 않는 타입이면 all과 동일)",
+        enum=CHART_TYPE_ENUM + ["all"],
     )
     @api.response(200, "Success")
-    def get(self):
-        """Vega-Lite 차트 사양만 반환"""
-        chart_type = request.args.get("type", "all")
-
-        if chart_type == "line":
-            return get_vega_lite_line_chart_spec()
-        elif chart_type == "bar":
-            return get_vega_lite_bar_chart_spec()
-        elif chart_type == "pie":
-            return get_vega_lite_pie_chart_spec()
-        else:
-            return {
-                "line_chart": get_vega_lite_line_chart_spec(),
-                "bar_chart": get_vega_lite_bar_chart_spec(),
-                "pie_chart": get_vega_lite_pie_chart_spec(),
-            }
-
+    @api.response(404, "Not Found", error_model)
+    def get(self, library):
+        """특정 라이브러리의 차트 사양만 반환"""
+        if library not in LIBRARY_ENUM:
+            api.abort(404, f"지원하지 않는 라이브러리: {library}")
 
-@charts_ns.route("/echarts")
-class EChartsCharts(Resource):
-    @api.doc("get_echarts_charts")
-    @api.param(
-        "type", "차트 타입 (line, bar, pie, all)", enum=["line", "bar", "pie", "all"]
-    )
-    @api.response(200, "Success")
-    def get(self):
-        """ECharts 차트 옵션만 반환"""
-        chart_type = request.args.get("type", "all")
-
-        if chart_type == "line":
-            return get_echarts_line_chart_option()
-        elif chart_type == "bar":
-            return get_echarts_bar_chart_option()
-        elif chart_type == "pie":
-            return get_echarts_pie_chart_option()
-        else:
-            return {
-                "line_chart": get_echarts_line_chart_option(),
-                "bar_chart": get_echarts_bar_chart_option(),
-                "pie_chart": get_echarts_pie_chart_option(),
-            }
+        options = chart_options()
+        entry = CHART_REGISTRY.get(library, request.args.get("type", "all"))
+        if entry is not None:
+            return build_chart(entry, options)
+        return build_library_charts(library, options)
 
 
-@charts_ns.route("/plotly")
-class PlotlyCharts(Resource):
-    @api.doc("get_plotly_charts")
-    @api.param(
-        "type", "차트 타입 (line, bar, pie, all)", enum=["line", "bar", "pie", "all"]
-    )
+@data_ns.route("/")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+class ChartData(ProjectableResource):
+    @api.doc("get_chart_data")
+    @api.param("type", "데이터 타입", enum=list(DATASET_NAMES) + ["all"])
+    @api.param("limit", f"페이지 크기 (최대 {MAX_PAGE_LIMIT})", type=int)
+    @api.param("cursor", "이전 응답의 next_cursor 값")
     @api.response(200, "Success")
+    @api.response(400, "Bad Request", error_model)
     def get(self):
-        """Plotly 차트 figure만 반환"""
-        chart_type = request.args.get("type", "all")
-
-        if chart_type == "line":
-            return get_plotly_line_chart_figure()
-        elif chart_type == "bar":
-            return get_plotly_bar_chart_figure()
-        elif chart_type == "pie":
-            return get_plotly_pie_chart_figure()
-        else:
-            return {
-                "line_chart": get_plotly_line_chart_figure(),
-                "bar_chart": get_plotly_bar_chart_figure(),
-                "pie_chart": get_plotly_pie_chart_figure(),
-            }
+        """원본 차트 데이터 반환 (limit/cursor 지정 시 목록형 데이터를 페이지 단위로 반환)"""
+        data_type = request.args.get("type", "all")
 
+        if "limit" in request.args or "cursor" in request.args:
+            return paginate_dataset(data_type)
 
-@charts_ns.route("/chartjs")
-class ChartJSCharts(Resource):
-    @api.doc("get_chartjs_charts")
-    @api.param(
-        "type",
-        "차트 타입 (line, bar, pie, area_population, age_gender, "
-        "time_period, yearly_trend, growth_rate, closing_rate, "
-        "opening_closing_rate, net_growth_rate, all)",
-        enum=[
-            "line",
-            "bar",
-            "pie",
-            "area_population",
-            "age_gender",
-            "time_period",
-            "yearly_trend",
-            "growth_rate",
-            "closing_rate",
-            "opening_closing_rate",
-            "net_growth_rate",
-            "all",
-        ],
-    )
-    @api.response(200, "Success")
-    def get(self):
-        """Chart.js 차트 설정만 반환"""
-        chart_type = request.args.get("type", "all")
-
-        if chart_type == "line":
-            return get_chartjs_line_chart_config()
-        elif chart_type == "bar":
-            return get_chartjs_bar_chart_config()
-        elif chart_type == "pie":
-            return get_chartjs_pie_chart_config()
-        elif chart_type == "area_population":
-            return get_chartjs_area_population_config()
-        elif chart_type == "age_gender":
-            return get_chartjs_age_gender_config()
-        elif chart_type == "time_period":
-            return get_chartjs_time_period_config()
-        elif chart_type == "yearly_trend":
-            return get_chartjs_yearly_trend_config()
-        elif chart_type == "growth_rate":
-            return get_chartjs_growth_rate_config()
-        elif chart_type == "closing_rate":
-            return get_chartjs_closing_rate_config()
-        elif chart_type == "opening_closing_rate":
-            return get_chartjs_opening_closing_rate_config()
-        elif chart_type == "net_growth_rate":
-            return get_chartjs_net_growth_rate_config()
-        else:
-            return {
-                "line_chart": get_chartjs_line_chart_config(),
-                "bar_chart": get_chartjs_bar_chart_config(),
-                "pie_chart": get_chartjs_pie_chart_config(),
-                "area_population": get_chartjs_area_population_config(),
-                "age_gender": get_chartjs_age_gender_config(),
-                "time_period": get_chartjs_time_period_config(),
-                "yearly_trend": get_chartjs_yearly_trend_config(),
-                "growth_rate": get_chartjs_growth_rate_config(),
-                "closing_rate": get_chartjs_closing_rate_config(),
-                "opening_closing_rate": get_chartjs_opening_closing_rate_config(),
-                "net_growth_rate": get_chartjs_net_growth_rate_config(),
-            }
+        if data_type in DATASET_VERSIONS:
+            return get_dataset(data_type)
+        return {data_response_key(name): get_dataset(name) for name in DATASET_NAMES}
 
 
-@data_ns.route("/")
-class ChartData(Resource):
-    @api.doc("get_chart_data")
-    @api.param(
-        "type",
-        "데이터 타입 (line, bar, pie, area_population, age_gender, "
-        "time_period, yearly_trend, growth_rate, closing_rate, "
-        "opening_closing_rate, net_growth_rate, all)",
-        enum=[
-            "line",
-            "bar",
-            "pie",
-            "area_population",
-            "age_gender",
-            "time_period",
-            "yearly_trend",
-            "growth_rate",
-            "closing_rate",
-            "opening_closing_rate",
-            "net_growth_rate",
-            "all",
-        ],
-    )
-    @api.response(200, "Success")
-    def get(self):
-        """원본 차트 데이터 반환"""
-        data_type = request.args.get("type", "all")
+def render_specific_chart(library, chart_type):
+    """요청 옵션을 적용해 특정 라이브러리의 특정 차트 사양을 생성합니다."""
+    entry = resolve_chart(library, chart_type)
+    options = chart_options()
 
-        if data_type == "line":
-            return LINE_CHART_DATA
-        elif data_type == "bar":
-            return BAR_CHART_DATA
-        elif data_type == "pie":
-            return GENDER_PIE_DATA
-        elif data_type == "area_population":
-            return AREA_POPULATION_DATA
-        elif data_type == "age_gender":
-            return AGE_GENDER_DATA
-        elif data_type == "time_period":
-            return TIME_PERIOD_DATA
-        elif data_type == "yearly_trend":
-            return YEARLY_TREND_DATA
-        elif data_type == "growth_rate":
-            return GROWTH_RATE_DATA
-        elif data_type == "closing_rate":
-            return CLOSING_RATE_DATA
-        elif data_type == "opening_closing_rate":
-            return OPENING_CLOSING_RATE_DATA
-        elif data_type == "net_growth_rate":
-            return NET_GROWTH_RATE_DATA
-        else:
-            return {
-                "line_chart_data": LINE_CHART_DATA,
-                "bar_chart_data": BAR_CHART_DATA,
-                "pie_chart_data": GENDER_PIE_DATA,
-                "area_population_data": AREA_POPULATION_DATA,
-                "age_gender_data": AGE_GENDER_DATA,
-                "time_period_data": TIME_PERIOD_DATA,
-                "yearly_trend_data": YEARLY_TREND_DATA,
-                "growth_rate_data": GROWTH_RATE_DATA,
-                "closing_rate_data": CLOSING_RATE_DATA,
-                "opening_closing_rate_data": OPENING_CLOSING_RATE_DATA,
-                "net_growth_rate_data": NET_GROWTH_RATE_DATA,
-            }
+    try:
+        return build_chart(entry, options)
+    except Exception as e:
+        api.abort(500, f"차트 사양 생성 실패: {str(e)}")
 
 
 @charts_ns.route("/<library>/<chart_type>")
-class SpecificChart(Resource):
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+@api.param("max_points", MAX_POINTS_PARAM_DESCRIPTION, type=int)
+@api.param("top", TOP_PARAM_DESCRIPTION, type=int)
+class SpecificChart(ProjectableResource):
     @api.doc("get_specific_chart")
-    @api.param(
-        "library", "차트 라이브러리", enum=["vega_lite", "echarts", "plotly", "chartjs"]
-    )
-    @api.param(
-        "chart_type",
-        "차트 타입",
-        enum=[
-            "line",
-            "bar",
-            "pie",
-            "area_population",
-            "age_gender",
-            "time_period",
-            "yearly_trend",
-            "growth_rate",
-            "closing_rate",
-            "opening_closing_rate",
-            "net_growth_rate",
-        ],
-    )
+    @api.param("library", "차트 라이브러리", enum=LIBRARY_ENUM)
+    @api.param("chart_type", "차트 타입", enum=CHART_TYPE_ENUM)
     @api.response(200, "Success")
     @api.response(400, "Bad Request", error_model)
     @api.response(500, "Internal Server Error", error_model)
     def get(self, library, chart_type):
         """특정 라이브러리의 특정 차트 타입 사양 반환"""
 
-        chart_functions = {
-            "vega_lite": {
-                "line": get_vega_lite_line_chart_spec,
-                "bar": get_vega_lite_bar_chart_spec,
-                "pie": get_vega_lite_pie_chart_spec,
-            },
-            "echarts": {
-                "line": get_echarts_line_chart_option,
-                "bar": get_echarts_bar_chart_option,
-                "pie": get_echarts_pie_chart_option,
-            },
-            "plotly": {
-                "line": get_plotly_line_chart_figure,
-                "bar": get_plotly_bar_chart_figure,
-                "pie": get_plotly_pie_chart_figure,
-            },
-            "chartjs": {
-                "line": get_chartjs_line_chart_config,
-                "bar": get_chartjs_bar_chart_config,
-                "pie": get_chartjs_pie_chart_config,
-                "area_population": get_chartjs_area_population_config,
-                "age_gender": get_chartjs_age_gender_config,
-                "time_period": get_chartjs_time_period_config,
-                "yearly_trend": get_chartjs_yearly_trend_config,
-                "growth_rate": get_chartjs_growth_rate_config,
-                "closing_rate": get_chartjs_closing_rate_config,
-                "opening_closing_rate": get_chartjs_opening_closing_rate_config,
-                "net_growth_rate": get_chartjs_net_growth_rate_config,
-            },
-        }
+        return render_specific_chart(library, chart_type)
 
-        if library not in chart_functions:
-            api.abort(400, f"지원하지 않는 라이브러리: {library}")
 
-        if chart_type not in chart_functions[library]:
-            api.abort(400, f"지원하지 않는 차트 타입: {chart_type}")
+@charts_ns.route("/<library>/<chart_type>/data")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+@api.param("max_points", MAX_POINTS_PARAM_DESCRIPTION, type=int)
+@api.param("top", TOP_PARAM_DESCRIPTION, type=int)
+class SpecificChartData(ProjectableResource):
+    @api.doc("get_specific_chart_data")
+    @api.response(200, "Success")
+    @api.response(400, "Bad Request", error_model)
+    def get(self, library, chart_type):
+        """차트 사양의 데이터 부분과 스타일 리소스 URL 반환 (짧은 캐시 수명)"""
+        entry = resolve_chart(library, chart_type)
+        style, data = split_chart_spec(library, build_chart(entry, chart_options()))
+        style_hash = content_hash(style)
+
+        return (
+            {
+                "style_url": chart_style_path(library, chart_type, style_hash),
+                "style_hash": style_hash,
+                "data": data,
+            },
+            200,
+            {"Cache-Control": f"public, max-age={DATA_CACHE_MAX_AGE}"},
+        )
 
-        try:
-            chart_spec = chart_functions[library][chart_type]()
-            return chart_spec
-        except Exception as e:
-            api.abort(500, f"차트 사양 생성 실패: {str(e)}")
+
+@charts_ns.route("/<library>/<chart_type>/style/<style_hash>")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+class SpecificChartStyle(ProjectableResource):
+    @api.doc("get_specific_chart_style")
+    @api.response(200, "Success")
+    @api.response(404, "Not Found", error_model)
+    def get(self, library, chart_type, style_hash):
+        """차트 사양의 스타일 부분 반환 (내용 해시 URL, immutable 캐시)"""
+        entry = resolve_chart(library, chart_type)
+        style, _ = split_chart_spec(library, build_chart(entry, {}))
+        if content_hash(style) != style_hash:
+            api.abort(404, f"존재하지 않는 스타일 버전: {style_hash}")
+
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": f'"{style_hash}"'}
+        # 압축 응답의 ETag는 약한 ETag가 되므로 약한 비교로 확인
+        if request.if_none_match.contains_weak(style_hash):
+            return app.response_class(status=304, headers=headers)
+        return style, 200, headers
+
+
+def redirect_to_current_version(url):
+    """이전 데이터 버전 URL 요청을 현재 버전 URL로 보냅니다 (캐시 금지)."""
+    return None, 302, {"Location": url, "Cache-Control": "no-store"}
+
+
+@versioned_ns.route("/<version>/charts/<library>/<chart_type>")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+@api.param("max_points", MAX_POINTS_PARAM_DESCRIPTION, type=int)
+@api.param("top", TOP_PARAM_DESCRIPTION, type=int)
+class VersionedChart(ProjectableResource):
+    @api.doc("get_versioned_chart")
+    @api.response(200, "Success")
+    @api.response(302, "현재 데이터 버전 URL로 이동")
+    @api.response(400, "Bad Request", error_model)
+    def get(self, version, library, chart_type):
+        """데이터/코드 버전이 포함된 불변 URL로 특정 차트 사양 반환"""
+        entry = resolve_chart(library, chart_type)
+        if version != chart_url_version(entry):
+            return redirect_to_current_version(versioned_chart_path(entry))
+
+        return (
+            render_specific_chart(library, chart_type),
+            200,
+            {"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+        )
+
+
+@versioned_ns.route("/<version>/data/<data_type>")
+@api.param("fields", FIELDS_PARAM_DESCRIPTION)
+class VersionedData(ProjectableResource):
+    @api.doc("get_versioned_data")
+    @api.response(200, "Success")
+    @api.response(302, "현재 데이터 버전 URL로 이동")
+    @api.response(400, "Bad Request", error_model)
+    def get(self, version, data_type):
+        """데이터/코드 버전이 포함된 불변 URL로 원본 데이터 반환"""
+        if data_type not in DATASET_VERSIONS:
+            api.abort(400, f"지원하지 않는 데이터 타입: {data_type}")
+        if version != data_url_version(data_type):
+            return redirect_to_current_version(versioned_data_path(data_type))
+
+        return get_dataset(data_type), 200, {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+
+
+@app.route("/api/manifest")
+def manifest():
+    """차트/데이터 이름별 현재 버전 URL 목록 (캐시 금지)"""
+    response = jsonify(build_manifest())
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+# SSE 연결 유지용 주석 전송 간격(초)과 구독자별 대기 이벤트 수 상한
+SSE_KEEPALIVE_SECONDS = int(os.environ.get("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_QUEUE_SIZE = 16
+
+# gthread 워커에서는 SSE 연결 하나가 요청 스레드 하나를 계속 차지하므로, 일반 요청을
+# 처리할 스레드가 남도록 워커별 SSE 연결 수를 제한 (0이면 제한 없음, 초과 시 503)
+SSE_MAX_CONNECTIONS = int(os.environ.get("SSE_MAX_CONNECTIONS", "2"))
+SSE_RETRY_AFTER = int(os.environ.get("SSE_RETRY_AFTER", "30"))
+SSE_CONNECTIONS = ConcurrencyLimiter(SSE_MAX_CONNECTIONS)
+
+
+@app.route("/api/events")
+def data_events():
+    """
+    데이터 재로드 이벤트를 SSE로 전송합니다.
+
+    연결 직후 versions 이벤트로 현재 버전 전체를 보내고, 이후 데이터가 바뀔 때마다
+    reload 이벤트(바뀐 데이터셋, 새 버전, 영향받는 차트)를 보냅니다.
+    Last-Event-ID(데이터 버전)로 재연결하면 그 사이에 빠진 이벤트를 다시 보내고,
+    이 워커가 모르는 ID이면 versions 이벤트로 현재 버전 전체를 보냅니다.
+    워커의 SSE 연결 수가 가득 차면 Retry-After와 함께 503으로 거절합니다.
+    """
+    if not SSE_CONNECTIONS.try_acquire():
+        return rejection_response(
+            Rejection(
+                503,
+                "이벤트 스트림 연결 수가 가득 찼습니다. 잠시 후 다시 시도하세요",
+                SSE_RETRY_AFTER,
+            )
+        )
+
+    last_event_id = request.headers.get("Last-Event-ID")
+    events = queue.Queue(maxsize=SSE_QUEUE_SIZE)
+    # 대기열이 가득 찬 느린 구독자는 구독이 해제되고, 재연결 시 빠진 이벤트를 받음
+    token, missed = subscribe_data_events(events.put_nowait, last_event_id)
+
+    def generate():
+        last_sent = last_event_id
+        for event in missed:
+            last_sent = event.id
+            yield format_sse(event)
+
+        while DATA_EVENTS.is_subscribed(token):
+            try:
+                event = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield b": keepalive\n\n"
+                continue
+            # 클라이언트가 이미 받은 데이터 버전의 이벤트는 다시 보내지 않음
+            if event.id != last_sent:
+                last_sent = event.id
+                yield format_sse(event)
+
+    def close():
+        # 본문 전송을 시작하기 전에 연결이 끊겨도 서버가 응답을 닫을 때 호출됨
+        DATA_EVENTS.unsubscribe(token)
+        SSE_CONNECTIONS.release()
+
+    response = app.response_class(generate(), mimetype="text/event-stream")
+    response.call_on_close(close)
+    response.headers["Cache-Control"] = "no-store"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@lru_cache(maxsize=1)
+def swagger_document():
+    """
+    Swagger 명세를 처음 요청될 때 한 번만 만들어 인코딩한 바이트로 보관합니다.
+
+    라우트는 import 시점에 모두 등록되므로 프로세스 안에서 명세가 바뀌지 않습니다.
+    생성에 실패하면 캐시하지 않고 다음 요청에서 다시 시도합니다.
+    """
+    schema = api.__schema__
+    if "error" in schema:
+        raise RuntimeError(schema["error"])
+    return PrecompressedBody(json_dumps(schema))
+
+
+def swagger_json():
+    """캐시된 Swagger 명세를 ETag, 압축과 함께 반환합니다 (flask-restx specs 뷰 대체)."""
+    try:
+        document = swagger_document()
+    except RuntimeError as e:
+        return error_response(500, str(e))
+
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    response = app.response_class(document.get(encoding), mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    if encoding is None:
+        response.set_etag(document.etag)
+    else:
+        response.headers["Content-Encoding"] = encoding
+        response.set_etag(f"{document.etag}-{encoding}")
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+app.view_functions[api.endpoint("specs")] = swagger_json
 
 
 @app.route("/health")
@@ -425,6 +800,33 @@ def health_check():
     return jsonify({"status": "healthy", "service": "chart-api-server"})
 
 
+@app.route("/metrics")
+def metrics():
+    """Prometheus 메트릭 (멀티프로세스 모드에서는 모든 워커의 합계)"""
+    body, content_type = render_metrics()
+    if body is None:
+        return error_response(501, "prometheus_client가 설치되어 있지 않습니다")
+    response = app.response_class(body, content_type=content_type)
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@app.route("/health/live")
+def liveness_check():
+    """프로세스가 요청에 응답할 수 있는지 확인하는 엔드포인트 (재시작 판단용)"""
+    return jsonify({"status": "alive", "service": "chart-api-server"})
+
+
+@app.route("/health/ready")
+def readiness_check():
+    """데이터셋 로드와 차트 사양 캐시 예열이 끝났는지 확인하는 엔드포인트 (트래픽 투입 판단용)"""
+    ready, details = readiness()
+    response = jsonify(details)
+    response.status_code = 200 if ready else 503
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
 @app.route("/redoc")
 def redoc():
     """ReDoc API 문서"""
@@ -470,8 +872,13 @@ if __name__ == "__main__":
     print("  - GET /api/charts/{library} : 특정 라이브러리의 차트 사양")
     print("  - GET /api/charts/{library}/{type} : 특정 차트 사양")
     print("  - GET /api/data : 원본 데이터")
-    print("  - GET /health : 헬스 체크")
+    print("  - GET /api/events : 데이터 재로드 이벤트 (SSE)")
+    print("  - GET /health : 헬스 체크 (/health/live, /health/ready)")
     print(f"\n🌐 서버가 http://{args.host}:{args.port} 에서 실행됩니다.")
 
+    if DATA_WATCH_INTERVAL > 0:
+        start_data_watcher(DATA_WATCH_INTERVAL)
+    warm_up_spec_cache()
+
     app.run(debug=args.debug, host=args.host, port=args.port)
 # 테스트 주석 추가
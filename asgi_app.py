@@ -0,0 +1,740 @@
+#!/usr/bin/env python3
+"""
+가맹점수 분석 차트 API 서버 (ASGI 버전)
+app.py와 같은 차트/데이터 경로를 Starlette로 제공합니다.
+
+느린 클라이언트가 많아도 연결마다 스레드를 점유하지 않도록 요청은 이벤트 루프에서
+처리하고, 캐시되지 않은 차트 사양 생성이나 압축 같은 블로킹 작업만 크기가 제한된
+스레드 풀로 넘깁니다. 차트 레지스트리와 데이터셋은 chart_specs를 그대로 공유합니다.
+
+    uvicorn asgi_app:app --host 0.0.0.0 --port 5001
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+from starlette.applications import Starlette
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Match, Route
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import http_date, parse_accept_header, parse_date, parse_etags
+
+import server_timing
+from chart_registry import CHART_REGISTRY
+from chart_resources import (
+    DATA_CACHE_MAX_AGE,
+    IMMUTABLE_CACHE_CONTROL,
+    build_manifest,
+    chart_style_path,
+    chart_url_version,
+    data_url_version,
+    last_modified,
+    request_datasets,
+    split_chart_spec,
+    versioned_chart_path,
+    versioned_data_path,
+)
+from chart_specs import (
+    DATA_WATCH_INTERVAL,
+    DATASET_NAMES,
+    DATASET_VERSIONS,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    PAGINATED_DATASETS,
+    data_response_key,
+    get_data_version,
+    get_dataset,
+    get_datasets_version,
+    get_rows_page,
+    readiness,
+    start_data_watcher,
+    warm_up_spec_cache,
+)
+from compression import MIN_COMPRESS_SIZE, SUPPORTED_ENCODINGS, CompressedVariantCache
+from event_broker import DATA_EVENTS, format_sse, subscribe_data_events
+from json_encoder import dumps as json_dumps
+from metrics import observe_request, register_cache_stats, render_metrics
+from rate_limit import AccessController
+from response_utils import (
+    content_hash,
+    decode_cursor,
+    encode_cursor,
+    parse_field_paths,
+    project_fields,
+)
+
+# 블로킹 작업용 스레드 수와, 스레드 풀에 동시에 넘길 수 있는 작업 수 상한
+# (상한을 넘는 요청은 스레드 풀 대기열이 아니라 이벤트 루프에서 대기)
+EXECUTOR_WORKERS = int(os.environ.get("ASGI_EXECUTOR_WORKERS", "4"))
+EXECUTOR_MAX_PENDING = int(os.environ.get("ASGI_EXECUTOR_MAX_PENDING", "64"))
+
+COMPRESSED_RESPONSES = CompressedVariantCache(
+    maxsize=int(os.environ.get("COMPRESSION_CACHE_SIZE", "256"))
+)
+register_cache_stats(
+    lambda: {"compression": (COMPRESSED_RESPONSES.hits, COMPRESSED_RESPONSES.misses)}
+)
+
+LIBRARY_ENUM = CHART_REGISTRY.libraries()
+
+
+class FastJSONResponse(JSONResponse):
+    """app.py와 같은 인코더(orjson)로 직렬화하는 JSON 응답"""
+
+    def render(self, content):
+        with server_timing.stage("encode"):
+            return json_dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """이벤트 루프 시작 시 스레드 풀을 만들고, 종료 시 정리합니다."""
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=EXECUTOR_WORKERS, thread_name_prefix="chart-api"
+    )
+    app.state.executor_slots = asyncio.Semaphore(EXECUTOR_MAX_PENDING)
+    if DATA_WATCH_INTERVAL > 0:
+        start_data_watcher(DATA_WATCH_INTERVAL)
+    # 예열은 스레드 풀에서 실행해 그동안에도 /health/live에 응답
+    asyncio.get_running_loop().run_in_executor(app.state.executor, warm_up_spec_cache)
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_blocking(request, func, *args):
+    """블로킹 함수를 스레드 풀에서 실행하고 결과를 기다립니다."""
+    state = request.app.state
+    async with state.executor_slots:
+        loop = asyncio.get_running_loop()
+        # 스레드 풀에서도 요청의 Server-Timing 기록이 이어지도록 컨텍스트를 전달
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            state.executor, partial(context.run, func, *args)
+        )
+
+
+def query_int(request, name, default=None):
+    """정수 쿼리 파라미터 (형식이 틀리면 기본값, Flask의 type=int와 동일)"""
+    try:
+        return int(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def chart_options(request):
+    """요청 쿼리 파라미터에서 차트 빌더 옵션을 읽습니다."""
+    max_points = query_int(request, "max_points")
+    if max_points is not None and max_points < 2:
+        raise HTTPException(400, "max_points는 2 이상이어야 합니다")
+
+    top = query_int(request, "top")
+    if top is not None and top < 1:
+        raise HTTPException(400, "top은 1 이상이어야 합니다")
+
+    return {"max_points": max_points, "top": top}
+
+
+async def build_chart(request, entry, options):
+    """캐시된 사양은 바로 반환하고, 없을 때만 스레드 풀에서 생성합니다."""
+    data_version = get_datasets_version(entry.datasets)
+    spec = CHART_REGISTRY.get_cached(entry, options, data_version)
+    if spec is None:
+        spec = await run_blocking(
+            request, CHART_REGISTRY.build, entry, options, data_version
+        )
+    return spec
+
+
+async def build_library_charts(request, library, options):
+    """라이브러리의 모든 차트 사양을 {응답 키: 사양} 형태로 생성합니다."""
+    entries = CHART_REGISTRY.entries(library)
+    specs = await asyncio.gather(
+        *(build_chart(request, entry, options) for entry in entries)
+    )
+    return {entry.response_key: spec for entry, spec in zip(entries, specs)}
+
+
+async def json_response(request, payload, status_code=200, headers=None):
+    """?fields= 필드 선택과 응답 압축을 적용한 JSON 응답을 만듭니다."""
+    fields_param = request.query_params.get("fields")
+    if fields_param:
+        payload = project_fields(payload, parse_field_paths(fields_param))
+
+    server_timing.record("dispatch")
+    response = FastJSONResponse(payload, status_code=status_code, headers=headers)
+    if status_code != 200:
+        return response
+
+    response.headers.add_vary_header("Accept-Encoding")
+    if len(response.body) < MIN_COMPRESS_SIZE:
+        return response
+
+    accept_encoding = parse_accept_header(request.headers.get("accept-encoding"))
+    encoding = accept_encoding.best_match(SUPPORTED_ENCODINGS)
+    if encoding is None:
+        return response
+
+    cache_key = (f"{request.url.path}?{request.url.query}", get_data_version())
+    with server_timing.stage("compress"):
+        response.body = await run_blocking(
+            request,
+            COMPRESSED_RESPONSES.get_or_compress,
+            cache_key,
+            encoding,
+            response.body,
+        )
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Content-Length"] = str(len(response.body))
+
+    # 인코딩별로 바이트가 다르므로 강한 ETag는 약한 ETag로 변경
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        response.headers["ETag"] = f"W/{etag}"
+    return response
+
+
+ACCESS_CONTROL = AccessController.from_env()
+
+
+class AccessControlMiddleware:
+    """API 키와 요청 한도를 확인하고, 서버가 포화 상태면 바로 429/503으로 거절합니다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not ACCESS_CONTROL.applies_to(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        rejection = ACCESS_CONTROL.check(
+            Headers(scope=scope).get("x-api-key"), client[0] if client else None
+        )
+        holds_slot = rejection is None and ACCESS_CONTROL.holds_slot(scope["path"])
+        if holds_slot:
+            rejection = ACCESS_CONTROL.acquire()
+        if rejection is not None:
+            headers = None
+            if rejection.retry_after is not None:
+                headers = {"Retry-After": str(rejection.retry_after)}
+            response = FastJSONResponse(
+                {"message": rejection.message}, rejection.status, headers
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if holds_slot:
+                ACCESS_CONTROL.release()
+
+
+def match_route(scope):
+    """요청이 일치하는 (라우트, 경로 변수) (없으면 (None, {}))"""
+    for route in app.routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            return route, child_scope.get("path_params", {})
+    return None, {}
+
+
+def route_template(scope):
+    """요청이 일치하는 라우트 경로 템플릿 (예: /api/charts/{library}, 없으면 None)"""
+    route, _ = match_route(scope)
+    return route.path if route is not None else None
+
+
+class ConditionalRequestMiddleware:
+    """
+    데이터셋 기반 응답에 Last-Modified를 붙이고, 데이터셋 로드 시각 기준으로
+    If-Modified-Since 요청에는 차트 사양을 만들지 않고 바로 304를 응답합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        _, path_params = match_route(scope)
+        datasets = request_datasets(
+            scope["path"], path_params, request.query_params.get("type", "all")
+        )
+        if not datasets:
+            await self.app(scope, receive, send)
+            return
+
+        modified_at = last_modified(datasets)
+        # If-None-Match가 있으면 ETag 검증이 우선 (RFC 9110)
+        if_modified_since = parse_date(request.headers.get("if-modified-since"))
+        if (
+            if_modified_since is not None
+            and "if-none-match" not in request.headers
+            and modified_at <= if_modified_since.timestamp()
+        ):
+            response = Response(
+                status_code=304, headers={"Last-Modified": http_date(modified_at)}
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_last_modified(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                if "last-modified" not in headers:
+                    headers["Last-Modified"] = http_date(modified_at)
+            await send(message)
+
+        await self.app(scope, receive, send_with_last_modified)
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수, 처리 시간, 응답 크기를 Prometheus 메트릭으로 기록합니다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            observe_request(
+                scope["method"],
+                route_template(scope),
+                status,
+                time.perf_counter() - started,
+                size,
+            )
+
+
+class ServerTimingMiddleware:
+    """단계별 처리 시간을 기록해 Server-Timing 응답 헤더로 추가합니다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = server_timing.start()
+        if timing is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Server-Timing"] = timing.header_value()
+                headers["Timing-Allow-Origin"] = "*"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            server_timing.stop()
+
+
+async def http_exception_handler(request, exc):
+    """에러 응답 형식을 app.py(flask-restx)와 맞춥니다."""
+    return FastJSONResponse(
+        {"message": exc.detail}, status_code=exc.status_code, headers=exc.headers
+    )
+
+
+async def index(request):
+    """API 루트 엔드포인트"""
+    return FastJSONResponse(
+        {
+            "message": "가맹점수 분석 차트 API 서버 (ASGI)",
+            "version": "1.0.0",
+            "endpoints": {
+                "charts": "/api/charts",
+                "data": "/api/data",
+                "manifest": "/api/manifest",
+                "events": "/api/events",
+                **{library: f"/api/charts/{library}" for library in LIBRARY_ENUM},
+            },
+        }
+    )
+
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request):
+    """?stream=1 또는 Accept 헤더로 NDJSON 스트리밍을 요청했는지 확인합니다."""
+    if request.query_params.get("stream") in ("1", "true"):
+        return True
+    accept = parse_accept_header(request.headers.get("accept"), MIMEAccept)
+    return accept.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def stream_charts(request, entries, options):
+    """차트 사양을 생성(또는 캐시 조회)하는 즉시 한 줄씩 NDJSON으로 내보냅니다."""
+    fields_param = request.query_params.get("fields")
+    paths = parse_field_paths(fields_param) if fields_param else None
+
+    async def generate():
+        for entry in entries:
+            line = {"library": entry.library, "chart_type": entry.chart_type}
+            try:
+                spec = await build_chart(request, entry, options)
+            except Exception as e:
+                line["error"] = f"차트 사양 생성 실패: {str(e)}"
+            else:
+                line["spec"] = project_fields(spec, paths) if paths else spec
+            yield json_dumps(line) + b"\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type=NDJSON_MIMETYPE,
+        headers={"Vary": "Accept", "X-Accel-Buffering": "no"},
+    )
+
+
+async def all_charts(request):
+    """모든 차트 라이브러리의 사양을 반환 (NDJSON 스트리밍 지원)"""
+    options = chart_options(request)
+    if wants_ndjson(request):
+        return stream_charts(request, CHART_REGISTRY.entries(), options)
+
+    libraries = await asyncio.gather(
+        *(build_library_charts(request, library, options) for library in LIBRARY_ENUM)
+    )
+    return await json_response(
+        request,
+        {
+            "message": "모든 차트 사양 조회 성공",
+            "data": dict(zip(LIBRARY_ENUM, libraries)),
+        },
+        headers={"Vary": "Accept"},
+    )
+
+
+async def library_charts(request):
+    """특정 라이브러리의 차트 사양만 반환"""
+    library = request.path_params["library"]
+    if library not in LIBRARY_ENUM:
+        raise HTTPException(404, f"지원하지 않는 라이브러리: {library}")
+
+    options = chart_options(request)
+    entry = CHART_REGISTRY.get(library, request.query_params.get("type", "all"))
+    if entry is not None:
+        payload = await build_chart(request, entry, options)
+    else:
+        payload = await build_library_charts(request, library, options)
+    return await json_response(request, payload)
+
+
+def resolve_chart(request):
+    """경로의 라이브러리/차트 타입에 해당하는 레지스트리 항목을 찾습니다 (없으면 400)."""
+    library = request.path_params["library"]
+    chart_type = request.path_params["chart_type"]
+    entry = CHART_REGISTRY.get(library, chart_type)
+    if entry is None:
+        if library not in LIBRARY_ENUM:
+            raise HTTPException(400, f"지원하지 않는 라이브러리: {library}")
+        raise HTTPException(400, f"지원하지 않는 차트 타입: {chart_type}")
+    return entry
+
+
+async def render_specific_chart(request, entry):
+    """요청 옵션을 적용해 특정 차트 사양을 생성합니다."""
+    options = chart_options(request)
+    try:
+        return await build_chart(request, entry, options)
+    except Exception as e:
+        raise HTTPException(500, f"차트 사양 생성 실패: {str(e)}")
+
+
+async def specific_chart(request):
+    """특정 라이브러리의 특정 차트 타입 사양 반환"""
+    spec = await render_specific_chart(request, resolve_chart(request))
+    return await json_response(request, spec)
+
+
+async def specific_chart_data(request):
+    """차트 사양의 데이터 부분과 스타일 리소스 URL 반환 (짧은 캐시 수명)"""
+    entry = resolve_chart(request)
+    spec = await build_chart(request, entry, chart_options(request))
+    style, data = split_chart_spec(entry.library, spec)
+    style_hash = content_hash(style)
+    return await json_response(
+        request,
+        {
+            "style_url": chart_style_path(entry.library, entry.chart_type, style_hash),
+            "style_hash": style_hash,
+            "data": data,
+        },
+        headers={"Cache-Control": f"public, max-age={DATA_CACHE_MAX_AGE}"},
+    )
+
+
+async def specific_chart_style(request):
+    """차트 사양의 스타일 부분 반환 (내용 해시 URL, immutable 캐시)"""
+    entry = resolve_chart(request)
+    style_hash = request.path_params["style_hash"]
+    style, _ = split_chart_spec(entry.library, await build_chart(request, entry, {}))
+    if content_hash(style) != style_hash:
+        raise HTTPException(404, f"존재하지 않는 스타일 버전: {style_hash}")
+
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": f'"{style_hash}"'}
+    # 압축 응답의 ETag는 약한 ETag가 되므로 약한 비교로 확인
+    if parse_etags(request.headers.get("if-none-match")).contains_weak(style_hash):
+        return Response(status_code=304, headers=headers)
+    return await json_response(request, style, headers=headers)
+
+
+def redirect_to_current_version(url):
+    """이전 버전 URL 요청을 현재 버전 URL로 보냅니다 (캐시 금지)."""
+    return Response(
+        status_code=302, headers={"Location": url, "Cache-Control": "no-store"}
+    )
+
+
+async def versioned_chart(request):
+    """데이터/코드 버전이 포함된 불변 URL로 특정 차트 사양 반환"""
+    entry = resolve_chart(request)
+    if request.path_params["version"] != chart_url_version(entry):
+        return redirect_to_current_version(versioned_chart_path(entry))
+
+    spec = await render_specific_chart(request, entry)
+    return await json_response(
+        request, spec, headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    )
+
+
+async def versioned_data(request):
+    """데이터/코드 버전이 포함된 불변 URL로 원본 데이터 반환"""
+    data_type = request.path_params["data_type"]
+    if data_type not in DATASET_VERSIONS:
+        raise HTTPException(400, f"지원하지 않는 데이터 타입: {data_type}")
+    if request.path_params["version"] != data_url_version(data_type):
+        return redirect_to_current_version(versioned_data_path(data_type))
+
+    return await json_response(
+        request,
+        get_dataset(data_type),
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
+
+
+async def manifest(request):
+    """차트/데이터 이름별 현재 버전 URL 목록 (캐시 금지)"""
+    return FastJSONResponse(build_manifest(), headers={"Cache-Control": "no-store"})
+
+
+async def paginate_dataset(request, data_type):
+    """목록형 데이터셋을 limit/cursor 기준으로 한 페이지만 잘라 반환합니다."""
+    if data_type not in PAGINATED_DATASETS:
+        raise HTTPException(
+            400,
+            f"페이지네이션을 지원하지 않는 데이터 타입: {data_type} "
+            f"(지원: {', '.join(PAGINATED_DATASETS)})",
+        )
+
+    limit = query_int(request, "limit", DEFAULT_PAGE_LIMIT)
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise HTTPException(400, f"limit은 1 이상 {MAX_PAGE_LIMIT} 이하여야 합니다")
+
+    version = DATASET_VERSIONS[data_type]
+    offset = 0
+    cursor = request.query_params.get("cursor")
+    if cursor:
+        try:
+            cursor_version, offset = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+        if cursor_version != version:
+            raise HTTPException(400, "데이터가 갱신되어 커서가 만료되었습니다. 처음부터 다시 요청하세요")
+
+    # 첫 요청은 행 정렬이 필요하므로 스레드 풀에서 실행
+    items, total = await run_blocking(request, get_rows_page, data_type, offset, limit)
+    next_offset = offset + len(items)
+    return {
+        "type": data_type,
+        "items": items,
+        "limit": limit,
+        "total": total,
+        "next_cursor": encode_cursor(version, next_offset)
+        if next_offset < total
+        else None,
+    }
+
+
+async def chart_data(request):
+    """원본 차트 데이터 반환 (limit/cursor 지정 시 목록형 데이터를 페이지 단위로 반환)"""
+    data_type = request.query_params.get("type", "all")
+
+    if "limit" in request.query_params or "cursor" in request.query_params:
+        payload = await paginate_dataset(request, data_type)
+    elif data_type in DATASET_VERSIONS:
+        payload = get_dataset(data_type)
+    else:
+        payload = {data_response_key(name): get_dataset(name) for name in DATASET_NAMES}
+    return await json_response(request, payload)
+
+
+SSE_KEEPALIVE_SECONDS = int(os.environ.get("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_QUEUE_SIZE = 16
+
+
+async def data_events(request):
+    """데이터 재로드 이벤트를 SSE로 전송합니다 (app.py의 /api/events와 동일)."""
+    last_event_id = request.headers.get("last-event-id")
+
+    # 이벤트는 재로드한 스레드에서 발행되므로 asyncio.Queue는 이벤트 루프에서만 다룸
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+
+    def enqueue(event):
+        try:
+            events.put_nowait(event)
+        except asyncio.QueueFull:
+            # 대기열이 가득 찬 느린 구독자는 구독을 해제하고, 재연결 시 빠진 이벤트를 받음
+            DATA_EVENTS.unsubscribe(token)
+
+    def deliver(event):
+        loop.call_soon_threadsafe(enqueue, event)
+
+    token, missed = subscribe_data_events(deliver, last_event_id)
+
+    async def generate():
+        try:
+            last_sent = last_event_id
+            for event in missed:
+                last_sent = event.id
+                yield format_sse(event)
+
+            while DATA_EVENTS.is_subscribed(token):
+                try:
+                    event = await asyncio.wait_for(
+                        events.get(), timeout=SSE_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if event.id != last_sent:
+                    last_sent = event.id
+                    yield format_sse(event)
+        finally:
+            DATA_EVENTS.unsubscribe(token)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+async def health_check(request):
+    """헬스 체크 엔드포인트"""
+    return FastJSONResponse({"status": "healthy", "service": "chart-api-server"})
+
+
+async def metrics(request):
+    """Prometheus 메트릭 (멀티프로세스 모드에서는 모든 워커의 합계)"""
+    body, content_type = render_metrics()
+    if body is None:
+        raise HTTPException(501, "prometheus_client가 설치되어 있지 않습니다")
+    return Response(
+        body, headers={"Content-Type": content_type, "Cache-Control": "no-store"}
+    )
+
+
+async def liveness_check(request):
+    """프로세스가 요청에 응답할 수 있는지 확인하는 엔드포인트"""
+    return FastJSONResponse({"status": "alive", "service": "chart-api-server"})
+
+
+async def readiness_check(request):
+    """데이터셋 로드와 차트 사양 캐시 예열이 끝났는지 확인하는 엔드포인트"""
+    ready, details = readiness()
+    return FastJSONResponse(
+        details,
+        status_code=200 if ready else 503,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+app = Starlette(
+    routes=[
+        Route("/", index),
+        Route("/health", health_check),
+        Route("/metrics", metrics),
+        Route("/health/live", liveness_check),
+        Route("/health/ready", readiness_check),
+        Route("/api/charts/", all_charts),
+        Route("/api/charts/{library}", library_charts),
+        Route("/api/charts/{library}/{chart_type}", specific_chart),
+        Route("/api/charts/{library}/{chart_type}/data", specific_chart_data),
+        Route(
+            "/api/charts/{library}/{chart_type}/style/{style_hash}",
+            specific_chart_style,
+        ),
+        Route("/api/data/", chart_data),
+        Route("/api/v/{version}/charts/{library}/{chart_type}", versioned_chart),
+        Route("/api/v/{version}/data/{data_type}", versioned_data),
+        Route("/api/manifest", manifest),
+        Route("/api/events", data_events),
+    ],
+    middleware=[
+        Middleware(MetricsMiddleware),
+        Middleware(ServerTimingMiddleware),
+        Middleware(CORSMiddleware, allow_origins=["*"]),
+        Middleware(AccessControlMiddleware),
+        Middleware(ConditionalRequestMiddleware),
+    ],
+    exception_handlers={HTTPException: http_exception_handler},
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="가맹점수 분석 차트 API 서버 (ASGI)")
+    parser.add_argument("--host", default="0.0.0.0", help="호스트 주소 (기본값: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=5001, help="포트 번호 (기본값: 5001)")
+    parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수 (기본값: 1)")
+
+    args = parser.parse_args()
+
+    uvicorn.run("asgi_app:app", host=args.host, port=args.port, workers=args.workers)
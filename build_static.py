@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+정적 차트 사양 빌드
+등록된 모든 (라이브러리, 차트 타입) 사양과 원본 데이터를 병렬로 렌더링해
+내용 해시가 들어간 파일 이름의 최소화 JSON과 미리 압축한 .gz/.br 파일,
+그리고 요청 경로별 파일 정보를 담은 manifest.json을 출력 폴더에 씁니다.
+
+이전 manifest와 비교해 의존 데이터셋 버전과 사양 코드가 그대로인 항목은
+다시 렌더링하지 않고, 더 이상 참조되지 않는 이전 파일은 삭제합니다.
+
+사용법:
+    python build_static.py [--output chart_specs_json] [--jobs 4] [--force]
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from chart_registry import CHART_REGISTRY
+from chart_specs import (
+    DATASET_NAMES,
+    DATASET_VERSIONS,
+    data_response_key,
+    get_data_version,
+    get_dataset,
+    get_datasets_version,
+    spec_code_version,
+)
+from compression import MIN_COMPRESS_SIZE, SUPPORTED_ENCODINGS, compress
+from json_encoder import dumps as json_dumps
+
+DEFAULT_OUTPUT_DIR = "chart_specs_json"
+MANIFEST_NAME = "manifest.json"
+
+# manifest 형식이 바뀌면 올려서 이전 빌드 결과를 모두 다시 렌더링
+MANIFEST_FORMAT = 1
+
+# 압축 파일 확장자
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# 빌드가 만든 파일 이름 (이름.내용해시.json[.gz|.br]) - 정리 대상 판별용
+_OUTPUT_FILE_PATTERN = re.compile(r"\.[0-9a-f]{16}\.json(\.gz|\.br)?$")
+
+
+def build_code_version():
+    """manifest 형식과 사양 생성 코드 버전 (바뀌면 모든 항목을 다시 렌더링)"""
+    return f"{MANIFEST_FORMAT}.{spec_code_version()}"
+
+
+def build_targets():
+    """
+    렌더링할 대상 목록을 반환합니다.
+
+    각 대상은 (manifest 키, 종류, 인자, 의존 데이터셋 이름들)이며,
+    manifest 키는 API 경로에서 /api/ 접두사를 뺀 형태입니다.
+    """
+    targets = [
+        (
+            f"charts/{entry.library}/{entry.chart_type}",
+            "chart",
+            (entry.library, entry.chart_type),
+            entry.datasets,
+        )
+        for entry in CHART_REGISTRY
+    ]
+    for library in CHART_REGISTRY.libraries():
+        datasets = sorted(
+            {
+                name
+                for entry in CHART_REGISTRY.entries(library)
+                for name in entry.datasets
+            }
+        )
+        targets.append((f"charts/{library}", "library", (library,), tuple(datasets)))
+    targets.append(("charts", "all", (), DATASET_NAMES))
+    targets.extend((f"data/{name}", "data", (name,), (name,)) for name in DATASET_NAMES)
+    targets.append(("data", "all_data", (), DATASET_NAMES))
+    return targets
+
+
+def _build_spec(library, chart_type):
+    entry = CHART_REGISTRY.get(library, chart_type)
+    return CHART_REGISTRY.build(entry, {}, get_datasets_version(entry.datasets))
+
+
+def _library_specs(library):
+    return {
+        entry.response_key: _build_spec(entry.library, entry.chart_type)
+        for entry in CHART_REGISTRY.entries(library)
+    }
+
+
+def render_payload(kind, args):
+    """대상 종류에 맞는 응답 본문 객체를 만듭니다 (API 응답과 같은 형태)."""
+    if kind == "chart":
+        return _build_spec(*args)
+    if kind == "library":
+        return _library_specs(*args)
+    if kind == "all":
+        return {
+            "message": "모든 차트 사양 조회 성공",
+            "data": {
+                library: _library_specs(library)
+                for library in CHART_REGISTRY.libraries()
+            },
+        }
+    if kind == "data":
+        return get_dataset(*args)
+    if kind == "all_data":
+        return {data_response_key(name): get_dataset(name) for name in DATASET_NAMES}
+    raise ValueError(f"알 수 없는 대상 종류: {kind}")
+
+
+def _write_atomic(path, body):
+    """임시 파일에 쓴 뒤 이름을 바꿔, 서빙 중에 반쯤 쓴 파일이 보이지 않게 합니다."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+def render_target(output_dir, key, kind, args):
+    """
+    대상 하나를 렌더링해 파일로 쓰고 manifest 항목을 반환합니다.
+
+    파일 이름에 본문 해시가 들어가므로 같은 내용이면 같은 파일을 다시 쓰지 않습니다.
+    """
+    started = time.perf_counter()
+    body = json_dumps(render_payload(kind, args))
+    content_hash = hashlib.sha256(body).hexdigest()[:16]
+    path = f"{key}.{content_hash}.json"
+    full_path = os.path.join(output_dir, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+    if not os.path.exists(full_path):
+        _write_atomic(full_path, body)
+
+    encodings = {}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        for encoding in SUPPORTED_ENCODINGS:
+            encoded_path = path + ENCODING_SUFFIXES[encoding]
+            full_encoded_path = os.path.join(output_dir, encoded_path)
+            if not os.path.exists(full_encoded_path):
+                _write_atomic(full_encoded_path, compress(body, encoding, static=True))
+            encodings[encoding] = {
+                "path": encoded_path,
+                "size": os.path.getsize(full_encoded_path),
+            }
+
+    return {
+        "path": path,
+        "etag": content_hash,
+        "size": len(body),
+        "encodings": encodings,
+        "render_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def load_manifest(output_dir):
+    """이전 빌드의 manifest를 읽습니다 (없거나 읽을 수 없으면 None)."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_fresh(output_dir, item):
+    """이전 항목의 파일이 모두 남아 있는지 확인합니다."""
+    paths = [item["path"]] + [info["path"] for info in item["encodings"].values()]
+    return all(os.path.exists(os.path.join(output_dir, path)) for path in paths)
+
+
+def _remove_stale_files(output_dir, files):
+    """manifest에 없는 이전 빌드 파일을 삭제하고 삭제한 개수를 반환합니다."""
+    keep = set()
+    for item in files.values():
+        keep.add(os.path.normpath(item["path"]))
+        keep.update(
+            os.path.normpath(info["path"]) for info in item["encodings"].values()
+        )
+
+    removed = 0
+    for root, _, names in os.walk(output_dir):
+        for name in names:
+            full_path = os.path.join(root, name)
+            if (
+                _OUTPUT_FILE_PATTERN.search(name)
+                and os.path.relpath(full_path, output_dir) not in keep
+            ):
+                os.remove(full_path)
+                removed += 1
+    return removed
+
+
+def build_static(output_dir=DEFAULT_OUTPUT_DIR, jobs=None, force=False):
+    """
+    정적 파일을 빌드하고 manifest를 씁니다.
+
+    jobs가 1이면 현재 프로세스에서 차례로, 아니면 프로세스 풀에서 병렬로
+    렌더링합니다. 반환값은 (manifest, 렌더링한 수, 건너뛴 수, 삭제한 파일 수)입니다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    code_version = build_code_version()
+    previous = load_manifest(output_dir) or {}
+    previous_files = {}
+    if not force and previous.get("code_version") == code_version:
+        previous_files = previous.get("files", {})
+
+    files = {}
+    pending = []
+    for key, kind, args, datasets in build_targets():
+        data_version = get_datasets_version(datasets)
+        item = previous_files.get(key)
+        if (
+            item is not None
+            and item.get("data_version") == data_version
+            and _is_fresh(output_dir, item)
+        ):
+            files[key] = item
+        else:
+            pending.append((key, kind, args, datasets, data_version))
+
+    def record(target, item):
+        key, _, _, datasets, data_version = target
+        item["datasets"] = list(datasets)
+        item["data_version"] = data_version
+        files[key] = item
+
+    if jobs == 1 or len(pending) <= 1:
+        for target in pending:
+            record(target, render_target(output_dir, *target[:3]))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                (target, executor.submit(render_target, output_dir, *target[:3]))
+                for target in pending
+            ]
+            for target, future in futures:
+                record(target, future.result())
+
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "code_version": code_version,
+        "data_version": get_data_version(),
+        "dataset_versions": dict(DATASET_VERSIONS),
+        "files": dict(sorted(files.items())),
+    }
+    _write_atomic(
+        os.path.join(output_dir, MANIFEST_NAME),
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"),
+    )
+    removed = _remove_stale_files(output_dir, files)
+    return manifest, len(pending), len(files) - len(pending), removed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="차트 사양 정적 파일 빌드")
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"출력 폴더 (기본값: {DEFAULT_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="병렬 렌더링 프로세스 수 (기본값: CPU 수)"
+    )
+    parser.add_argument("--force", action="store_true", help="이전 빌드 결과를 무시하고 모두 다시 렌더링")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest, rendered, skipped, removed = build_static(
+        args.output, args.jobs, args.force
+    )
+    elapsed = time.perf_counter() - started
+
+    print("=== 정적 차트 사양 빌드 완료 ===")
+    print(f"📁 출력 폴더: {args.output}")
+    print(f"🔖 데이터 버전: {manifest['data_version']}")
+    print(f"🛠️  렌더링: {rendered}개, 변경 없음: {skipped}개, 삭제한 이전 파일: {removed}개")
+    print(f"⏱️  소요 시간: {elapsed:.2f}초")
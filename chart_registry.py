@@ -0,0 +1,217 @@
+"""
+차트 레지스트리
+차트 사양 생성 함수를 (라이브러리, 차트 타입)별로 한 번만 등록해 두고,
+API 디스패치, Swagger enum, 전체(all) 응답 구성에 공통으로 사용합니다.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import server_timing
+from single_flight import DEFAULT_TIMEOUT, SingleFlight
+
+# 한 차트의 등록 정보
+# - builder: 차트 사양 생성 함수
+# - datasets: 사양이 의존하는 데이터셋 이름 (캐시 키, Last-Modified 계산용)
+# - cache: 데이터 버전별로 생성 결과를 캐시할지 여부
+# - options: builder가 받는 키워드 옵션 이름 (max_points, top 등)
+# - response_key: 전체(all) 응답에서 사용할 키
+ChartEntry = namedtuple(
+    "ChartEntry",
+    [
+        "library",
+        "chart_type",
+        "builder",
+        "datasets",
+        "cache",
+        "options",
+        "response_key",
+    ],
+)
+
+# 기존 응답 형식과의 호환을 위해 기본 차트는 "<타입>_chart" 키를 사용
+_LEGACY_RESPONSE_KEYS = {"line": "line_chart", "bar": "bar_chart", "pie": "pie_chart"}
+
+
+class ChartRegistry:
+    """(라이브러리, 차트 타입) → ChartEntry 조회와 생성 결과 캐시를 담당합니다."""
+
+    def __init__(self, cache_size=512, flight_timeout=DEFAULT_TIMEOUT):
+        self._entries = {}
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        # 캐시 미스 시 같은 (차트, 옵션, 데이터 버전)의 동시 생성을 하나로 합침
+        self._flights = SingleFlight(timeout=flight_timeout)
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, entry):
+        """차트를 등록합니다. 같은 (라이브러리, 차트 타입)은 중복 등록할 수 없습니다."""
+        key = (entry.library, entry.chart_type)
+        if key in self._entries:
+            raise ValueError(f"이미 등록된 차트: {entry.library}/{entry.chart_type}")
+        self._entries[key] = entry
+
+    def get(self, library, chart_type):
+        """등록된 차트를 반환합니다 (없으면 None)."""
+        return self._entries.get((library, chart_type))
+
+    def entries(self, library=None):
+        """등록 순서대로 차트 목록을 반환합니다."""
+        return [
+            entry
+            for entry in self._entries.values()
+            if library is None or entry.library == library
+        ]
+
+    def libraries(self):
+        """등록된 라이브러리 목록"""
+        return list(dict.fromkeys(library for library, _ in self._entries))
+
+    def chart_types(self, library=None):
+        """등록된 차트 타입 목록 (중복 제거, 등록 순서)"""
+        return list(dict.fromkeys(entry.chart_type for entry in self.entries(library)))
+
+    @staticmethod
+    def _builder_kwargs(entry, options):
+        """옵션 중 builder가 받는 값만 골라냅니다."""
+        return {
+            name: value
+            for name, value in (options or {}).items()
+            if value is not None and name in entry.options
+        }
+
+    @staticmethod
+    def _cache_key(entry, kwargs):
+        """캐시 키: (라이브러리, 차트 타입, 정렬된 옵션)"""
+        return (entry.library, entry.chart_type, tuple(sorted(kwargs.items())))
+
+    def _lookup(self, key, data_version):
+        """캐시에서 같은 데이터 버전의 사양을 찾습니다 (없으면 None)."""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None or cached[0] != data_version:
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+    def _timed_lookup(self, key, data_version):
+        """캐시 조회 시간을 적중/미스별로 Server-Timing에 기록하며 조회합니다."""
+        started = time.perf_counter()
+        cached = self._lookup(key, data_version)
+        server_timing.record(
+            "cache-hit" if cached is not None else "cache-miss", started
+        )
+        return cached
+
+    @staticmethod
+    def _run_builder(entry, kwargs):
+        """차트 사양 생성 함수를 실행합니다 (전체/차트별 생성 시간 기록)."""
+        with server_timing.stage(
+            f"build-{entry.library}-{entry.chart_type}"
+        ), server_timing.stage("build"):
+            return entry.builder(**kwargs)
+
+    def get_cached(self, entry, options=None, data_version=None):
+        """
+        캐시된 사양이 있으면 생성 없이 바로 반환합니다 (없으면 None).
+
+        비동기 서버에서 캐시 적중은 이벤트 루프에서 처리하고,
+        미스일 때만 build를 스레드 풀로 넘기는 데 사용합니다.
+        """
+        if not entry.cache or data_version is None:
+            return None
+        kwargs = self._builder_kwargs(entry, options)
+        key = self._cache_key(entry, kwargs)
+        return self._timed_lookup(key, data_version)
+
+    def build(self, entry, options=None, data_version=None):
+        """
+        옵션 중 builder가 지원하는 것만 전달해 차트 사양을 생성합니다.
+
+        entry.cache가 참이고 data_version이 주어지면 (차트, 옵션, 데이터 버전)별로
+        결과를 캐시합니다. 캐시된 사양은 여러 요청이 공유하므로 수정하면 안 됩니다.
+        캐시 미스일 때 같은 사양을 동시에 요청하면 한 요청만 생성하고 나머지는
+        그 결과를 기다립니다.
+        """
+        kwargs = self._builder_kwargs(entry, options)
+        if not entry.cache or data_version is None:
+            return self._run_builder(entry, kwargs)
+
+        key = self._cache_key(entry, kwargs)
+        cached = self._timed_lookup(key, data_version)
+        if cached is not None:
+            return cached
+
+        return self._flights.do(
+            key + (data_version,),
+            self._build_and_store,
+            entry,
+            kwargs,
+            key,
+            data_version,
+        )
+
+    def _build_and_store(self, entry, kwargs, key, data_version):
+        """사양을 생성해 캐시에 저장합니다."""
+        # 기다리는 사이 다른 요청이 먼저 생성을 마쳤을 수 있음
+        cached = self._lookup(key, data_version)
+        if cached is not None:
+            return cached
+
+        spec = self._run_builder(entry, kwargs)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = (data_version, spec)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return spec
+
+    @property
+    def coalesced(self):
+        """다른 요청의 생성 결과를 기다려 받은 횟수"""
+        return self._flights.coalesced
+
+    def clear_cache(self):
+        """생성 결과 캐시를 비웁니다."""
+        with self._lock:
+            self._cache.clear()
+
+    def __iter__(self):
+        return iter(self.entries())
+
+    def __len__(self):
+        return len(self._entries)
+
+
+CHART_REGISTRY = ChartRegistry()
+
+
+def register_chart(library, chart_type, datasets=None, cache=True):
+    """
+    차트 사양 생성 함수를 레지스트리에 등록하는 데코레이터
+
+    datasets를 생략하면 차트 타입과 같은 이름의 데이터셋에 의존하는 것으로 봅니다.
+    """
+
+    def decorator(builder):
+        CHART_REGISTRY.register(
+            ChartEntry(
+                library=library,
+                chart_type=chart_type,
+                builder=builder,
+                datasets=tuple(datasets) if datasets is not None else (chart_type,),
+                cache=cache,
+                options=frozenset(inspect.signature(builder).parameters),
+                response_key=_LEGACY_RESPONSE_KEYS.get(chart_type, chart_type),
+            )
+        )
+        return builder
+
+    return decorator
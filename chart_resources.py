@@ -0,0 +1,118 @@
+"""
+차트/데이터 리소스 공통 로직
+app.py(Flask)와 asgi_app.py(Starlette)가 같은 URL, 같은 캐시 헤더, 같은
+조건부 요청 처리를 하도록 프레임워크와 무관한 부분을 모아 둡니다.
+
+- 스타일/데이터 분리 리소스 (split_chart_spec, chart_style_path)
+- 데이터/코드 버전이 포함된 불변 URL과 매니페스트 (versioned_*_path, build_manifest)
+- If-Modified-Since 판단용 의존 데이터셋과 Last-Modified (request_datasets, last_modified)
+"""
+
+import os
+
+from chart_registry import CHART_REGISTRY
+from chart_specs import (
+    CHART_DATA_PATHS,
+    DATASET_LOADED_AT,
+    DATASET_NAMES,
+    DATASET_VERSIONS,
+    get_data_version,
+    get_datasets_version,
+    get_url_version,
+    spec_code_version,
+)
+from response_utils import exclude_fields, project_fields
+
+# 조건부 요청(Last-Modified)과 압축 결과 캐시 대상 경로
+CACHEABLE_PATH_PREFIXES = ("/api/charts", "/api/data", "/api/v/")
+
+# 데이터 리소스는 짧게, 내용 해시 URL의 스타일 리소스는 사실상 영구 캐시
+DATA_CACHE_MAX_AGE = int(os.environ.get("DATA_CACHE_MAX_AGE", "60"))
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+VERSIONED_PATH_PREFIX = "/api/v"
+
+
+def split_chart_spec(library, spec):
+    """차트 사양을 (스타일, 데이터) 두 부분으로 나눕니다."""
+    paths = CHART_DATA_PATHS[library]
+    return exclude_fields(spec, paths), project_fields(spec, paths)
+
+
+def chart_style_path(library, chart_type, style_hash):
+    """내용 해시가 포함된 스타일 리소스 경로"""
+    return f"/api/charts/{library}/{chart_type}/style/{style_hash}"
+
+
+def chart_url_version(entry):
+    """차트의 현재 데이터/코드 버전"""
+    return get_url_version(get_datasets_version(entry.datasets))
+
+
+def data_url_version(data_type):
+    """원본 데이터의 현재 데이터/코드 버전"""
+    return get_url_version(DATASET_VERSIONS[data_type])
+
+
+def versioned_chart_path(entry):
+    """차트의 현재 데이터/코드 버전이 포함된 경로"""
+    return (
+        f"{VERSIONED_PATH_PREFIX}/{chart_url_version(entry)}"
+        f"/charts/{entry.library}/{entry.chart_type}"
+    )
+
+
+def versioned_data_path(data_type):
+    """원본 데이터의 현재 데이터/코드 버전이 포함된 경로"""
+    return f"{VERSIONED_PATH_PREFIX}/{data_url_version(data_type)}/data/{data_type}"
+
+
+def build_manifest():
+    """차트/데이터 이름별 현재 버전 경로 목록"""
+    return {
+        "data_version": get_data_version(),
+        "code_version": spec_code_version(),
+        "charts": {
+            f"{entry.library}/{entry.chart_type}": versioned_chart_path(entry)
+            for entry in CHART_REGISTRY
+        },
+        "data": {
+            data_type: versioned_data_path(data_type) for data_type in DATASET_NAMES
+        },
+    }
+
+
+def request_datasets(path, path_params, type_param="all"):
+    """
+    요청이 의존하는 데이터셋 이름 목록 (조건부 요청 대상이 아니면 None)
+
+    path_params는 라우트 경로 변수(library, chart_type, data_type),
+    type_param은 ?type= 쿼리 값입니다.
+    """
+    if not path.startswith(CACHEABLE_PATH_PREFIXES):
+        return None
+
+    if "data_type" in path_params or path.startswith("/api/data"):
+        data_type = path_params.get("data_type") or type_param
+        if data_type in DATASET_VERSIONS:
+            return [data_type]
+        return None if "data_type" in path_params else list(DATASET_NAMES)
+
+    library = path_params.get("library")
+    if library is None:
+        entries = CHART_REGISTRY.entries()
+    elif "chart_type" in path_params:
+        entries = [CHART_REGISTRY.get(library, path_params["chart_type"])]
+    else:
+        entry = CHART_REGISTRY.get(library, type_param)
+        entries = [entry] if entry is not None else CHART_REGISTRY.entries(library)
+
+    datasets = {
+        name for entry in entries if entry is not None for name in entry.datasets
+    }
+    return sorted(datasets) or None
+
+
+def last_modified(datasets):
+    """데이터셋들의 마지막 로드 시각 (HTTP 날짜는 초 단위이므로 버림)"""
+    return int(max(DATASET_LOADED_AT[name] for name in datasets))
@@ -3,9 +3,43 @@
 FE 개발자가 이 사양을 사용하여 차트를 그릴 수 있습니다.
 """
 
+import hashlib
 import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 
-import pandas as pd
+import numpy as np
+
+import csv_tables
+from chart_registry import CHART_REGISTRY, register_chart
+from json_encoder import dumps as json_dumps
+from server_timing import timed
+from single_flight import SingleFlight
+from structured_logging import get_logger
+
+logger = get_logger("loader")
+
+# 실행 중인 로더가 읽은 파일, 행 수, 하드코딩된 데이터로 대체한 이유와 예외
+# (로더를 실행하는 스레드별)
+_load_state = threading.local()
+
+
+def _record_source(*files):
+    """로더가 읽을 CSV 파일 경로를 기록합니다."""
+    _load_state.files = files
+
+
+def _record_rows(rows):
+    """로더가 CSV에서 읽은 행 수를 기록합니다."""
+    _load_state.rows = rows
+
+
+def _record_fallback(reason, error=None):
+    """로더가 CSV 대신 하드코딩된 데이터를 사용한 이유(와 예외)를 기록합니다."""
+    _load_state.fallback_reason = reason
+    _load_state.error = error
 
 
 def load_chart_data():
@@ -15,32 +49,33 @@ def load_chart_data():
     retail_file = "data/지역별_도소매별_가맹점수_현황.csv"
     service_file = "data/지역별_서비스별_가맹점수_현황.csv"
     food_file = "data/지역별_외식별_가맹점수_현황.csv"
+    _record_source(retail_file, service_file, food_file)
 
     # 파일 존재 확인
     if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-        print("⚠️ CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback("file_not_found")
         return get_hardcoded_data()
 
     try:
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 연도별 총 가맹점수 계산 (allFrcsCnt 컬럼 사용)
-        retail_total = retail_df.groupby("yr")["allFrcsCnt"].first()
-        service_total = service_df.groupby("yr")["allFrcsCnt"].first()
-        food_total = food_df.groupby("yr")["allFrcsCnt"].first()
+        retail_total = csv_tables.group_first(retail_rows, "yr", "allFrcsCnt")
+        service_total = csv_tables.group_first(service_rows, "yr", "allFrcsCnt")
+        food_total = csv_tables.group_first(food_rows, "yr", "allFrcsCnt")
 
         # 전체 기간 평균 가맹점수 계산 (frcsCnt 컬럼 사용)
-        retail_avg = retail_df["frcsCnt"].mean()
-        service_avg = service_df["frcsCnt"].mean()
-        food_avg = food_df["frcsCnt"].mean()
+        retail_avg = csv_tables.column_mean(retail_rows, "frcsCnt")
+        service_avg = csv_tables.column_mean(service_rows, "frcsCnt")
+        food_avg = csv_tables.column_mean(food_rows, "frcsCnt")
 
         line_data = {
-            "도소매": retail_total.to_dict(),
-            "서비스": service_total.to_dict(),
-            "외식": food_total.to_dict(),
+            "도소매": retail_total,
+            "서비스": service_total,
+            "외식": food_total,
         }
 
         bar_data = {
@@ -49,11 +84,11 @@ def load_chart_data():
             "외식": round(food_avg),
         }
 
-        print("✅ CSV 파일에서 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return line_data, bar_data
 
     except Exception as e:
-        print(f"⚠️ CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_data()
 
 
@@ -61,13 +96,16 @@ def load_gender_population_data():
     """유동인구 성별 데이터를 로드합니다."""
 
     population_file = "data/pocheon_population_etl_2024_fixed.csv"
+    _record_source(population_file)
 
     if not os.path.exists(population_file):
-        print("⚠️ 유동인구 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback("file_not_found")
         return get_hardcoded_gender_data()
 
     try:
-        # CSV 파일 로드
+        # 시간대별 행이 많은 파일만 pandas로 파싱 (import 비용이 커서 필요할 때 로드)
+        import pandas as pd
+
         df = pd.read_csv(population_file)
 
         # 성별 컬럼 확인
@@ -84,11 +122,11 @@ def load_gender_population_data():
 
         gender_data = {"남성": int(total_male), "여성": int(total_female)}
 
-        print("✅ 유동인구 성별 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(df))
         return gender_data
 
     except Exception as e:
-        print(f"⚠️ 유동인구 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_gender_data()
 
 
@@ -96,13 +134,16 @@ def load_area_population_data():
     """읍면동별 총 유동인구 데이터를 로드합니다."""
 
     population_file = "data/pocheon_population_etl_2024_fixed.csv"
+    _record_source(population_file)
 
     if not os.path.exists(population_file):
-        print("⚠️ 유동인구 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback("file_not_found")
         return get_hardcoded_area_data()
 
     try:
-        # CSV 파일 로드
+        # 시간대별 행이 많은 파일만 pandas로 파싱 (import 비용이 커서 필요할 때 로드)
+        import pandas as pd
+
         df = pd.read_csv(population_file)
 
         # 연령대/성별 컬럼 분리
@@ -122,11 +163,11 @@ def load_area_population_data():
 
         area_data = area_population.to_dict()
 
-        print("✅ 읍면동별 유동인구 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(df))
         return area_data
 
     except Exception as e:
-        print(f"⚠️ 읍면동별 유동인구 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_area_data()
 
 
@@ -134,13 +175,16 @@ def load_age_gender_population_data():
     """연령대별 성별 유동인구 데이터를 로드합니다."""
 
     population_file = "data/pocheon_population_etl_2024_fixed.csv"
+    _record_source(population_file)
 
     if not os.path.exists(population_file):
-        print("⚠️ 유동인구 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback("file_not_found")
         return get_hardcoded_age_gender_data()
 
     try:
-        # CSV 파일 로드
+        # 시간대별 행이 많은 파일만 pandas로 파싱 (import 비용이 커서 필요할 때 로드)
+        import pandas as pd
+
         df = pd.read_csv(population_file)
 
         # 연령대/성별 컬럼 분리
@@ -196,11 +240,11 @@ def load_age_gender_population_data():
             "여성": female_age_data_labeled.to_dict(),
         }
 
-        print("✅ 연령대별 성별 유동인구 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(df))
         return age_gender_data
 
     except Exception as e:
-        print(f"⚠️ 연령대별 성별 유동인구 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_age_gender_data()
 
 
@@ -315,33 +359,34 @@ def load_yearly_trend_data():
         retail_file = "data/지역별_도소매별_가맹점수_현황.csv"
         service_file = "data/지역별_서비스별_가맹점수_현황.csv"
         food_file = "data/지역별_외식별_가맹점수_현황.csv"
+        _record_source(retail_file, service_file, food_file)
 
         # 파일 존재 확인
         if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-            print("⚠️ 연도별 추이 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_yearly_trend_data()
 
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 연도별 총 가맹점수 계산
-        retail_total = retail_df.groupby("yr")["allFrcsCnt"].first()
-        service_total = service_df.groupby("yr")["allFrcsCnt"].first()
-        food_total = food_df.groupby("yr")["allFrcsCnt"].first()
+        retail_total = csv_tables.group_first(retail_rows, "yr", "allFrcsCnt")
+        service_total = csv_tables.group_first(service_rows, "yr", "allFrcsCnt")
+        food_total = csv_tables.group_first(food_rows, "yr", "allFrcsCnt")
 
         yearly_trend_data = {
-            "도소매": retail_total.to_dict(),
-            "서비스": service_total.to_dict(),
-            "외식": food_total.to_dict(),
+            "도소매": retail_total,
+            "서비스": service_total,
+            "외식": food_total,
         }
 
-        print("✅ 연도별 총 가맹점수 추이 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return yearly_trend_data
 
     except Exception as e:
-        print(f"⚠️ 연도별 추이 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_yearly_trend_data()
 
 
@@ -388,38 +433,39 @@ def load_growth_rate_data():
         retail_file = "data/지역별_도소매별_가맹점수_현황.csv"
         service_file = "data/지역별_서비스별_가맹점수_현황.csv"
         food_file = "data/지역별_외식별_가맹점수_현황.csv"
+        _record_source(retail_file, service_file, food_file)
 
         # 파일 존재 확인
         if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-            print("⚠️ 성장률 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_growth_rate_data()
 
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 연도별 총 가맹점수 계산
-        retail_total = retail_df.groupby("yr")["allFrcsCnt"].first()
-        service_total = service_df.groupby("yr")["allFrcsCnt"].first()
-        food_total = food_df.groupby("yr")["allFrcsCnt"].first()
+        retail_total = csv_tables.group_first(retail_rows, "yr", "allFrcsCnt")
+        service_total = csv_tables.group_first(service_rows, "yr", "allFrcsCnt")
+        food_total = csv_tables.group_first(food_rows, "yr", "allFrcsCnt")
 
         # 성장률 계산 (전년 대비)
-        retail_growth = retail_total.pct_change() * 100
-        service_growth = service_total.pct_change() * 100
-        food_growth = food_total.pct_change() * 100
+        retail_growth = csv_tables.pct_change(retail_total)
+        service_growth = csv_tables.pct_change(service_total)
+        food_growth = csv_tables.pct_change(food_total)
 
         growth_rate_data = {
-            "도소매": retail_growth.to_dict(),
-            "서비스": service_growth.to_dict(),
-            "외식": food_growth.to_dict(),
+            "도소매": {yr: rate * 100 for yr, rate in retail_growth.items()},
+            "서비스": {yr: rate * 100 for yr, rate in service_growth.items()},
+            "외식": {yr: rate * 100 for yr, rate in food_growth.items()},
         }
 
-        print("✅ 연도별 성장률 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return growth_rate_data
 
     except Exception as e:
-        print(f"⚠️ 성장률 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_growth_rate_data()
 
 
@@ -464,13 +510,16 @@ def load_time_period_population_data():
     try:
         # CSV 파일 경로
         population_file = "data/pocheon_population_etl_2024_fixed.csv"
+        _record_source(population_file)
 
         # 파일 존재 확인
         if not os.path.exists(population_file):
-            print("⚠️ 시간대별 유동인구 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_time_period_data()
 
-        # CSV 파일 로드
+        # 시간대별 행이 많은 파일만 pandas로 파싱 (import 비용이 커서 필요할 때 로드)
+        import pandas as pd
+
         df = pd.read_csv(population_file)
 
         # 시간대별 그룹핑 (6-9, 9-12, 12-15, 15-18, 18-21, 21-24)
@@ -494,11 +543,11 @@ def load_time_period_population_data():
             total_population = period_data["total_population"].sum()
             time_period_data[period_name] = total_population
 
-        print("✅ 시간대별 유동인구 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(df))
         return time_period_data
 
     except Exception as e:
-        print(f"⚠️ 시간대별 유동인구 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_time_period_data()
 
 
@@ -521,33 +570,34 @@ def load_closing_rate_data():
         retail_file = "data/주요도소매별_가맹점_개폐점현황.csv"
         service_file = "data/주요서비스별_가맹점_개폐점현황.csv"
         food_file = "data/주요외식별_가맹점_개폐점현황.csv"
+        _record_source(retail_file, service_file, food_file)
 
         # 파일 존재 확인
         if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-            print("⚠️ 폐점률 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_closing_rate_data()
 
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 연도별 평균 폐점률 계산
-        retail_closing = retail_df.groupby("yr")["endCncltnRt"].mean()
-        service_closing = service_df.groupby("yr")["endCncltnRt"].mean()
-        food_closing = food_df.groupby("yr")["endCncltnRt"].mean()
+        retail_closing = csv_tables.group_mean(retail_rows, "yr", "endCncltnRt")
+        service_closing = csv_tables.group_mean(service_rows, "yr", "endCncltnRt")
+        food_closing = csv_tables.group_mean(food_rows, "yr", "endCncltnRt")
 
         closing_rate_data = {
-            "도소매": retail_closing.to_dict(),
-            "서비스": service_closing.to_dict(),
-            "외식": food_closing.to_dict(),
+            "도소매": retail_closing,
+            "서비스": service_closing,
+            "외식": food_closing,
         }
 
-        print("✅ 연도별 폐점률 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return closing_rate_data
 
     except Exception as e:
-        print(f"⚠️ 폐점률 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_closing_rate_data()
 
 
@@ -594,45 +644,46 @@ def load_opening_closing_rate_data():
         retail_file = "data/주요도소매별_가맹점_개폐점현황.csv"
         service_file = "data/주요서비스별_가맹점_개폐점현황.csv"
         food_file = "data/주요외식별_가맹점_개폐점현황.csv"
+        _record_source(retail_file, service_file, food_file)
 
         # 파일 존재 확인
         if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-            print("⚠️ 개폐점률 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_opening_closing_rate_data()
 
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 2024년 데이터만 필터링
-        retail_2024 = retail_df[retail_df["yr"] == 2024]
-        service_2024 = service_df[service_df["yr"] == 2024]
-        food_2024 = food_df[food_df["yr"] == 2024]
+        retail_2024 = [row for row in retail_rows if row["yr"] == 2024]
+        service_2024 = [row for row in service_rows if row["yr"] == 2024]
+        food_2024 = [row for row in food_rows if row["yr"] == 2024]
 
         opening_closing_data = {
             "도소매": {
-                "업종": retail_2024["indutyMlsfcNm"].tolist(),
-                "개점률": retail_2024["newFrcsRt"].tolist(),
-                "폐점률": retail_2024["endCncltnRt"].tolist(),
+                "업종": [row["indutyMlsfcNm"] for row in retail_2024],
+                "개점률": [row["newFrcsRt"] for row in retail_2024],
+                "폐점률": [row["endCncltnRt"] for row in retail_2024],
             },
             "서비스": {
-                "업종": service_2024["indutyMlsfcNm"].tolist(),
-                "개점률": service_2024["newFrcsRt"].tolist(),
-                "폐점률": service_2024["endCncltnRt"].tolist(),
+                "업종": [row["indutyMlsfcNm"] for row in service_2024],
+                "개점률": [row["newFrcsRt"] for row in service_2024],
+                "폐점률": [row["endCncltnRt"] for row in service_2024],
             },
             "외식": {
-                "업종": food_2024["indutyMlsfcNm"].tolist(),
-                "개점률": food_2024["newFrcsRt"].tolist(),
-                "폐점률": food_2024["endCncltnRt"].tolist(),
+                "업종": [row["indutyMlsfcNm"] for row in food_2024],
+                "개점률": [row["newFrcsRt"] for row in food_2024],
+                "폐점률": [row["endCncltnRt"] for row in food_2024],
             },
         }
 
-        print("✅ 2024년 업종별 개폐점률 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return opening_closing_data
 
     except Exception as e:
-        print(f"⚠️ 개폐점률 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_opening_closing_rate_data()
 
 
@@ -664,38 +715,44 @@ def load_net_growth_rate_data():
         retail_file = "data/주요도소매별_가맹점_개폐점현황.csv"
         service_file = "data/주요서비스별_가맹점_개폐점현황.csv"
         food_file = "data/주요외식별_가맹점_개폐점현황.csv"
+        _record_source(retail_file, service_file, food_file)
 
         # 파일 존재 확인
         if not all(os.path.exists(f) for f in [retail_file, service_file, food_file]):
-            print("⚠️ 순증가율 CSV 파일을 찾을 수 없습니다. 하드코딩된 데이터를 사용합니다.")
+            _record_fallback("file_not_found")
             return get_hardcoded_net_growth_rate_data()
 
-        # CSV 파일 로드
-        retail_df = pd.read_csv(retail_file)
-        service_df = pd.read_csv(service_file)
-        food_df = pd.read_csv(food_file)
+        # CSV 파일 로드 (행 수가 적어 pandas 없이 읽음)
+        retail_rows = csv_tables.read_rows(retail_file)
+        service_rows = csv_tables.read_rows(service_file)
+        food_rows = csv_tables.read_rows(food_file)
 
         # 순증가율 계산 (개점률 - 폐점률)
-        retail_df["netGrowthRt"] = retail_df["newFrcsRt"] - retail_df["endCncltnRt"]
-        service_df["netGrowthRt"] = service_df["newFrcsRt"] - service_df["endCncltnRt"]
-        food_df["netGrowthRt"] = food_df["newFrcsRt"] - food_df["endCncltnRt"]
+        for row in retail_rows + service_rows + food_rows:
+            missing = any(
+                csv_tables.is_missing(row[column])
+                for column in ("newFrcsRt", "endCncltnRt")
+            )
+            row["netGrowthRt"] = (
+                None if missing else row["newFrcsRt"] - row["endCncltnRt"]
+            )
 
         # 연도별 평균 순증가율
-        retail_net = retail_df.groupby("yr")["netGrowthRt"].mean()
-        service_net = service_df.groupby("yr")["netGrowthRt"].mean()
-        food_net = food_df.groupby("yr")["netGrowthRt"].mean()
+        retail_net = csv_tables.group_mean(retail_rows, "yr", "netGrowthRt")
+        service_net = csv_tables.group_mean(service_rows, "yr", "netGrowthRt")
+        food_net = csv_tables.group_mean(food_rows, "yr", "netGrowthRt")
 
         net_growth_data = {
-            "도소매": retail_net.to_dict(),
-            "서비스": service_net.to_dict(),
-            "외식": food_net.to_dict(),
+            "도소매": retail_net,
+            "서비스": service_net,
+            "외식": food_net,
         }
 
-        print("✅ 순증가율 데이터를 성공적으로 로드했습니다.")
+        _record_rows(len(retail_rows) + len(service_rows) + len(food_rows))
         return net_growth_data
 
     except Exception as e:
-        print(f"⚠️ 순증가율 CSV 파일 로드 실패: {e}. 하드코딩된 데이터를 사용합니다.")
+        _record_fallback(f"load_error: {e}", e)
         return get_hardcoded_net_growth_rate_data()
 
 
@@ -735,21 +792,639 @@ def get_hardcoded_net_growth_rate_data():
     }
 
 
+# 데이터셋별 마지막 로드 결과 (출처, 대체 사유, 소요 시간, 시각, 파일, 행 수, 크기)
+DATASET_LOAD_STATUS = {}
+_load_listeners = []
+
+
+def add_load_listener(listener):
+    """데이터셋을 (재)로드할 때마다 (이름, 로드 상태)로 호출될 함수를 등록합니다."""
+    _load_listeners.append(listener)
+
+
+def _file_bytes(files):
+    """존재하는 파일들의 크기 합 (바이트)"""
+    return sum(os.path.getsize(path) for path in files if os.path.exists(path))
+
+
+def _log_load(name, status, error):
+    """데이터셋 로드 결과를 구조화 로그로 남깁니다 (대체 시 경고와 예외 포함)."""
+    fields = {
+        "dataset": name,
+        "source": status["source"],
+        "files": status["files"],
+        "rows": status["rows"],
+        "file_bytes": status["file_bytes"],
+        "size_bytes": status["size_bytes"],
+        "duration_ms": status["duration_ms"],
+        "fallback_reason": status["fallback_reason"],
+    }
+    if status["fallback_reason"] is None:
+        logger.info("✅ %s 데이터셋을 CSV에서 로드했습니다", name, extra=fields)
+    else:
+        logger.warning(
+            "⚠️ %s 데이터셋은 하드코딩된 데이터를 사용합니다 (%s)",
+            name,
+            status["fallback_reason"],
+            extra=fields,
+            exc_info=error,
+        )
+
+
+def _run_loader(names, loader):
+    """로더를 실행하고 소요 시간과 대체 여부를 names 데이터셋의 로드 상태로 기록합니다."""
+    _load_state.files = ()
+    _load_state.rows = None
+    _load_state.fallback_reason = None
+    _load_state.error = None
+    started = time.perf_counter()
+    loaded = loader()
+    status = {
+        "source": "csv" if _load_state.fallback_reason is None else "hardcoded",
+        "fallback_reason": _load_state.fallback_reason,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        "loaded_at": time.time(),
+        "files": list(_load_state.files),
+        "rows": _load_state.rows,
+        "file_bytes": _file_bytes(_load_state.files),
+    }
+    for name, data in zip(names, loaded if len(names) > 1 else (loaded,)):
+        DATASET_LOAD_STATUS[name] = dict(status, size_bytes=len(json_dumps(data)))
+        _log_load(name, DATASET_LOAD_STATUS[name], _load_state.error)
+        for listener in list(_load_listeners):
+            listener(name, DATASET_LOAD_STATUS[name])
+    return loaded
+
+
 # 데이터 로드
-LINE_CHART_DATA, BAR_CHART_DATA = load_chart_data()
-GENDER_PIE_DATA = load_gender_population_data()
-AREA_POPULATION_DATA = load_area_population_data()
-AGE_GENDER_DATA = load_age_gender_population_data()
-TIME_PERIOD_DATA = load_time_period_population_data()
-YEARLY_TREND_DATA = load_yearly_trend_data()
-GROWTH_RATE_DATA = load_growth_rate_data()
-CLOSING_RATE_DATA = load_closing_rate_data()
-OPENING_CLOSING_RATE_DATA = load_opening_closing_rate_data()
-NET_GROWTH_RATE_DATA = load_net_growth_rate_data()
+LINE_CHART_DATA, BAR_CHART_DATA = _run_loader(("line", "bar"), load_chart_data)
+GENDER_PIE_DATA = _run_loader(("pie",), load_gender_population_data)
+AREA_POPULATION_DATA = _run_loader(("area_population",), load_area_population_data)
+AGE_GENDER_DATA = _run_loader(("age_gender",), load_age_gender_population_data)
+TIME_PERIOD_DATA = _run_loader(("time_period",), load_time_period_population_data)
+YEARLY_TREND_DATA = _run_loader(("yearly_trend",), load_yearly_trend_data)
+GROWTH_RATE_DATA = _run_loader(("growth_rate",), load_growth_rate_data)
+CLOSING_RATE_DATA = _run_loader(("closing_rate",), load_closing_rate_data)
+OPENING_CLOSING_RATE_DATA = _run_loader(
+    ("opening_closing_rate",), load_opening_closing_rate_data
+)
+NET_GROWTH_RATE_DATA = _run_loader(("net_growth_rate",), load_net_growth_rate_data)
+
+
+def compute_dataset_version(data):
+    """데이터 내용으로부터 짧은 버전 해시를 계산합니다."""
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()[:12]
+
+
+# 데이터셋별 버전 (내용 해시) - 캐시 키로 사용
+DATASET_VERSIONS = {
+    "line": compute_dataset_version(LINE_CHART_DATA),
+    "bar": compute_dataset_version(BAR_CHART_DATA),
+    "pie": compute_dataset_version(GENDER_PIE_DATA),
+    "area_population": compute_dataset_version(AREA_POPULATION_DATA),
+    "age_gender": compute_dataset_version(AGE_GENDER_DATA),
+    "time_period": compute_dataset_version(TIME_PERIOD_DATA),
+    "yearly_trend": compute_dataset_version(YEARLY_TREND_DATA),
+    "growth_rate": compute_dataset_version(GROWTH_RATE_DATA),
+    "closing_rate": compute_dataset_version(CLOSING_RATE_DATA),
+    "opening_closing_rate": compute_dataset_version(OPENING_CLOSING_RATE_DATA),
+    "net_growth_rate": compute_dataset_version(NET_GROWTH_RATE_DATA),
+}
+
+
+# 데이터셋 이름별 모듈 전역 변수 이름
+_DATASET_GLOBALS = {
+    "line": "LINE_CHART_DATA",
+    "bar": "BAR_CHART_DATA",
+    "pie": "GENDER_PIE_DATA",
+    "area_population": "AREA_POPULATION_DATA",
+    "age_gender": "AGE_GENDER_DATA",
+    "time_period": "TIME_PERIOD_DATA",
+    "yearly_trend": "YEARLY_TREND_DATA",
+    "growth_rate": "GROWTH_RATE_DATA",
+    "closing_rate": "CLOSING_RATE_DATA",
+    "opening_closing_rate": "OPENING_CLOSING_RATE_DATA",
+    "net_growth_rate": "NET_GROWTH_RATE_DATA",
+}
+
+
+DATASET_NAMES = tuple(_DATASET_GLOBALS)
+
+
+def get_dataset(name):
+    """데이터셋 이름으로 현재 로드된 데이터를 반환합니다."""
+    return globals()[_DATASET_GLOBALS[name]]
+
+
+def data_response_key(name):
+    """전체(all) 데이터 응답에서 사용할 키 (기존 응답 형식 유지)"""
+    if name in ("line", "bar", "pie"):
+        return f"{name}_chart_data"
+    return f"{name}_data"
+
+
+# 데이터셋별 로드 시각 (Last-Modified 헤더 계산용, 버전이 바뀔 때만 갱신)
+_loaded_at = time.time()
+DATASET_LOADED_AT = {name: _loaded_at for name in DATASET_VERSIONS}
+
+
+# 데이터셋을 만드는 로더 함수 이름 (load_chart_data는 line/bar를 함께 반환)
+_DATASET_LOADERS = [
+    (("line", "bar"), "load_chart_data"),
+    (("pie",), "load_gender_population_data"),
+    (("area_population",), "load_area_population_data"),
+    (("age_gender",), "load_age_gender_population_data"),
+    (("time_period",), "load_time_period_population_data"),
+    (("yearly_trend",), "load_yearly_trend_data"),
+    (("growth_rate",), "load_growth_rate_data"),
+    (("closing_rate",), "load_closing_rate_data"),
+    (("opening_closing_rate",), "load_opening_closing_rate_data"),
+    (("net_growth_rate",), "load_net_growth_rate_data"),
+]
+
+_reload_lock = threading.Lock()
+_reload_listeners = []
+
+
+def add_reload_listener(listener):
+    """데이터 재로드로 데이터셋이 바뀔 때 {이름: 새 버전}으로 호출될 함수를 등록합니다."""
+    _reload_listeners.append(listener)
+
+
+def reload_datasets():
+    """
+    CSV 파일을 다시 읽어 내용이 바뀐 데이터셋만 교체합니다.
+
+    바뀐 데이터셋의 {이름: 새 버전}을 반환하고, 바뀐 것이 있으면 리스너에 알립니다.
+    DATASET_VERSIONS/DATASET_LOADED_AT은 다른 모듈이 참조하므로 같은 dict를 갱신하며,
+    버전보다 데이터를 먼저 바꿔 새 버전 키로 이전 데이터가 캐시되지 않게 합니다.
+    """
+    changed = {}
+    with _reload_lock:
+        for names, loader_name in _DATASET_LOADERS:
+            loaded = _run_loader(names, globals()[loader_name])
+            for name, data in zip(names, loaded if len(names) > 1 else (loaded,)):
+                version = compute_dataset_version(data)
+                if version == DATASET_VERSIONS[name]:
+                    continue
+                globals()[_DATASET_GLOBALS[name]] = data
+                DATASET_VERSIONS[name] = version
+                DATASET_LOADED_AT[name] = time.time()
+                changed[name] = version
+
+    if changed:
+        for listener in list(_reload_listeners):
+            listener(changed)
+    return changed
+
+
+# 데이터 폴더 감시 주기 (초, 0이면 감시하지 않음)
+DATA_WATCH_INTERVAL = float(os.environ.get("DATA_WATCH_INTERVAL", "0"))
+
+
+def _data_files_signature(directory):
+    """데이터 폴더 파일들의 (이름, 수정 시각, 크기) 목록"""
+    if not os.path.isdir(directory):
+        return ()
+    return tuple(
+        sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in os.scandir(directory)
+            if entry.is_file()
+        )
+    )
+
+
+def start_data_watcher(interval, directory="data"):
+    """
+    데이터 폴더의 파일 수정 시각을 interval초마다 확인해 바뀌면 다시 로드하는
+    데몬 스레드를 시작합니다. 반환된 Event를 set하면 감시를 멈춥니다.
+    """
+    stopped = threading.Event()
+
+    def watch():
+        signature = _data_files_signature(directory)
+        while not stopped.wait(interval):
+            current = _data_files_signature(directory)
+            if current == signature:
+                continue
+            signature = current
+            started = time.perf_counter()
+            try:
+                changed = reload_datasets()
+            except Exception:
+                logger.exception("⚠️ 데이터 재로드 실패")
+            else:
+                logger.info(
+                    "🔄 데이터 재로드 완료: %s",
+                    ", ".join(changed) or "변경 없음",
+                    extra={
+                        "changed": sorted(changed),
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    },
+                )
+
+    threading.Thread(target=watch, name="data-watcher", daemon=True).start()
+    return stopped
+
+
+def get_datasets_version(names):
+    """지정한 데이터셋들의 버전을 합친 버전 해시를 반환합니다."""
+    if len(names) == 1:
+        return DATASET_VERSIONS[names[0]]
+    return compute_dataset_version(
+        sorted((name, DATASET_VERSIONS[name]) for name in names)
+    )
+
+
+def get_data_version():
+    """모든 데이터셋 버전을 합친 전체 데이터 버전을 반환합니다."""
+    return compute_dataset_version(sorted(DATASET_VERSIONS.items()))
+
+
+# 사양 생성 코드 - 내용이 바뀌면 데이터가 같아도 사양이 달라짐
+SPEC_SOURCES = ("chart_specs.py", "chart_registry.py", "json_encoder.py")
+
+
+@lru_cache(maxsize=None)
+def spec_code_version():
+    """사양 생성 코드 파일 내용으로부터 버전 해시를 계산합니다 (프로세스당 한 번)."""
+    digest = hashlib.sha1()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in SPEC_SOURCES:
+        with open(os.path.join(base_dir, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def get_url_version(data_version):
+    """
+    불변 URL에 넣을 버전 (데이터 버전.사양 코드 버전)
+
+    데이터가 같아도 배포로 차트 생성 코드가 바뀌면 URL이 달라져,
+    CDN/브라우저에 1년 캐시된 이전 스타일의 사양을 계속 받지 않습니다.
+    """
+    return f"{data_version}.{spec_code_version()}"
+
+
+# ===== 준비 상태 =====
+
+# CSV 없이 하드코딩된 데이터로 대체한 데이터셋이 있으면 준비되지 않은 것으로 볼지 여부
+REQUIRE_CSV_DATA = os.environ.get("REQUIRE_CSV_DATA", "0") == "1"
+
+# 기본 옵션 차트 사양 캐시 예열 결과 (예열 전에는 None)
+SPEC_CACHE_WARM_UP = None
+
+
+def warm_up_spec_cache():
+    """기본 옵션의 모든 차트 사양을 미리 생성해 레지스트리 캐시에 채웁니다."""
+    global SPEC_CACHE_WARM_UP
+    started = time.perf_counter()
+    for entry in CHART_REGISTRY:
+        CHART_REGISTRY.build(entry, {}, get_datasets_version(entry.datasets))
+    SPEC_CACHE_WARM_UP = {
+        "charts": len(CHART_REGISTRY),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        "warmed_at": time.time(),
+    }
+    return SPEC_CACHE_WARM_UP
+
+
+def _isoformat(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="seconds")
+
+
+def _rewarm_spec_cache(changed):
+    """예열한 뒤 데이터가 바뀌면 새 버전의 기본 차트 사양을 다시 채웁니다."""
+    if SPEC_CACHE_WARM_UP is not None:
+        warm_up_spec_cache()
+
+
+add_reload_listener(_rewarm_spec_cache)
+
+
+def readiness():
+    """
+    트래픽을 받을 준비가 되었는지와 데이터셋별 로드 상태를 반환합니다.
+
+    모든 데이터셋이 로드되고 차트 사양 캐시를 예열했으면 준비된 것으로 봅니다.
+    하드코딩된 데이터로 대체한 데이터셋이 있으면 degraded로 표시하고,
+    REQUIRE_CSV_DATA=1이면 준비되지 않은 것으로 봅니다.
+    """
+    datasets = {
+        name: dict(
+            DATASET_LOAD_STATUS[name],
+            loaded_at=_isoformat(DATASET_LOAD_STATUS[name]["loaded_at"]),
+            version=DATASET_VERSIONS[name],
+        )
+        for name in DATASET_NAMES
+        if name in DATASET_LOAD_STATUS
+    }
+    spec_cache = SPEC_CACHE_WARM_UP and dict(
+        SPEC_CACHE_WARM_UP, warmed_at=_isoformat(SPEC_CACHE_WARM_UP["warmed_at"])
+    )
+    fallback = [name for name, status in datasets.items() if status["source"] != "csv"]
+    ready = (
+        len(datasets) == len(DATASET_NAMES)
+        and SPEC_CACHE_WARM_UP is not None
+        and not (REQUIRE_CSV_DATA and fallback)
+    )
+    if not ready:
+        status = "not_ready"
+    else:
+        status = "degraded" if fallback else "ready"
+    return ready, {
+        "status": status,
+        "data_version": get_data_version(),
+        "spec_cache": spec_cache,
+        "fallback_datasets": fallback,
+        "datasets": datasets,
+    }
+
+
+# ===== 다운샘플링 =====
+
+
+def lttb_indices(values, max_points):
+    """Largest-Triangle-Three-Buckets 알고리즘으로 남길 인덱스를 선택합니다."""
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points <= 2:
+        return np.array([0, n - 1][:max_points])
+
+    x = np.arange(n, dtype=float)
+    # 첫 점과 마지막 점을 제외한 구간을 max_points - 2개의 버킷으로 분할
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            next_x = x[next_start:next_end].mean()
+            next_y = y[next_start:next_end].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        # 이전 선택점, 후보점, 다음 버킷 평균점이 이루는 삼각형 넓이가 최대인 점 선택
+        areas = np.abs(
+            (x[anchor] - next_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (next_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    return selected
+
+
+def minmax_indices(values, max_points):
+    """
+    버킷별 최솟값/최댓값만 남기는 min/max 데시메이션 인덱스를 선택합니다.
+
+    max_points // 2개 버킷에서 최솟값/최댓값을 하나씩 고르고, max_points가 홀수이면
+    마지막 버킷 하나를 더 만들어 최댓값만 고르므로 항상 max_points개를 반환합니다.
+    (max_points < n이면 버킷마다 점이 2개 이상이고, 값이 모두 같은 버킷은 양 끝 점을 고름)
+    """
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+
+    pairs, remainder = divmod(max_points, 2)
+    buckets = np.array_split(np.arange(n), pairs + remainder)
+    selected = []
+    for bucket in buckets[:pairs]:
+        low = int(bucket[np.argmin(y[bucket])])
+        high = int(bucket[np.argmax(y[bucket])])
+        if low == high:
+            low, high = int(bucket[0]), int(bucket[-1])
+        selected.extend((low, high))
+    if remainder:
+        bucket = buckets[-1]
+        selected.append(int(bucket[np.argmax(y[bucket])]))
+    return np.array(sorted(selected))
+
+
+def _keyed_series(data):
+    """{라벨: 값} 데이터를 (라벨, 값) 시계열로 변환합니다."""
+    return list(data.keys()), list(data.values())
+
+
+def _yearly_series(data, years=None):
+    """업종별 연도 데이터를 (연도, 연도별 업종 합계) 시계열로 변환합니다 (선택 기준용)."""
+    if years is None:
+        years = sorted(data["도소매"].keys())
+    totals = [
+        sum(
+            value
+            for value in (data[industry].get(year) for industry in data)
+            if value is not None and not np.isnan(value)
+        )
+        for year in years
+    ]
+    return years, totals
+
+
+def _growth_rate_years():
+    """성장률 차트의 x축 연도 목록"""
+    return sorted([year for year in GROWTH_RATE_DATA["도소매"].keys() if year is not None])
+
+
+# 데이터셋별 다운샘플링 기준 시계열과 방식 (막대 차트는 min/max, 라인 차트는 LTTB)
+_DOWNSAMPLE_SOURCES = {
+    "area_population": (lambda: _keyed_series(AREA_POPULATION_DATA), minmax_indices),
+    "time_period": (lambda: _keyed_series(TIME_PERIOD_DATA), lttb_indices),
+    "yearly_trend": (lambda: _yearly_series(YEARLY_TREND_DATA), lttb_indices),
+    "growth_rate": (
+        lambda: _yearly_series(GROWTH_RATE_DATA, _growth_rate_years()),
+        lttb_indices,
+    ),
+    "closing_rate": (lambda: _yearly_series(CLOSING_RATE_DATA), lttb_indices),
+    "net_growth_rate": (lambda: _yearly_series(NET_GROWTH_RATE_DATA), lttb_indices),
+}
+
+
+@lru_cache(maxsize=256)
+def _cached_downsampled_labels(dataset_name, version, max_points):
+    """(데이터셋, 버전, max_points)별로 다운샘플링 결과 라벨을 캐시합니다."""
+    source, method = _DOWNSAMPLE_SOURCES[dataset_name]
+    labels, values = source()
+    return tuple(labels[i] for i in method(values, max_points))
+
+
+@timed("dataset")
+def downsample_labels(dataset_name, labels, max_points=None):
+    """max_points가 지정되면 다운샘플링 후 남길 라벨 목록을 반환합니다."""
+    if not max_points or max_points >= len(labels):
+        return labels
+    return list(
+        _cached_downsampled_labels(
+            dataset_name, DATASET_VERSIONS[dataset_name], max_points
+        )
+    )
+
+
+# ===== 상위 N개 + 기타 묶기 =====
+
+OTHERS_LABEL = "기타"
+
+
+def top_n_indices(values, n):
+    """argpartition으로 상위 n개 인덱스를 찾아 값 내림차순으로 반환합니다."""
+    values = np.asarray(values)
+    if n >= len(values):
+        return np.argsort(-values, kind="stable")
+
+    # 전체 정렬 대신 부분 선택(O(k)) 후 선택된 n개만 정렬
+    top = np.argpartition(-values, n - 1)[:n]
+    return top[np.argsort(-values[top], kind="stable")]
+
+
+def _opening_closing_categories():
+    """2024년 도소매 업종별 (업종, [개점률, 폐점률]) - 개폐점률 합으로 순위 결정"""
+    retail = OPENING_CLOSING_RATE_DATA["도소매"]
+    return retail["업종"], [retail["개점률"], retail["폐점률"]]
+
+
+# 데이터셋별 카테고리 집계 기준: (라벨, 측정값 목록) 생성 함수와 기타 항목 계산 방식
+# 인구 수는 합산하고, 비율은 나머지 업종의 평균으로 묶습니다.
+_CATEGORY_SOURCES = {
+    "area_population": (
+        lambda: (
+            list(AREA_POPULATION_DATA.keys()),
+            [list(AREA_POPULATION_DATA.values())],
+        ),
+        "sum",
+    ),
+    "opening_closing_rate": (_opening_closing_categories, "mean"),
+}
+
+
+@lru_cache(maxsize=32)
+def _category_aggregate(dataset_name, version):
+    """(데이터셋, 버전)별로 카테고리 라벨/측정값 배열과 순위 기준값을 미리 계산합니다."""
+    source, _ = _CATEGORY_SOURCES[dataset_name]
+    labels, columns = source()
+    values = np.column_stack([np.asarray(column) for column in columns])
+    return np.asarray(labels, dtype=object), values, values.sum(axis=1)
+
+
+@timed("dataset")
+def top_categories(dataset_name, top):
+    """
+    상위 top개 카테고리만 남기고 나머지를 "기타" 하나로 묶습니다.
+
+    (라벨 목록, 측정값별 값 목록)을 반환합니다. 카테고리 수가 top 이하이면
+    묶지 않고 원래 순서를 유지합니다.
+    """
+    labels, values, ranking = _category_aggregate(
+        dataset_name, DATASET_VERSIONS[dataset_name]
+    )
+    if top >= len(labels):
+        return labels.tolist(), values.T.tolist()
+
+    indices = top_n_indices(ranking, top)
+    rest = np.ones(len(labels), dtype=bool)
+    rest[indices] = False
+
+    _, fold = _CATEGORY_SOURCES[dataset_name]
+    if fold == "sum":
+        others = values[rest].sum(axis=0)
+    else:
+        others = np.round(values[rest].mean(axis=0), 2)
+
+    top_labels = labels[indices].tolist() + [OTHERS_LABEL]
+    columns = [
+        values[indices, column].tolist() + [others[column].item()]
+        for column in range(values.shape[1])
+    ]
+    return top_labels, columns
+
+
+# ===== 페이지네이션용 정렬 인덱스 =====
+
+
+def _area_population_rows():
+    """읍면동별 유동인구 행 목록 (유동인구 내림차순, 동률은 읍면동명 순)"""
+    return sorted(
+        ({"읍면동": name, "유동인구": value} for name, value in AREA_POPULATION_DATA.items()),
+        key=lambda row: (-row["유동인구"], row["읍면동"]),
+    )
+
+
+def _opening_closing_rate_rows():
+    """분야/업종별 개폐점률 행 목록 (분야, 업종명 순)"""
+    rows = []
+    for sector, sector_data in OPENING_CLOSING_RATE_DATA.items():
+        for industry, opening, closing in zip(
+            sector_data["업종"], sector_data["개점률"], sector_data["폐점률"]
+        ):
+            rows.append({"분야": sector, "업종": industry, "개점률": opening, "폐점률": closing})
+    return sorted(rows, key=lambda row: (row["분야"], row["업종"]))
+
+
+# 커서 페이지네이션을 지원하는 목록형 데이터셋
+_ROW_SOURCES = {
+    "area_population": _area_population_rows,
+    "opening_closing_rate": _opening_closing_rate_rows,
+}
+
+PAGINATED_DATASETS = tuple(_ROW_SOURCES)
+
+
+@lru_cache(maxsize=32)
+def _sorted_rows(dataset_name, version):
+    """(데이터셋, 버전)별로 안정적인 순서로 정렬된 행 목록을 한 번만 만들어 둡니다."""
+    return tuple(_ROW_SOURCES[dataset_name]())
+
+
+# 페이지 크기 기본값/상한
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+# 재로드 직후 첫 페이지 요청이 몰려도 정렬은 데이터 버전별로 한 번만 실행
+_ROW_FLIGHTS = SingleFlight()
+
+
+@timed("dataset")
+def get_rows_page(dataset_name, offset, limit):
+    """정렬된 행 목록에서 offset부터 limit개를 반환합니다 (행 목록, 전체 행 수)."""
+    version = DATASET_VERSIONS[dataset_name]
+    rows = _ROW_FLIGHTS.do((dataset_name, version), _sorted_rows, dataset_name, version)
+    return list(rows[offset : offset + limit]), len(rows)
+
+
+def cache_stats():
+    """메모리 캐시 계층별 (적중 수, 미스 수)"""
+    return {
+        "spec": (CHART_REGISTRY.hits, CHART_REGISTRY.misses),
+        "downsample": tuple(_cached_downsampled_labels.cache_info()[:2]),
+        "category": tuple(_category_aggregate.cache_info()[:2]),
+        "rows": tuple(_sorted_rows.cache_info()[:2]),
+    }
+
+
+# ===== 스타일/데이터 분리 =====
+
+# 라이브러리별로 차트 사양에서 데이터에 해당하는 경로 (나머지는 스타일)
+CHART_DATA_PATHS = {
+    "vega_lite": [("data",)],
+    "echarts": [("series",), ("xAxis", "data"), ("legend", "data")],
+    "plotly": [("data",)],
+    "chartjs": [("data",)],
+}
+
 
 # ===== Vega-Lite Specs =====
 
 
+@register_chart("vega_lite", "line")
 def get_vega_lite_line_chart_spec():
     """연도별 업종별 총 가맹점수 추이 - Vega-Lite 라인 차트 사양"""
     return {
@@ -820,6 +1495,7 @@ def get_vega_lite_line_chart_spec():
     }
 
 
+@register_chart("vega_lite", "bar")
 def get_vega_lite_bar_chart_spec():
     """업종별 전체 기간 평균 가맹점수 - Vega-Lite 바 차트 사양"""
     return {
@@ -863,6 +1539,7 @@ def get_vega_lite_bar_chart_spec():
     }
 
 
+@register_chart("vega_lite", "pie")
 def get_vega_lite_pie_chart_spec():
     """성별 유동인구 비율 - Vega-Lite 파이 차트 사양"""
     gender_data = GENDER_PIE_DATA
@@ -921,6 +1598,7 @@ def get_vega_lite_pie_chart_spec():
 # ===== ECharts Specs =====
 
 
+@register_chart("echarts", "line")
 def get_echarts_line_chart_option():
     """연도별 업종별 총 가맹점수 추이 - ECharts 라인 차트 옵션"""
     return {
@@ -994,6 +1672,7 @@ def get_echarts_line_chart_option():
     }
 
 
+@register_chart("echarts", "bar")
 def get_echarts_bar_chart_option():
     """업종별 전체 기간 평균 가맹점수 - ECharts 바 차트 옵션"""
     return {
@@ -1033,6 +1712,7 @@ def get_echarts_bar_chart_option():
     }
 
 
+@register_chart("echarts", "pie")
 def get_echarts_pie_chart_option():
     """성별 유동인구 비율 - ECharts 파이 차트 옵션"""
     gender_data = GENDER_PIE_DATA
@@ -1093,6 +1773,7 @@ def get_echarts_pie_chart_option():
 # ===== Plotly Specs =====
 
 
+@register_chart("plotly", "line")
 def get_plotly_line_chart_figure():
     """연도별 업종별 총 가맹점수 추이 - Plotly 라인 차트 사양"""
     return {
@@ -1167,6 +1848,7 @@ def get_plotly_line_chart_figure():
     }
 
 
+@register_chart("plotly", "bar")
 def get_plotly_bar_chart_figure():
     """업종별 전체 기간 평균 가맹점수 - Plotly 바 차트 사양"""
     return {
@@ -1198,6 +1880,7 @@ def get_plotly_bar_chart_figure():
     }
 
 
+@register_chart("plotly", "pie")
 def get_plotly_pie_chart_figure():
     """성별 유동인구 비율 - Plotly 파이 차트 사양"""
     gender_data = GENDER_PIE_DATA
@@ -1247,6 +1930,7 @@ def get_plotly_pie_chart_figure():
 # ===== Chart.js Specs =====
 
 
+@register_chart("chartjs", "line")
 def get_chartjs_line_chart_config():
     """연도별 업종별 총 가맹점수 추이 - Chart.js 라인 차트 설정"""
     return {
@@ -1318,6 +2002,7 @@ def get_chartjs_line_chart_config():
     }
 
 
+@register_chart("chartjs", "bar")
 def get_chartjs_bar_chart_config():
     """업종별 전체 기간 평균 가맹점수 - Chart.js 바 차트 설정"""
     return {
@@ -1356,6 +2041,7 @@ def get_chartjs_bar_chart_config():
     }
 
 
+@register_chart("chartjs", "pie")
 def get_chartjs_pie_chart_config():
     """성별 유동인구 비율 - Chart.js 파이 차트 설정"""
     gender_data = GENDER_PIE_DATA
@@ -1408,11 +2094,18 @@ def get_chartjs_pie_chart_config():
     }
 
 
-def get_chartjs_area_population_config():
+@register_chart("chartjs", "area_population")
+def get_chartjs_area_population_config(max_points=None, top=None):
     """읍면동별 총 유동인구 - Chart.js 막대 차트 설정"""
     area_data = AREA_POPULATION_DATA
-    labels = list(area_data.keys())
-    data = list(area_data.values())
+    if top:
+        # 상위 top개 읍면동 + 기타 (max_points보다 우선)
+        labels, (data,) = top_categories("area_population", top)
+    else:
+        labels = downsample_labels(
+            "area_population", list(area_data.keys()), max_points
+        )
+        data = [area_data[label] for label in labels]
 
     return {
         "type": "bar",
@@ -1466,6 +2159,7 @@ def get_chartjs_area_population_config():
     }
 
 
+@register_chart("chartjs", "age_gender")
 def get_chartjs_age_gender_config():
     """연령대별 성별 유동인구 - Chart.js 막대 차트 설정"""
     age_gender_data = AGE_GENDER_DATA
@@ -1534,10 +2228,13 @@ def get_chartjs_age_gender_config():
     }
 
 
-def get_chartjs_yearly_trend_config():
+@register_chart("chartjs", "yearly_trend")
+def get_chartjs_yearly_trend_config(max_points=None):
     """연도별 업종별 총 가맹점수 추이 - Chart.js 라인 차트 설정"""
     yearly_trend_data = YEARLY_TREND_DATA
-    years = sorted(list(yearly_trend_data["도소매"].keys()))
+    years = downsample_labels(
+        "yearly_trend", sorted(list(yearly_trend_data["도소매"].keys())), max_points
+    )
 
     return {
         "type": "line",
@@ -1614,11 +2311,14 @@ def get_chartjs_yearly_trend_config():
     }
 
 
-def get_chartjs_time_period_config():
+@register_chart("chartjs", "time_period")
+def get_chartjs_time_period_config(max_points=None):
     """시간대별 유동인구 변화 - Chart.js 라인 차트 설정"""
     time_period_data = TIME_PERIOD_DATA
-    time_labels = list(time_period_data.keys())
-    time_values = list(time_period_data.values())
+    time_labels = downsample_labels(
+        "time_period", list(time_period_data.keys()), max_points
+    )
+    time_values = [time_period_data[label] for label in time_labels]
 
     return {
         "type": "line",
@@ -1677,12 +2377,11 @@ def get_chartjs_time_period_config():
     }
 
 
-def get_chartjs_growth_rate_config():
+@register_chart("chartjs", "growth_rate")
+def get_chartjs_growth_rate_config(max_points=None):
     """연도별 업종별 가맹점수 성장률 - Chart.js 라인 차트 설정"""
     growth_rate_data = GROWTH_RATE_DATA
-    years = sorted(
-        [year for year in growth_rate_data["도소매"].keys() if year is not None]
-    )
+    years = downsample_labels("growth_rate", _growth_rate_years(), max_points)
 
     return {
         "type": "line",
@@ -1761,10 +2460,13 @@ def get_chartjs_growth_rate_config():
     }
 
 
-def get_chartjs_closing_rate_config():
+@register_chart("chartjs", "closing_rate")
+def get_chartjs_closing_rate_config(max_points=None):
     """연도별 업종별 평균 폐점률 추이 - Chart.js 라인 차트 설정"""
     closing_rate_data = CLOSING_RATE_DATA
-    years = sorted(list(closing_rate_data["도소매"].keys()))
+    years = downsample_labels(
+        "closing_rate", sorted(list(closing_rate_data["도소매"].keys())), max_points
+    )
 
     return {
         "type": "line",
@@ -1841,7 +2543,8 @@ def get_chartjs_closing_rate_config():
     }
 
 
-def get_chartjs_opening_closing_rate_config():
+@register_chart("chartjs", "opening_closing_rate")
+def get_chartjs_opening_closing_rate_config(top=None):
     """2024년 업종별 개폐점률 - Chart.js 막대 차트 설정"""
     opening_closing_data = OPENING_CLOSING_RATE_DATA
 
@@ -1849,6 +2552,11 @@ def get_chartjs_opening_closing_rate_config():
     retail_industries = opening_closing_data["도소매"]["업종"]
     retail_opening = opening_closing_data["도소매"]["개점률"]
     retail_closing = opening_closing_data["도소매"]["폐점률"]
+    if top:
+        # 개폐점률 합 기준 상위 top개 업종 + 기타
+        retail_industries, (retail_opening, retail_closing) = top_categories(
+            "opening_closing_rate", top
+        )
 
     return {
         "type": "bar",
@@ -1908,10 +2616,13 @@ def get_chartjs_opening_closing_rate_config():
     }
 
 
-def get_chartjs_net_growth_rate_config():
+@register_chart("chartjs", "net_growth_rate")
+def get_chartjs_net_growth_rate_config(max_points=None):
     """연도별 업종별 평균 순증가율 추이 - Chart.js 라인 차트 설정"""
     net_growth_data = NET_GROWTH_RATE_DATA
-    years = sorted(list(net_growth_data["도소매"].keys()))
+    years = downsample_labels(
+        "net_growth_rate", sorted(list(net_growth_data["도소매"].keys())), max_points
+    )
 
     return {
         "type": "line",
@@ -0,0 +1,108 @@
+"""
+응답 압축 유틸리티
+Accept-Encoding 협상 결과에 따라 gzip/brotli로 압축하고,
+같은 데이터 버전의 응답은 압축 결과를 재사용합니다.
+"""
+
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축 이득보다 비용이 커서 그대로 전송
+MIN_COMPRESS_SIZE = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# 빌드 시 한 번만 압축하는 정적 파일은 최고 압축률 사용
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+# 서버 선호 순서 (클라이언트 품질값이 같으면 앞쪽 우선)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(body, encoding, static=False):
+    """본문 바이트를 지정한 인코딩으로 압축합니다 (static이면 최고 압축률)."""
+    if encoding == "br":
+        quality = STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    if encoding == "gzip":
+        level = STATIC_GZIP_LEVEL if static else GZIP_LEVEL
+        # mtime을 고정해 같은 본문이면 같은 바이트가 나오도록 함
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"지원하지 않는 인코딩: {encoding}")
+
+
+class CompressedVariantCache:
+    """
+    (캐시 키, 인코딩)별 압축 결과를 보관하는 LRU 캐시
+
+    캐시 키에는 요청 경로와 데이터 버전을 넣어 데이터가 바뀌면 새 항목을 만들고,
+    본문 CRC를 함께 저장해 같은 키로 다른 본문이 오면 다시 압축합니다.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compress(self, key, encoding, body):
+        """캐시된 압축 결과를 반환하고, 없으면 압축해서 저장합니다."""
+        cache_key = (key, encoding)
+        checksum = zlib.crc32(body)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == checksum:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+
+        compressed = compress(body, encoding)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[cache_key] = (checksum, compressed)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self):
+        """모든 압축 결과를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PrecompressedBody:
+    """
+    한 번 만들어 두고 계속 재사용하는 응답 본문
+
+    본문 해시로 ETag를 정하고, 인코딩별 압축 결과는 처음 요청될 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:16]
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    def get(self, encoding):
+        """인코딩별 본문을 반환합니다 (encoding이 None이면 원본)."""
+        if encoding is None:
+            return self.body
+        with self._lock:
+            variant = self._variants.get(encoding)
+            if variant is None:
+                variant = self._variants[encoding] = compress(self.body, encoding)
+            return variant
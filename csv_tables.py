@@ -0,0 +1,90 @@
+"""
+가벼운 CSV 집계 유틸리티
+연도별 수십 행 정도인 가맹점 현황 CSV를 pandas 없이 표준 라이브러리로 읽고 집계합니다.
+
+결측값(빈 칸, NaN)은 pandas와 같이 그룹 키에서는 해당 행을 제외하고,
+집계에서는 건너뜁니다. 그룹 결과는 키 오름차순으로 정렬합니다.
+"""
+
+import csv
+import math
+
+
+def _parse_value(text):
+    """CSV 문자열 값을 int/float/str로 변환합니다 (빈 값은 None)."""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def is_missing(value):
+    """None 또는 NaN인지 확인합니다."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def read_rows(path):
+    """CSV 파일을 {컬럼: 값} dict 목록으로 읽습니다 (UTF-8 BOM 허용)."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [
+            {column: _parse_value(value or "") for column, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
+
+def _group_values(rows, key, column):
+    groups = {}
+    for row in rows:
+        if is_missing(row[key]):
+            continue
+        values = groups.setdefault(row[key], [])
+        if not is_missing(row[column]):
+            values.append(row[column])
+    return dict(sorted(groups.items()))
+
+
+def _mean(values):
+    return math.fsum(values) / len(values) if values else math.nan
+
+
+def group_first(rows, key, column):
+    """key별 column의 첫 번째 유효 값 (pandas groupby(key)[column].first())"""
+    return {
+        group: values[0] if values else math.nan
+        for group, values in _group_values(rows, key, column).items()
+    }
+
+
+def group_mean(rows, key, column):
+    """key별 column의 평균 (pandas groupby(key)[column].mean())"""
+    return {
+        group: _mean(values)
+        for group, values in _group_values(rows, key, column).items()
+    }
+
+
+def column_mean(rows, column):
+    """column 전체의 평균 (pandas df[column].mean())"""
+    return _mean([row[column] for row in rows if not is_missing(row[column])])
+
+
+def pct_change(series):
+    """{키: 값}의 직전 값 대비 변화율 (pandas Series.pct_change(), 첫 값은 NaN)"""
+    result = {}
+    previous = None
+    for key, value in series.items():
+        if not previous or is_missing(value):
+            # 첫 값, 결측값, 0에서의 변화율은 정의되지 않음 (JSON에서는 null)
+            result[key] = math.nan
+        else:
+            result[key] = value / previous - 1
+        if not is_missing(value):
+            previous = value
+    return result
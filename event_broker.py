@@ -0,0 +1,144 @@
+"""
+서버 이벤트 브로커
+데이터 재로드 같은 서버 이벤트를 SSE(Server-Sent Events) 구독자들에게 전달합니다.
+
+이벤트 ID는 이벤트 발행 후의 전체 데이터 버전입니다. 워커들은 같은 데이터 파일을
+읽으므로 어느 워커에 재연결해도 Last-Event-ID를 같은 기준으로 비교할 수 있습니다.
+"""
+
+import json
+import threading
+from collections import deque, namedtuple
+
+from chart_registry import CHART_REGISTRY
+from chart_specs import DATASET_VERSIONS, add_reload_listener, get_data_version
+
+ServerEvent = namedtuple("ServerEvent", ["id", "name", "data"])
+
+
+def format_sse(event):
+    """이벤트를 SSE 메시지 형식의 바이트로 변환합니다."""
+    data = json.dumps(event.data, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event.id}\nevent: {event.name}\ndata: {data}\n\n".encode("utf-8")
+
+
+class EventBroker:
+    """
+    이벤트를 구독자 콜백에 전달하고, 재연결한 클라이언트를 위해 최근 이벤트를 보관합니다.
+
+    구독자 콜백은 발행한 스레드에서 호출되므로 큐에 넣는 정도로 가벼워야 합니다.
+    콜백이 예외를 던지면 (예: 느린 클라이언트의 큐가 가득 참) 구독을 해제합니다.
+    """
+
+    def __init__(self, history_size=100, initial_id=None):
+        self._subscribers = {}
+        self._history = deque(maxlen=history_size)
+        # 보관 중인 가장 오래된 이벤트 직전의 ID (그 ID를 가진 클라이언트는 전부 받으면 됨)
+        self._base_id = initial_id
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        """구독자 콜백을 등록하고 구독 해제에 쓸 토큰을 반환합니다."""
+        token = object()
+        with self._lock:
+            self._subscribers[token] = callback
+        return token
+
+    def unsubscribe(self, token):
+        """구독을 해제합니다 (이미 해제된 토큰은 무시)."""
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def is_subscribed(self, token):
+        """구독이 유지되고 있는지 확인합니다."""
+        with self._lock:
+            return token in self._subscribers
+
+    def resume(self, callback, last_event_id):
+        """
+        구독자 콜백을 등록하고 (토큰, 보관 중인 last_event_id 이후 이벤트)를 반환합니다.
+
+        등록과 조회를 한 번에 하므로 반환된 이벤트와 콜백으로 받을 이벤트가 겹치지
+        않습니다. last_event_id가 보관 범위에 없으면 (오래된 ID, 이 워커가 시작되기
+        전의 ID 등) 이벤트 목록 대신 None을 반환합니다.
+        """
+        token = object()
+        with self._lock:
+            self._subscribers[token] = callback
+            history = list(self._history)
+            for index in range(len(history) - 1, -1, -1):
+                if history[index].id == last_event_id:
+                    return token, history[index + 1 :]
+            if last_event_id is not None and last_event_id == self._base_id:
+                return token, history
+        return token, None
+
+    def publish(self, name, data, event_id):
+        """이벤트를 발행해 모든 구독자에게 전달합니다."""
+        with self._lock:
+            event = ServerEvent(event_id, name, data)
+            if len(self._history) == self._history.maxlen:
+                self._base_id = self._history[0].id
+            self._history.append(event)
+            subscribers = list(self._subscribers.items())
+
+        for token, callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                self.unsubscribe(token)
+        return event
+
+    @property
+    def subscriber_count(self):
+        """현재 구독자 수"""
+        with self._lock:
+            return len(self._subscribers)
+
+
+# 데이터 재로드 이벤트 채널 (Flask/ASGI 앱이 공유)
+DATA_EVENTS = EventBroker(initial_id=get_data_version())
+
+
+def versions_snapshot():
+    """현재 데이터셋 버전 전체를 담은 이벤트 (처음 연결했거나 이벤트가 빠진 클라이언트용)"""
+    data_version = get_data_version()
+    return ServerEvent(
+        data_version,
+        "versions",
+        {"datasets": dict(DATASET_VERSIONS), "data_version": data_version},
+    )
+
+
+def subscribe_data_events(callback, last_event_id=None):
+    """
+    재로드 이벤트를 구독하고 (토큰, 연결 직후 보낼 이벤트 목록)을 반환합니다.
+
+    Last-Event-ID가 이 워커가 보관한 이벤트이면 그 이후 이벤트를, 이미 현재 데이터
+    버전이면 빈 목록을, 그 밖에는 현재 버전 전체(versions 이벤트)를 보냅니다.
+    """
+    token, missed = DATA_EVENTS.resume(callback, last_event_id)
+    if missed is None:
+        missed = [] if last_event_id == get_data_version() else [versions_snapshot()]
+    return token, missed
+
+
+def publish_data_reload(changed):
+    """바뀐 데이터셋과 새 버전, 영향받는 차트 목록을 reload 이벤트로 발행합니다."""
+    data_version = get_data_version()
+    DATA_EVENTS.publish(
+        "reload",
+        {
+            "datasets": changed,
+            "data_version": data_version,
+            "charts": [
+                f"{entry.library}/{entry.chart_type}"
+                for entry in CHART_REGISTRY
+                if changed.keys() & set(entry.datasets)
+            ],
+        },
+        data_version,
+    )
+
+
+add_reload_listener(publish_data_reload)
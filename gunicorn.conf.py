@@ -0,0 +1,88 @@
+"""
+gunicorn 설정
+환경변수로 워커 수, 스레드 수, 타임아웃을 조정합니다.
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5001')}"
+
+# 워커/스레드 (기본값: CPU 코어 × 2 + 1 워커, 워커당 4 스레드)
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+
+# 타임아웃 (초)
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+
+# 메모리 누수 대비 워커 재시작 (0이면 비활성화)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+# 마스터에서 앱(데이터셋 포함)을 한 번만 로드한 뒤 fork
+preload_app = True
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+# GUNICORN_ACCESS_LOG_FORMAT=json이면 요청당 JSON 한 줄로 기록
+# (단계별 처리 시간은 응답의 Server-Timing 헤더 값, 직렬화는 access_log.py)
+if os.environ.get("GUNICORN_ACCESS_LOG_FORMAT") == "json":
+    logger_class = "access_log.JSONAccessLogger"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+# Prometheus 멀티프로세스 모드: 워커별 메트릭 파일을 이 폴더에 쓰고 /metrics에서 합산
+# (prometheus_client import 전에 설정해야 하므로 앱을 로드하기 전에 지정)
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/chart-api-metrics")
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+# 앱 로드 중 생기는 빈 메모리 구멍을 줄이기 위해 마스터에서는 GC를 끈 채로 로드
+gc.disable()
+
+
+def on_starting(server):
+    """
+    이전 실행에서 남은 메트릭 파일을 지웁니다.
+
+    설정 파일은 SIGHUP 재로드 때마다 다시 실행되므로, 실행 중인 워커의 파일까지
+    지우지 않도록 마스터가 처음 시작할 때 한 번만 정리합니다.
+    """
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    for name in os.listdir(directory):
+        if name.endswith(".db"):
+            os.remove(os.path.join(directory, name))
+
+
+def when_ready(server):
+    """fork 전에 로드된 객체를 GC 대상에서 제외해 워커의 copy-on-write를 방지"""
+    gc.freeze()
+    server.log.info("gc.freeze(): %d개 객체 고정", gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    """워커에서는 새로 만든 객체만 대상으로 GC를 다시 켭니다."""
+    gc.enable()
+
+    # 정적 모드는 데이터셋을 로드하지 않으므로 감시할 것이 없음
+    if os.environ.get("SERVING_MODE") == "static":
+        return
+
+    # 스레드는 fork 후에 남지 않으므로 데이터 폴더 감시는 워커마다 시작
+    from chart_specs import DATA_WATCH_INTERVAL, start_data_watcher
+
+    if DATA_WATCH_INTERVAL > 0:
+        start_data_watcher(DATA_WATCH_INTERVAL)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live 게이지 메트릭 파일을 정리합니다."""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
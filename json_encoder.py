@@ -0,0 +1,87 @@
+"""
+JSON 인코딩 유틸리티
+API 응답 직렬화에 orjson(C 구현)을 사용하고, 미설치 시 표준 json으로 대체합니다.
+
+NumPy/pandas 스칼라와 Series를 그대로 직렬화할 수 있고,
+NaN/Infinity는 표준 JSON에 없는 값이므로 null로 인코딩합니다.
+"""
+
+import json
+import math
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value):
+    """기본 인코더가 처리하지 못하는 NumPy/pandas 값을 변환합니다."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+
+    # pandas 객체는 pandas가 이미 import된 경우에만 있으므로 여기서 import하지 않음
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        if isinstance(value, pd.Series):
+            return value.to_dict()
+        if isinstance(value, pd.Index):
+            return value.tolist()
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        if value is pd.NA or value is pd.NaT:
+            return None
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def _key(key):
+    """dict 키를 표준 json이 받는 타입으로 변환합니다."""
+    if isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, (str, int, float, bool)) or key is None:
+        return key
+    return str(key)
+
+
+def _sanitize(value):
+    """표준 json용으로 NaN/Infinity는 None으로, NumPy/pandas 값은 기본 타입으로 바꿉니다."""
+    if isinstance(value, dict):
+        return {_key(key): _sanitize(child) for key, child in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_sanitize(child) for child in value]
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    return _sanitize(_default(value))
+
+
+def _stdlib_dumps(value, indent):
+    return json.dumps(
+        _sanitize(value),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=4 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def dumps(value, indent=False):
+    """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+    if orjson is None:
+        return _stdlib_dumps(value, indent)
+
+    option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(value, default=_default, option=option)
+    except orjson.JSONEncodeError:
+        # NumPy 정수 키처럼 orjson이 지원하지 않는 입력은 표준 json으로 처리
+        return _stdlib_dumps(value, indent)
@@ -0,0 +1,151 @@
+"""
+Prometheus 메트릭
+라우트별 요청 수/응답 시간/응답 크기, 캐시 계층별 적중/미스, 데이터셋 로드 시간/크기와
+하드코딩 데이터 대체 횟수를 수집해 /metrics에서 Prometheus 텍스트 형식으로 제공합니다.
+
+gunicorn처럼 워커 프로세스가 여러 개이면 PROMETHEUS_MULTIPROC_DIR 폴더에
+프로세스별 값을 기록하고 /metrics 요청 시 모든 프로세스의 값을 합산합니다.
+이 환경변수는 prometheus_client를 import하기 전에 설정되어 있어야 합니다
+(gunicorn.conf.py에서 설정).
+"""
+
+import os
+import threading
+
+from chart_specs import DATASET_LOAD_STATUS, add_load_listener, cache_stats
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # prometheus_client 미설치 시 메트릭 수집 안 함
+    REGISTRY = None
+
+# 라우트에 일치하지 않은 요청의 route 라벨 (잘못된 경로로 라벨 종류가 늘어나지 않게)
+UNMATCHED_ROUTE = "<unmatched>"
+
+if REGISTRY is not None:
+    REQUESTS = Counter(
+        "chart_api_requests_total",
+        "처리한 요청 수",
+        ["method", "route", "status"],
+    )
+    REQUEST_DURATION = Histogram(
+        "chart_api_request_duration_seconds",
+        "요청 처리 시간 (초)",
+        ["method", "route"],
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+    )
+    RESPONSE_SIZE = Histogram(
+        "chart_api_response_size_bytes",
+        "응답 본문 크기 (압축 후 바이트)",
+        ["route"],
+        buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    )
+    CACHE_REQUESTS = Counter(
+        "chart_api_cache_requests_total",
+        "캐시 계층별 조회 수 (result: hit/miss)",
+        ["cache", "result"],
+    )
+    DATASET_LOAD_DURATION = Histogram(
+        "chart_api_dataset_load_duration_seconds",
+        "데이터셋 로드 시간 (초)",
+        ["dataset"],
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10),
+    )
+    DATASET_SIZE = Gauge(
+        "chart_api_dataset_size_bytes",
+        "마지막으로 로드한 데이터셋의 JSON 크기 (바이트)",
+        ["dataset"],
+        multiprocess_mode="livemax",
+    )
+    DATASET_FALLBACKS = Counter(
+        "chart_api_dataset_fallback_total",
+        "CSV 대신 하드코딩된 데이터로 대체한 횟수",
+        ["dataset", "reason"],
+    )
+
+# {캐시 계층 이름: (적중 수, 미스 수)}를 반환하는 함수 목록
+_cache_sources = []
+# 이 프로세스에서 마지막으로 반영한 계층별 (적중 수, 미스 수)
+_cache_synced = {}
+_cache_lock = threading.Lock()
+
+
+def register_cache_stats(stats):
+    """적중/미스 수를 메트릭으로 내보낼 캐시 계층들의 통계 함수를 등록합니다."""
+    _cache_sources.append(stats)
+
+
+def sync_cache_counters():
+    """
+    등록된 캐시들의 적중/미스 수 증가분을 카운터에 반영합니다.
+
+    캐시는 각자 프로세스 메모리의 정수로 세고 있으므로 요청이 끝날 때마다
+    증가분만 더해, 멀티프로세스 모드에서도 모든 워커의 합계가 집계되게 합니다.
+    """
+    if REGISTRY is None:
+        return
+    with _cache_lock:
+        layers = {}
+        for stats in _cache_sources:
+            layers.update(stats())
+        for name, (hits, misses) in layers.items():
+            last_hits, last_misses = _cache_synced.get(name, (0, 0))
+            # 캐시를 비워 카운트가 줄어든 경우는 새로 센 값만 반영
+            if hits > last_hits:
+                CACHE_REQUESTS.labels(name, "hit").inc(hits - last_hits)
+            if misses > last_misses:
+                CACHE_REQUESTS.labels(name, "miss").inc(misses - last_misses)
+            _cache_synced[name] = (hits, misses)
+
+
+def observe_request(method, route, status, duration, size=None):
+    """요청 하나의 처리 결과를 기록합니다 (size가 None이면 크기는 기록하지 않음)."""
+    if REGISTRY is None:
+        return
+    route = route or UNMATCHED_ROUTE
+    REQUESTS.labels(method, route, str(status)).inc()
+    REQUEST_DURATION.labels(method, route).observe(duration)
+    if size is not None:
+        RESPONSE_SIZE.labels(route).observe(size)
+    sync_cache_counters()
+
+
+def record_dataset_load(name, status):
+    """데이터셋 로드 결과를 기록합니다 (chart_specs 로드 리스너)."""
+    if REGISTRY is None:
+        return
+    DATASET_LOAD_DURATION.labels(name).observe(status["duration_ms"] / 1000)
+    DATASET_SIZE.labels(name).set(status["size_bytes"])
+    if status["fallback_reason"] is not None:
+        # 예외 메시지는 라벨 종류를 늘리므로 사유 종류만 사용
+        reason = status["fallback_reason"].split(":", 1)[0]
+        DATASET_FALLBACKS.labels(name, reason).inc()
+
+
+def render_metrics():
+    """Prometheus 텍스트 형식의 메트릭 (본문 바이트, Content-Type)을 반환합니다."""
+    if REGISTRY is None:
+        return None, None
+    sync_cache_counters()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+# 데이터셋 로드 기록 (import 전에 끝난 최초 로드도 반영)과 공용 캐시 계층 등록
+add_load_listener(record_dataset_load)
+for _name, _status in DATASET_LOAD_STATUS.items():
+    record_dataset_load(_name, _status)
+register_cache_stats(cache_stats)
@@ -0,0 +1,269 @@
+"""
+요청 프로파일링
+운영 중인 서버에서 느린 요청의 실제 호출 경로를 확인하기 위한 WSGI 미들웨어입니다.
+
+- 요청별 프로파일링: PROFILE_ADMIN_KEY를 X-Admin-Key 헤더로 보내고
+  ?profile=1 (또는 X-Profile 헤더)을 지정하면 그 요청을 프로파일러로 실행하고
+  응답 본문 대신 결과를 text/plain으로 반환합니다. 결과 파일은 PROFILE_DIR에 저장합니다.
+  - profile=1, profile=pstats: cProfile 누적 시간 순 상위 함수 (.prof 파일은
+    `python -m pstats`, snakeviz로 열 수 있음)
+  - profile=folded: 호출 스택별 자기 시간(마이크로초)의 folded 형식
+    (flamegraph.pl, speedscope로 플레임그래프를 그릴 수 있음)
+- 샘플링: PROFILE_SAMPLE_RATE(0~1) 비율의 API 요청을 cProfile로 실행해
+  .prof 파일로 저장합니다 (응답은 그대로). 파일은 응답 전송이 끝난 뒤 쓰고,
+  폴더에는 최근 PROFILE_MAX_FILES개만 남깁니다.
+
+관리자 키가 설정되지 않았거나 일치하지 않으면 profile 파라미터는 무시합니다.
+응답이 끝나지 않는 SSE(/api/events)는 프로파일링하지 않습니다.
+"""
+
+import cProfile
+import hmac
+import io
+import itertools
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from werkzeug.wrappers import Request
+
+from rate_limit import LIMITED_PATH_PREFIX, LONG_LIVED_PATHS
+
+PROFILE_ADMIN_KEY = os.environ.get("PROFILE_ADMIN_KEY", "")
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "/tmp/chart-api-profiles")
+PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", "50"))
+
+# pstats 결과에 표시할 함수 수
+PROFILE_REPORT_LIMIT = 50
+
+PROFILE_FORMATS = ("pstats", "folded")
+_ARTIFACT_SUFFIXES = (".prof", ".folded")
+
+
+class StackProfiler:
+    """
+    sys.setprofile로 현재 스레드의 호출 스택별 자기 시간(self time)을 모읍니다.
+
+    샘플링이 아니라 모든 호출을 기록하므로 짧은 요청도 정확한 스택이 나오지만,
+    오버헤드가 커서 요청별 프로파일링에만 사용합니다.
+    """
+
+    def __init__(self):
+        self.stacks = Counter()
+        # [프레임 이름, 시작 시각, 하위 호출 시간]
+        self._stack = []
+
+    @staticmethod
+    def _label(frame, event, arg):
+        if event == "c_call":
+            module = getattr(arg, "__module__", None) or "builtins"
+            return f"{module}.{arg.__qualname__}"
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+    def _callback(self, frame, event, arg):
+        now = time.perf_counter()
+        if event in ("call", "c_call"):
+            self._stack.append([self._label(frame, event, arg), now, 0.0])
+            return
+        # 프로파일링 시작 전에 호출된 함수의 반환은 무시
+        if not self._stack:
+            return
+        label, started, children = self._stack.pop()
+        elapsed = now - started
+        path = ";".join(item[0] for item in self._stack)
+        self.stacks[f"{path};{label}" if path else label] += elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def enable(self):
+        sys.setprofile(self._callback)
+
+    def disable(self):
+        sys.setprofile(None)
+
+    def folded(self):
+        """folded 형식 ("함수;함수;함수 마이크로초" 한 줄씩, 시간 내림차순)"""
+        return "".join(
+            f"{stack} {round(seconds * 1_000_000)}\n"
+            for stack, seconds in self.stacks.most_common()
+            if seconds > 0
+        )
+
+
+class ProfilingMiddleware:
+    """관리자 키로 요청한 프로파일링과 일부 요청 샘플링을 처리하는 WSGI 미들웨어"""
+
+    def __init__(
+        self,
+        app,
+        admin_key=PROFILE_ADMIN_KEY,
+        sample_rate=PROFILE_SAMPLE_RATE,
+        directory=PROFILE_DIR,
+        max_files=PROFILE_MAX_FILES,
+    ):
+        self.app = app
+        self.admin_key = admin_key
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_files = max_files
+        self._counter = itertools.count()
+        self._rotate_lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if path in LONG_LIVED_PATHS:
+            return self.app(environ, start_response)
+
+        profile_format = self.requested_format(environ)
+        if profile_format is not None:
+            return self._profile_request(environ, start_response, profile_format)
+        if (
+            self.sample_rate > 0
+            and path.startswith(LIMITED_PATH_PREFIX)
+            and random.random() < self.sample_rate
+        ):
+            return self._sample_request(environ, start_response)
+        return self.app(environ, start_response)
+
+    def requested_format(self, environ):
+        """관리자 키와 함께 프로파일링을 요청했으면 결과 형식을 반환합니다 (아니면 None)."""
+        if not self.admin_key:
+            return None
+        # 대부분의 요청은 쿼리 문자열을 파싱하지 않고 넘김
+        if (
+            "profile=" not in environ.get("QUERY_STRING", "")
+            and "HTTP_X_PROFILE" not in environ
+        ):
+            return None
+
+        request = Request(environ)
+        value = request.args.get("profile") or request.headers.get("X-Profile")
+        if not value or value == "0":
+            return None
+        admin_key = request.headers.get("X-Admin-Key", "")
+        if not hmac.compare_digest(admin_key.encode(), self.admin_key.encode()):
+            return None
+        return value if value in PROFILE_FORMATS else "pstats"
+
+    def _profile_request(self, environ, start_response, profile_format):
+        """요청을 끝까지 실행하며 프로파일링하고, 응답 대신 결과를 반환합니다."""
+        captured = {}
+        chunks = []
+
+        def capture_response(status, headers, exc_info=None):
+            captured["status"] = status
+            return chunks.append
+
+        profiler = cProfile.Profile() if profile_format == "pstats" else StackProfiler()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            result = self.app(environ, capture_response)
+            try:
+                # 스트리밍 응답도 본문 생성이 끝날 때까지 실행
+                for chunk in result:
+                    chunks.append(chunk)
+            finally:
+                if hasattr(result, "close"):
+                    result.close()
+        finally:
+            profiler.disable()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if profile_format == "pstats":
+            report = io.StringIO()
+            stats = pstats.Stats(profiler, stream=report)
+            stats.sort_stats("cumulative").print_stats(PROFILE_REPORT_LIMIT)
+            body = report.getvalue()
+            path = self._save(environ, ".prof", profiler.dump_stats)
+        else:
+            body = profiler.folded()
+            path = self._save(environ, ".folded", _text_writer(body))
+
+        summary = (
+            f"# {environ.get('REQUEST_METHOD')} {environ.get('PATH_INFO')}"
+            f" -> {captured.get('status')}"
+            f" ({elapsed_ms:.1f} ms, {sum(map(len, chunks))} bytes)\n"
+            f"# {path}\n"
+        )
+        # folded 형식은 그대로 플레임그래프 도구에 넣을 수 있게 요약을 붙이지 않음
+        body = (summary + body if profile_format == "pstats" else body).encode()
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "text/plain; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+                ("Cache-Control", "no-store"),
+                ("X-Profiled-Status", captured.get("status", "")),
+                ("X-Profile-Artifact", os.path.basename(path)),
+            ],
+        )
+        return [body]
+
+    def _sample_request(self, environ, start_response):
+        """응답은 그대로 보내고, 전송이 끝나면 프로파일 결과를 파일로 저장합니다."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            result = self.app(environ, start_response)
+        except BaseException:
+            profiler.disable()
+            raise
+        return self._iter_sampled(environ, result, profiler)
+
+    def _iter_sampled(self, environ, result, profiler):
+        try:
+            yield from result
+        finally:
+            try:
+                if hasattr(result, "close"):
+                    result.close()
+            finally:
+                profiler.disable()
+                self._save(environ, ".prof", profiler.dump_stats)
+
+    def _save(self, environ, suffix, write):
+        """결과 파일을 저장하고 오래된 파일을 정리합니다 (저장한 경로 반환)."""
+        os.makedirs(self.directory, exist_ok=True)
+        route = re.sub(r"[^0-9A-Za-z]+", "_", environ.get("PATH_INFO", "")).strip("_")
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(self._counter)}"
+            f"-{route[:60] or 'root'}{suffix}"
+        )
+        path = os.path.join(self.directory, name)
+        write(path)
+        self._rotate()
+        return path
+
+    def _rotate(self):
+        """최근 max_files개만 남기고 오래된 결과 파일을 지웁니다."""
+        with self._rotate_lock:
+            artifacts = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(_ARTIFACT_SUFFIXES):
+                    try:
+                        artifacts.append((entry.stat().st_mtime_ns, entry.path))
+                    except FileNotFoundError:  # 다른 워커가 먼저 지움
+                        continue
+            artifacts.sort()
+            for _, path in artifacts[: max(0, len(artifacts) - self.max_files)]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+def _text_writer(text):
+    def write(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    return write
@@ -0,0 +1,190 @@
+"""
+요청 제한 유틸리티
+API 키 확인, 키별 토큰 버킷 속도 제한, 전체 동시 처리 수 제한(부하 차단)을 제공합니다.
+
+제한 상태는 프로세스 메모리에 있으므로 워커가 여러 개면 워커별로 적용됩니다.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# 제한을 적용할 경로 (헬스 체크, 문서 등은 제외)
+LIMITED_PATH_PREFIX = "/api/"
+
+# 연결이 오래 유지되어 동시 처리 수에 포함하지 않는 경로 (SSE)
+LONG_LIVED_PATHS = ("/api/events",)
+
+# 동시 처리 수 초과 시 재시도 안내 시간 (초)
+OVERLOAD_RETRY_AFTER = 1
+
+# 요청을 거절할 때의 상태 코드, 메시지, Retry-After(초, 없으면 None)
+Rejection = namedtuple("Rejection", ["status", "message", "retry_after"])
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def consume(self, now):
+        """토큰 하나를 사용합니다. 부족하면 다음 토큰까지 기다릴 시간(초)을 반환합니다."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def parse_quotas(value):
+    """'batch=2/10,dashboard=50/100' 형태를 {키: (초당 요청 수, 버스트)}로 변환합니다."""
+    quotas = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        key, _, quota = item.partition("=")
+        rate, _, burst = quota.partition("/")
+        rate = float(rate)
+        quotas[key.strip()] = (rate, int(burst) if burst else max(1, math.ceil(rate)))
+    return quotas
+
+
+class RateLimiter:
+    """
+    키별 토큰 버킷으로 요청 속도를 제한합니다.
+
+    키마다 quotas에 지정한 (초당 요청 수, 버스트)를, 없으면 기본값을 사용합니다.
+    초당 요청 수가 0 이하이면 제한하지 않습니다. 버킷은 최근 사용 순으로
+    max_buckets개까지만 보관합니다.
+    """
+
+    def __init__(self, default_quota=(0, 0), quotas=None, max_buckets=10000):
+        self.default_quota = default_quota
+        self.quotas = quotas or {}
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key):
+        """요청을 허용하면 0, 아니면 Retry-After로 안내할 대기 시간(초)을 반환합니다."""
+        rate, burst = self.quotas.get(key, self.default_quota)
+        if rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst, now)
+                while len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket.consume(now)
+
+
+class ConcurrencyLimiter:
+    """동시에 처리 중인 요청 수를 제한합니다 (limit이 0 이하이면 제한 없음)."""
+
+    def __init__(self, limit=0):
+        self.limit = limit
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """처리 슬롯을 얻으면 True, 가득 찼으면 기다리지 않고 False를 반환합니다."""
+        with self._lock:
+            if 0 < self.limit <= self.active:
+                return False
+            self.active += 1
+            return True
+
+    def release(self):
+        """처리 슬롯을 반환합니다."""
+        with self._lock:
+            self.active -= 1
+
+
+class AccessController:
+    """
+    API 요청의 키 확인, 속도 제한, 동시 처리 수 제한을 함께 처리합니다.
+
+    api_keys가 비어 있으면 키를 요구하지 않고, 속도 제한은 quotas에 있는 키면
+    키별로, 아니면 클라이언트 주소별로 적용합니다.
+    """
+
+    def __init__(self, api_keys=(), rate_limiter=None, concurrency_limiter=None):
+        self.api_keys = frozenset(api_keys)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.concurrency_limiter = concurrency_limiter or ConcurrencyLimiter()
+
+    @classmethod
+    def from_env(cls):
+        """
+        환경변수로 설정합니다.
+
+        - API_KEYS: 허용할 API 키 (쉼표 구분, 비우면 키 확인 안 함)
+        - RATE_LIMIT_PER_SECOND / RATE_LIMIT_BURST: 기본 초당 요청 수와 버스트 (0이면 제한 없음)
+        - API_KEY_QUOTAS: 키별 할당량 (예: batch=2/10,dashboard=50/100)
+        - MAX_CONCURRENT_REQUESTS: 전체 동시 처리 요청 수 (0이면 제한 없음)
+        """
+        rate = float(os.environ.get("RATE_LIMIT_PER_SECOND", "0"))
+        burst = int(os.environ.get("RATE_LIMIT_BURST", "0")) or max(1, math.ceil(rate))
+        return cls(
+            api_keys=[
+                key.strip()
+                for key in os.environ.get("API_KEYS", "").split(",")
+                if key.strip()
+            ],
+            rate_limiter=RateLimiter(
+                (rate, burst), parse_quotas(os.environ.get("API_KEY_QUOTAS", ""))
+            ),
+            concurrency_limiter=ConcurrencyLimiter(
+                int(os.environ.get("MAX_CONCURRENT_REQUESTS", "0"))
+            ),
+        )
+
+    @staticmethod
+    def applies_to(path):
+        """제한을 적용할 경로인지 확인합니다."""
+        return path.startswith(LIMITED_PATH_PREFIX)
+
+    @staticmethod
+    def holds_slot(path):
+        """동시 처리 수에 포함할 경로인지 확인합니다."""
+        return path not in LONG_LIVED_PATHS
+
+    def check(self, api_key, client_addr):
+        """API 키와 속도 제한을 확인합니다 (통과하면 None, 아니면 Rejection)."""
+        if self.api_keys and api_key not in self.api_keys:
+            return Rejection(401, "유효한 X-API-KEY 헤더가 필요합니다", None)
+
+        if self.api_keys or api_key in self.rate_limiter.quotas:
+            key = api_key
+        else:
+            key = f"addr:{client_addr}"
+        retry_after = self.rate_limiter.check(key)
+        if retry_after:
+            return Rejection(
+                429, "요청 한도를 초과했습니다. 잠시 후 다시 시도하세요", math.ceil(retry_after)
+            )
+        return None
+
+    def acquire(self):
+        """처리 슬롯을 얻습니다 (얻으면 None, 가득 찼으면 Rejection)."""
+        if self.concurrency_limiter.try_acquire():
+            return None
+        return Rejection(503, "서버가 요청을 처리할 수 없습니다. 잠시 후 다시 시도하세요", OVERLOAD_RETRY_AFTER)
+
+    def release(self):
+        """acquire로 얻은 처리 슬롯을 반환합니다."""
+        self.concurrency_limiter.release()
@@ -0,0 +1,160 @@
+"""
+API 응답 가공 유틸리티
+차트 사양/데이터 응답을 직렬화하기 전에 가공하는 함수들을 제공합니다.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+
+# 경로 끝(해당 필드 전체 포함)을 나타내는 표식
+_WHOLE = None
+
+# 필드가 존재하지 않아 응답에서 제외됨을 나타내는 표식
+_MISSING = object()
+
+
+def parse_field_paths(fields_param):
+    """'data.datasets,options.plugins.title' 형태의 문자열을 경로 목록으로 변환합니다."""
+    paths = []
+    for raw_path in fields_param.split(","):
+        path = tuple(key for key in raw_path.strip().split(".") if key)
+        if path:
+            paths.append(path)
+    return paths
+
+
+def _build_field_tree(paths):
+    """경로 목록을 중첩 dict 트리로 변환합니다 (리프는 _WHOLE)."""
+    tree = {}
+    for path in paths:
+        node = tree
+        for depth, key in enumerate(path):
+            if key in node and node[key] is _WHOLE:
+                # 상위 경로가 이미 전체 포함으로 지정됨
+                break
+            if depth == len(path) - 1:
+                node[key] = _WHOLE
+            else:
+                node = node.setdefault(key, {})
+    return tree
+
+
+def _merge_field_trees(left, right):
+    """두 필드 트리를 합칩니다 (와일드카드와 명시적 키가 동시에 일치할 때 사용)."""
+    if left is _WHOLE or right is _WHOLE:
+        return _WHOLE
+
+    merged = dict(left)
+    for key, subtree in right.items():
+        merged[key] = (
+            _merge_field_trees(merged[key], subtree) if key in merged else subtree
+        )
+    return merged
+
+
+def _prune(value, tree):
+    """필드 트리에 해당하는 부분만 남긴 새 객체를 반환합니다."""
+    if tree is _WHOLE:
+        return value
+
+    # 리스트는 각 원소에 같은 경로를 적용 (예: data.datasets.data)
+    if isinstance(value, list):
+        pruned_items = [_prune(item, tree) for item in value]
+        return [item for item in pruned_items if item is not _MISSING]
+
+    # 스칼라 값 아래로는 더 이상 경로를 따라갈 수 없음
+    if not isinstance(value, dict):
+        return _MISSING
+
+    result = {}
+    for key, child in value.items():
+        subtrees = [
+            tree[candidate] for candidate in (str(key), "*") if candidate in tree
+        ]
+        if not subtrees:
+            continue
+
+        subtree = subtrees[0]
+        for other in subtrees[1:]:
+            subtree = _merge_field_trees(subtree, other)
+
+        pruned = _prune(child, subtree)
+        if pruned is not _MISSING:
+            result[key] = pruned
+    return result
+
+
+def project_fields(payload, paths):
+    """
+    응답에서 지정한 경로의 필드만 남긴 새 객체를 반환합니다.
+
+    경로는 점(.)으로 구분하며, "*"는 해당 위치의 모든 키와 일치합니다.
+    리스트를 만나면 각 원소에 남은 경로를 적용합니다. 원본 객체는 수정하지 않습니다.
+    """
+    if not paths:
+        return payload
+
+    pruned = _prune(payload, _build_field_tree(paths))
+    return {} if pruned is _MISSING else pruned
+
+
+def _exclude(value, tree):
+    """필드 트리에 해당하는 부분을 뺀 새 객체를 반환합니다."""
+    if isinstance(value, list):
+        return [_exclude(item, tree) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    result = {}
+    for key, child in value.items():
+        subtrees = [
+            tree[candidate] for candidate in (str(key), "*") if candidate in tree
+        ]
+        if not subtrees:
+            result[key] = child
+        elif _WHOLE not in subtrees:
+            subtree = subtrees[0]
+            for other in subtrees[1:]:
+                subtree = _merge_field_trees(subtree, other)
+            result[key] = _exclude(child, subtree)
+    return result
+
+
+def exclude_fields(payload, paths):
+    """project_fields의 반대로, 지정한 경로의 필드를 뺀 새 객체를 반환합니다."""
+    if not paths:
+        return payload
+    return _exclude(payload, _build_field_tree(paths))
+
+
+def content_hash(payload):
+    """응답 객체의 내용 해시를 계산합니다 (키 순서와 무관)."""
+    encoded = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(version, offset):
+    """데이터 버전과 다음 페이지 시작 위치를 불투명한 커서 문자열로 만듭니다."""
+    raw = f"{version}:{offset}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (데이터 버전, 시작 위치)로 해석합니다. 형식이 틀리면 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, _, offset = (
+            base64.urlsafe_b64decode(padded).decode("ascii").partition(":")
+        )
+        offset = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"잘못된 커서: {cursor}")
+
+    if not version or offset < 0:
+        raise ValueError(f"잘못된 커서: {cursor}")
+    return version, offset
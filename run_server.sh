@@ -1,4 +1,8 @@
 #!/bin/bash
+# 사용법: ./run_server.sh          # 개발 서버 (Flask)
+#        ./run_server.sh --prod   # 프로덕션 서버 (gunicorn)
+
+PORT=${PORT:-5001}
 
 echo "🚀 가맹점수 분석 차트 API 서버 시작..."
 echo ""
@@ -18,11 +22,15 @@ fi
 
 # 서버 실행
 echo "🌐 서버 시작 중..."
-echo "📍 서버 주소: http://localhost:5000"
-echo "📊 API 문서: http://localhost:5000/"
-echo "💚 헬스 체크: http://localhost:5000/health"
+echo "📍 서버 주소: http://localhost:${PORT}"
+echo "📊 API 문서: http://localhost:${PORT}/"
+echo "💚 헬스 체크: http://localhost:${PORT}/health"
 echo ""
 echo "🛑 서버 중지: Ctrl+C"
 echo ""
 
-python app.py
+if [ "$1" = "--prod" ]; then
+    PORT=${PORT} exec gunicorn --config gunicorn.conf.py wsgi:app
+else
+    python app.py --port "${PORT}"
+fi
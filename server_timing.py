@@ -0,0 +1,127 @@
+"""
+Server-Timing 헤더
+요청 처리 단계별 소요 시간을 모아 Server-Timing 응답 헤더로 내보냅니다.
+
+브라우저 개발자 도구(Network → Timing)와 접근 로그에서 느린 요청이
+차트 사양 생성과 JSON 인코딩 중 어디에서 시간을 쓰는지 확인할 수 있습니다.
+
+- dispatch: 요청 수신부터 응답 본문(dict)이 준비될 때까지 (아래 단계 포함)
+- cache-hit / cache-miss: 차트 사양 캐시 조회
+- build, build-<라이브러리>-<차트 타입>: 차트 사양 생성 함수 실행
+- dataset: 데이터셋 가공 (다운샘플링, 상위 N 묶기, 페이지 행 조회)
+- encode: JSON 직렬화
+- compress: gzip/brotli 압축
+- total: 응답 헤더를 보내기 직전까지의 전체 시간
+
+같은 단계가 여러 번 실행되면 (예: type=all의 차트별 생성) 시간을 합산하고
+횟수를 desc에 표시합니다. 기록은 요청별 컨텍스트 변수에 하므로
+기록 중인 요청이 없으면 (배치 빌드, 예열 등) 아무것도 하지 않습니다.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# 0이면 Server-Timing 헤더를 붙이지 않음 (내부 처리 시간을 노출하고 싶지 않은 경우)
+SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING", "1") == "1"
+
+_current = contextvars.ContextVar("server_timing", default=None)
+
+
+class ServerTiming:
+    """한 요청의 단계별 (합계 시간, 실행 횟수)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._stages = {}
+        # 비동기 서버에서는 한 요청의 차트들을 여러 스레드에서 동시에 생성
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        """name 단계에 걸린 시간을 더합니다."""
+        with self._lock:
+            stage = self._stages.setdefault(name, [0.0, 0])
+            stage[0] += seconds
+            stage[1] += 1
+
+    def stages(self):
+        """기록 순서대로 {단계: (합계 ms, 횟수)}를 반환합니다."""
+        with self._lock:
+            return {
+                name: (round(seconds * 1000, 3), count)
+                for name, (seconds, count) in self._stages.items()
+            }
+
+    def header_value(self):
+        """Server-Timing 헤더 값 (마지막에 지금까지의 total 추가)"""
+        parts = []
+        for name, (duration, count) in self.stages().items():
+            part = f"{name};dur={duration}"
+            if count > 1:
+                part += f";desc=x{count}"
+            parts.append(part)
+        total = round((time.perf_counter() - self.started) * 1000, 3)
+        parts.append(f"total;dur={total}")
+        return ", ".join(parts)
+
+
+def start():
+    """현재 요청의 단계별 시간 기록을 시작합니다 (비활성화되어 있으면 None)."""
+    if not SERVER_TIMING_ENABLED:
+        return None
+    timing = ServerTiming()
+    _current.set(timing)
+    return timing
+
+
+def stop():
+    """현재 요청의 기록을 끝내고 기록 객체를 반환합니다 (없으면 None)."""
+    timing = _current.get()
+    _current.set(None)
+    return timing
+
+
+def record(name, started=None):
+    """started(perf_counter, 생략 시 요청 시작)부터 지금까지의 시간을 기록합니다."""
+    timing = _current.get()
+    if timing is not None:
+        if started is None:
+            started = timing.started
+        timing.add(name, time.perf_counter() - started)
+
+
+@contextmanager
+def stage(name):
+    """with 블록 실행 시간을 현재 요청의 name 단계에 기록합니다."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """함수 실행 시간을 현재 요청의 name 단계에 기록하는 데코레이터"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timing = _current.get()
+            if timing is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timing.add(name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,68 @@
+"""
+단일 실행(single-flight) 유틸리티
+같은 키의 계산이 동시에 여러 번 요청되면 하나만 실행하고 나머지는 그 결과를 기다립니다.
+"""
+
+import os
+import threading
+
+# 먼저 시작한 계산을 기다리는 최대 시간 (초)
+DEFAULT_TIMEOUT = float(os.environ.get("SINGLE_FLIGHT_TIMEOUT", "10"))
+
+
+class _Call:
+    """진행 중인 계산 하나의 완료 신호와 결과"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    키별로 동시에 하나의 계산만 실행합니다.
+
+    먼저 온 요청이 계산하는 동안 같은 키의 요청은 최대 timeout초 동안 결과를
+    기다리고, 계산이 실패하면 같은 예외를 받습니다. 기다리다 시간이 초과되면
+    (먼저 시작한 계산이 멈춘 경우 등) 직접 계산합니다.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def do(self, key, func, *args):
+        """key에 대한 func(*args) 결과를 반환합니다 (동시 요청은 한 번만 실행)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                with self._lock:
+                    self.timeouts += 1
+                return func(*args)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+정적 차트 사양 서버
+build_static.py로 미리 만든 chart_specs_json/의 파일을 그대로 전송합니다.
+
+요청마다 차트 사양을 만들거나 압축하지 않고 manifest.json에 기록된 파일과
+ETag, 미리 압축한 .gz/.br 파일을 send_file로 보내므로, pandas와 chart_specs를
+import하지 않아 메모리와 CPU를 거의 쓰지 않습니다 (엣지 복제 서버용).
+
+    SERVING_MODE=static gunicorn --config gunicorn.conf.py wsgi:app
+    python static_server.py --port 5001
+"""
+
+import json
+import os
+import threading
+
+from flask import Flask, jsonify, request, send_file
+from flask_cors import CORS
+
+from rate_limit import AccessController
+
+# 미리 만든 파일 폴더 (build_static.py --output과 같은 경로)
+STATIC_SPECS_DIR = os.environ.get("STATIC_SPECS_DIR", "chart_specs_json")
+MANIFEST_NAME = "manifest.json"
+
+# 파일 이름에 해시가 없는 API 경로이므로 짧게 캐시하고 ETag로 재검증
+STATIC_CACHE_MAX_AGE = int(os.environ.get("STATIC_CACHE_MAX_AGE", "60"))
+
+# 요청마다 결과가 달라져 미리 만들 수 없는 쿼리 파라미터
+DYNAMIC_PARAMS = ("fields", "max_points", "top", "stream", "limit", "cursor")
+
+
+class StaticManifest:
+    """
+    manifest.json을 읽어 API 경로별 파일 정보를 제공합니다.
+
+    빌드가 manifest를 원자적으로 교체하므로, 파일 수정 시각이 바뀌면 다시 읽어
+    서버를 재시작하지 않고도 새 빌드 결과를 제공합니다.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self._path = os.path.join(self.directory, MANIFEST_NAME)
+        self._mtime = None
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """최신 manifest를 반환합니다 (파일이 없으면 None)."""
+        try:
+            mtime = os.stat(self._path).st_mtime_ns
+        except OSError:
+            return None
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    with open(self._path, encoding="utf-8") as f:
+                        self._manifest = json.load(f)
+                    self._mtime = mtime
+        return self._manifest
+
+    def get(self, key):
+        """API 경로 키(예: charts/echarts/line)의 파일 정보를 반환합니다."""
+        manifest = self.load()
+        if manifest is None:
+            return None
+        return manifest["files"].get(key)
+
+
+app = Flask(__name__)
+CORS(app)  # CORS 활성화
+app.json.ensure_ascii = False
+
+MANIFEST = StaticManifest(STATIC_SPECS_DIR)
+
+# API 키 확인과 키별 속도 제한 (app.py와 같은 환경변수로 설정)
+ACCESS_CONTROL = AccessController.from_env()
+
+
+def error_response(status, message):
+    """app.py(flask-restx)와 같은 형식의 에러 응답"""
+    response = jsonify({"message": message})
+    response.status_code = status
+    return response
+
+
+@app.before_request
+def enforce_access_limits():
+    """API 키와 요청 한도를 확인합니다 (파일 전송은 가벼워 동시 처리 수는 제한하지 않음)."""
+    if not ACCESS_CONTROL.applies_to(request.path):
+        return None
+
+    rejection = ACCESS_CONTROL.check(
+        request.headers.get("X-API-KEY"), request.remote_addr
+    )
+    if rejection is None:
+        return None
+    response = error_response(rejection.status, rejection.message)
+    if rejection.retry_after is not None:
+        response.headers["Retry-After"] = str(rejection.retry_after)
+    return response
+
+
+def send_prerendered(key):
+    """
+    미리 만든 파일을 전송합니다.
+
+    Accept-Encoding에 맞는 압축 파일이 있으면 그 파일을 보내고,
+    인코딩별로 바이트가 다르므로 ETag에 인코딩을 붙여 구분합니다.
+    """
+    for param in DYNAMIC_PARAMS:
+        if param in request.args:
+            return error_response(400, f"정적 모드에서는 지원하지 않는 파라미터: {param}")
+
+    item = MANIFEST.get(key)
+    if item is None:
+        if MANIFEST.load() is None:
+            return error_response(503, "미리 만든 차트 사양이 없습니다")
+        return error_response(404, f"찾을 수 없는 리소스: /api/{key}")
+
+    path, etag = item["path"], item["etag"]
+    encoding = request.accept_encodings.best_match(tuple(item["encodings"]))
+    if encoding is not None:
+        path = item["encodings"][encoding]["path"]
+        etag = f"{etag}-{encoding}"
+
+    response = send_file(
+        os.path.join(MANIFEST.directory, path),
+        mimetype="application/json",
+        etag=etag,
+        max_age=STATIC_CACHE_MAX_AGE,
+        conditional=True,
+    )
+    # 해시가 들어간 내부 파일 이름은 노출하지 않음
+    response.headers.pop("Content-Disposition", None)
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@app.route("/api/charts/")
+def all_charts():
+    """모든 차트 라이브러리의 사양을 반환"""
+    return send_prerendered("charts")
+
+
+@app.route("/api/charts/<library>")
+def library_charts(library):
+    """특정 라이브러리의 차트 사양 (type 지정 시 해당 차트만) 반환"""
+    chart_type = request.args.get("type", "all")
+    if MANIFEST.get(f"charts/{library}/{chart_type}") is not None:
+        return send_prerendered(f"charts/{library}/{chart_type}")
+    return send_prerendered(f"charts/{library}")
+
+
+@app.route("/api/charts/<library>/<chart_type>")
+def specific_chart(library, chart_type):
+    """특정 라이브러리의 특정 차트 사양 반환"""
+    return send_prerendered(f"charts/{library}/{chart_type}")
+
+
+@app.route("/api/data/")
+def chart_data():
+    """원본 차트 데이터 반환"""
+    data_type = request.args.get("type", "all")
+    if MANIFEST.get(f"data/{data_type}") is not None:
+        return send_prerendered(f"data/{data_type}")
+    return send_prerendered("data")
+
+
+@app.route("/health")
+def health_check():
+    """헬스 체크 엔드포인트 (manifest가 없으면 503)"""
+    manifest = MANIFEST.load()
+    if manifest is None:
+        return error_response(503, "미리 만든 차트 사양이 없습니다")
+    return jsonify(
+        {
+            "status": "healthy",
+            "service": "chart-api-server",
+            "mode": "static",
+            "data_version": manifest["data_version"],
+            "generated_at": manifest["generated_at"],
+        }
+    )
+
+
+@app.route("/health/live")
+def liveness_check():
+    """프로세스가 요청에 응답할 수 있는지 확인하는 엔드포인트"""
+    return jsonify({"status": "alive", "service": "chart-api-server", "mode": "static"})
+
+
+@app.route("/health/ready")
+def readiness_check():
+    """미리 만든 파일(manifest)이 있어 트래픽을 받을 수 있는지 확인하는 엔드포인트"""
+    response = health_check()
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@app.errorhandler(404)
+def not_found(error):
+    return error_response(404, "찾을 수 없는 경로입니다")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="가맹점수 분석 차트 API 정적 서버")
+    parser.add_argument("--host", default="0.0.0.0", help="호스트 주소 (기본값: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=5001, help="포트 번호 (기본값: 5001)")
+    args = parser.parse_args()
+
+    print("🚀 가맹점수 분석 차트 API 정적 서버 시작...")
+    print(f"📁 차트 사양 폴더: {MANIFEST.directory}")
+    print(f"\n🌐 서버가 http://{args.host}:{args.port} 에서 실행됩니다.")
+
+    app.run(host=args.host, port=args.port)
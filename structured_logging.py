@@ -0,0 +1,131 @@
+"""
+구조화 로깅
+chart_api.* 로거의 기록을 JSON 한 줄(또는 사람이 읽는 텍스트)로 출력합니다.
+
+로거는 QueueHandler로 기록을 큐에 넣기만 하고, 포맷과 출력은 QueueListener의
+별도 스레드가 처리하므로 부하가 높아도 요청 스레드가 로그 출력에 막히지 않습니다.
+extra로 넘긴 필드(dataset, files, rows, duration_ms 등)는 JSON의 최상위 키가 됩니다.
+
+    LOG_FORMAT=json|text (기본값 json), LOG_LEVEL=INFO
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = "chart_api"
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+
+# extra 필드와 구분하기 위한 LogRecord 기본 속성
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """로그 기록을 JSON 한 줄로 변환합니다 (extra 필드 포함)."""
+
+    def format(self, record):
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    기록을 큐에 넣는 핸들러
+
+    기본 QueueHandler는 큐에 넣기 전에 예외 traceback을 메시지에 합치므로,
+    JSON의 exception 필드로 따로 남길 수 있게 traceback 문자열만 미리 만들어 둡니다.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_handler = None
+_listener = None
+_configure_lock = threading.Lock()
+
+
+def _output_handler(stream):
+    handler = logging.StreamHandler(stream)
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+    return handler
+
+
+def _start_listener(output):
+    global _listener
+    log_queue = queue.SimpleQueue()  # 크기 제한이 없어 put이 막히지 않음
+    _handler.queue = log_queue
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def _restart_after_fork():
+    """fork된 자식 프로세스(gunicorn 워커 등)에서는 출력 스레드를 새로 시작합니다."""
+    if _listener is not None:
+        _start_listener(*_listener.handlers)
+
+
+def _stop_listener():
+    """종료 시 큐에 남은 기록을 모두 출력합니다."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def configure_logging(stream=None):
+    """chart_api 로거에 큐 기반 출력을 설정합니다 (여러 번 호출해도 한 번만 설정)."""
+    global _handler
+    with _configure_lock:
+        if _handler is not None:
+            return
+        _handler = _NonBlockingQueueHandler(queue.SimpleQueue())
+        _start_listener(_output_handler(stream or sys.stderr))
+
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.addHandler(_handler)
+        logger.setLevel(LOG_LEVEL)
+        # 호스트(gunicorn, pytest 등)의 루트 로거 설정과 섞이지 않게 전파하지 않음
+        logger.propagate = False
+
+        atexit.register(_stop_listener)
+        os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def get_logger(name):
+    """chart_api.<name> 로거 (처음 호출 시 출력 설정)"""
+    configure_logging()
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
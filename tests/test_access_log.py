@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+gunicorn JSON 접근 로그 테스트 파일
+"""
+
+import io
+import json
+import os
+import sys
+import unittest
+from datetime import timedelta
+from types import SimpleNamespace
+
+from gunicorn.config import Config
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from access_log import JSONAccessLogger  # noqa: E402
+
+
+class TestJSONAccessLogger(unittest.TestCase):
+    """JSON 접근 로그 테스트 클래스"""
+
+    def test_escapes_atoms(self):
+        """경로/쿼리의 따옴표와 역슬래시가 있어도 올바른 JSON 한 줄인지 테스트"""
+        cfg = Config()
+        cfg.set("accesslog", "-")
+        logger = JSONAccessLogger(cfg)
+        output = io.StringIO()
+        for handler in logger.access_log.handlers:
+            handler.setStream(output)
+
+        response = SimpleNamespace(
+            status="200 OK",
+            sent=42,
+            headers=[("Server-Timing", "build;dur=1.5, total;dur=2.0")],
+        )
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "RAW_URI": '/api/data/"x\\y',
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "PATH_INFO": '/api/data/"x\\y',
+            "QUERY_STRING": 'fields=a"b\\c',
+            "REMOTE_ADDR": "127.0.0.1",
+        }
+        logger.access(response, [], environ, timedelta(milliseconds=12.5))
+
+        record = json.loads(output.getvalue())
+        self.assertEqual(record["path"], '/api/data/"x\\y')
+        self.assertEqual(record["query"], 'fields=a"b\\c')
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["bytes"], 42)
+        self.assertEqual(record["duration_ms"], 12.5)
+        self.assertEqual(record["server_timing"], "build;dur=1.5, total;dur=2.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,15 +4,32 @@ API 테스트 파일
 Flask 애플리케이션의 엔드포인트들을 테스트
 """
 
+import gzip
 import json
 import os
+import shutil
 import sys
+import tempfile
 import unittest
+from unittest import mock
+
+import numpy as np
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import app as app_module  # noqa: E402
+import chart_specs  # noqa: E402
+import json_encoder  # noqa: E402
 from app import app  # noqa: E402
+from chart_registry import CHART_REGISTRY  # noqa: E402
+from profiling import ProfilingMiddleware  # noqa: E402
+from rate_limit import (  # noqa: E402
+    AccessController,
+    ConcurrencyLimiter,
+    RateLimiter,
+    parse_quotas,
+)
 
 
 class TestAPI(unittest.TestCase):
@@ -30,6 +47,119 @@ class TestAPI(unittest.TestCase):
         data = json.loads(response.data)
         self.assertEqual(data["status"], "healthy")
 
+    def test_liveness_and_readiness(self):
+        """준비 상태가 사양 캐시 예열 여부와 데이터셋별 로드 상태를 반영하는지 테스트"""
+        self.assertEqual(self.app.get("/health/live").status_code, 200)
+
+        with mock.patch.object(chart_specs, "SPEC_CACHE_WARM_UP", None):
+            response = self.app.get("/health/ready")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.get_json()["status"], "not_ready")
+
+            chart_specs.warm_up_spec_cache()
+            response = self.app.get("/health/ready")
+            self.assertEqual(response.status_code, 200)
+            details = response.get_json()
+            self.assertEqual(details["spec_cache"]["charts"], len(CHART_REGISTRY))
+            self.assertEqual(set(details["datasets"]), set(chart_specs.DATASET_NAMES))
+
+            # CSV 없이 하드코딩된 데이터로 대체한 데이터셋은 사유와 함께 표시
+            status = details["datasets"]["line"]
+            self.assertIn("duration_ms", status)
+            if status["source"] == "hardcoded":
+                self.assertEqual(details["status"], "degraded")
+                self.assertEqual(status["fallback_reason"], "file_not_found")
+                with mock.patch.object(chart_specs, "REQUIRE_CSV_DATA", True):
+                    self.assertEqual(self.app.get("/health/ready").status_code, 503)
+
+    def test_metrics_endpoint(self):
+        """/metrics가 라우트별 요청 수, 캐시 적중/미스, 데이터셋 대체 횟수를 내보내는지 테스트"""
+        self.app.get("/api/charts/echarts/line")
+        response = self.app.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+
+        body = response.get_data(as_text=True)
+        self.assertIn('route="/api/charts/<library>/<chart_type>"', body)
+        self.assertIn('chart_api_cache_requests_total{cache="spec"', body)
+        self.assertIn("chart_api_dataset_load_duration_seconds", body)
+        if chart_specs.DATASET_LOAD_STATUS["line"]["source"] == "hardcoded":
+            fallback = 'dataset="line",reason="file_not_found"'
+            self.assertIn(f"chart_api_dataset_fallback_total{{{fallback}}}", body)
+
+    def test_server_timing_header(self):
+        """Server-Timing 헤더에 캐시 조회, 차트별 생성, 인코딩 시간이 기록되는지 테스트"""
+        CHART_REGISTRY.clear_cache()
+        response = self.app.get("/api/charts/chartjs?type=all")
+        stages = {
+            part.split(";")[0]: part
+            for part in response.headers["Server-Timing"].split(", ")
+        }
+        self.assertIn("cache-miss", stages)
+        self.assertIn("build-chartjs-line", stages)
+        self.assertIn("build-chartjs-yearly_trend", stages)
+        self.assertIn(
+            f";desc=x{len(CHART_REGISTRY.entries('chartjs'))}", stages["build"]
+        )
+        for name in ("dispatch", "encode", "total"):
+            self.assertIn(name, stages)
+
+        # 두 번째 요청은 캐시 적중이므로 생성 단계가 없음
+        response = self.app.get("/api/charts/chartjs?type=all")
+        self.assertIn("cache-hit", response.headers["Server-Timing"])
+        self.assertNotIn("build", response.headers["Server-Timing"])
+
+    def test_profiling_requires_admin_key(self):
+        """관리자 키가 있을 때만 profile 요청이 프로파일 결과를 반환하는지 테스트"""
+        profiles_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profiles_dir)
+        middleware = ProfilingMiddleware(
+            app.wsgi_app.app, admin_key="secret", directory=profiles_dir
+        )
+        with mock.patch.object(app, "wsgi_app", middleware):
+            client = app.test_client()
+            response = client.get("/api/charts/chartjs/line?profile=1")
+            self.assertEqual(response.mimetype, "application/json")
+
+            headers = {"X-Admin-Key": "secret"}
+            response = client.get("/api/charts/chartjs/line?profile=1", headers=headers)
+            self.assertEqual(response.mimetype, "text/plain")
+            self.assertEqual(response.headers["X-Profiled-Status"], "200 OK")
+            self.assertIn("function calls", response.get_data(as_text=True))
+            artifact = response.headers["X-Profile-Artifact"]
+            self.assertTrue(os.path.exists(os.path.join(profiles_dir, artifact)))
+
+            # folded 형식은 생성 함수가 포함된 호출 스택을 한 줄씩 반환
+            CHART_REGISTRY.clear_cache()
+            response = client.get(
+                "/api/charts/chartjs/line",
+                headers={**headers, "X-Profile": "folded"},
+            )
+            lines = response.get_data(as_text=True).splitlines()
+            self.assertTrue(
+                any("get_chartjs_line_chart_config" in line for line in lines)
+            )
+            self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+
+    def test_profiling_samples_into_rotating_files(self):
+        """샘플링된 요청은 응답을 그대로 보내고 최근 파일만 남기는지 테스트"""
+        profiles_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profiles_dir)
+        middleware = ProfilingMiddleware(
+            app.wsgi_app.app, sample_rate=1.0, directory=profiles_dir, max_files=2
+        )
+        with mock.patch.object(app, "wsgi_app", middleware):
+            client = app.test_client()
+            for _ in range(3):
+                response = client.get("/api/charts/echarts/bar")
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("series", response.get_json())
+            client.get("/health")
+
+        artifacts = os.listdir(profiles_dir)
+        self.assertEqual(len(artifacts), 2)
+        self.assertTrue(all(name.endswith(".prof") for name in artifacts))
+
     def test_chart_specs_endpoint(self):
         """차트 사양 엔드포인트 테스트"""
         response = self.app.get("/api/charts/")
@@ -50,6 +180,322 @@ class TestAPI(unittest.TestCase):
         response = self.app.get("/api/charts/nonexistent_chart")
         self.assertEqual(response.status_code, 404)
 
+    def test_fields_projection_specific_chart(self):
+        """?fields= 필드 선택 테스트"""
+        response = self.app.get(
+            "/api/charts/chartjs/bar?fields=data.datasets,options.plugins.title"
+        )
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(set(data), {"data", "options"})
+        self.assertEqual(set(data["data"]), {"datasets"})
+        self.assertEqual(set(data["options"]), {"plugins"})
+        self.assertEqual(set(data["options"]["plugins"]), {"title"})
+
+    def test_fields_projection_wildcard_and_lists(self):
+        """와일드카드와 리스트 원소에 대한 필드 선택 테스트"""
+        response = self.app.get("/api/charts/chartjs?fields=*.data.datasets.data")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertIn("area_population", data)
+        for spec in data.values():
+            self.assertEqual(set(spec), {"data"})
+            for dataset in spec["data"]["datasets"]:
+                self.assertEqual(set(dataset), {"data"})
+
+    def test_max_points_downsampling(self):
+        """max_points 다운샘플링 파라미터 테스트"""
+        response = self.app.get("/api/charts/chartjs/yearly_trend?max_points=4")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(len(data["data"]["labels"]), 4)
+        for dataset in data["data"]["datasets"]:
+            self.assertEqual(len(dataset["data"]), 4)
+
+        response = self.app.get("/api/charts/chartjs/yearly_trend?max_points=1")
+        self.assertEqual(response.status_code, 400)
+
+    def test_top_categories_rollup(self):
+        """top 파라미터의 기타 묶기 테스트"""
+        response = self.app.get("/api/charts/chartjs/area_population?top=5")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(len(data["data"]["labels"]), 6)
+        self.assertEqual(data["data"]["labels"][-1], "기타")
+
+    def test_cursor_pagination(self):
+        """limit/cursor 페이지네이션이 전체 행을 중복 없이 순회하는지 테스트"""
+        seen = []
+        cursor = None
+        while True:
+            url = "/api/data/?type=area_population&limit=4"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = self.app.get(url)
+            self.assertEqual(response.status_code, 200)
+            page = json.loads(response.data)
+            self.assertLessEqual(len(page["items"]), 4)
+            seen.extend(item["읍면동"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(len(seen), page["total"])
+        self.assertEqual(len(set(seen)), page["total"])
+
+    def test_pagination_rejects_invalid_requests(self):
+        """페이지네이션 미지원 타입과 잘못된 커서 요청 테스트"""
+        response = self.app.get("/api/data/?type=line&limit=10")
+        self.assertEqual(response.status_code, 400)
+        response = self.app.get("/api/data/?type=area_population&cursor=!!")
+        self.assertEqual(response.status_code, 400)
+
+    def test_split_style_and_data(self):
+        """스타일/데이터 분리 리소스와 캐시 헤더 테스트"""
+        response = self.app.get("/api/charts/chartjs/area_population/data")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "public, max-age=60")
+        payload = json.loads(response.data)
+        self.assertIn("datasets", payload["data"]["data"])
+        self.assertNotIn("options", payload["data"])
+
+        style_response = self.app.get(payload["style_url"])
+        self.assertEqual(style_response.status_code, 200)
+        self.assertIn("immutable", style_response.headers["Cache-Control"])
+        style = json.loads(style_response.data)
+        self.assertIn("options", style)
+        self.assertNotIn("data", style)
+
+        response = self.app.get(
+            payload["style_url"],
+            headers={"If-None-Match": style_response.headers["ETag"]},
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+        response = self.app.get("/api/charts/chartjs/area_population/style/0000")
+        self.assertEqual(response.status_code, 404)
+
+    def test_gzip_compression_negotiation(self):
+        """Accept-Encoding 협상과 압축 결과 재사용 테스트"""
+        from app import COMPRESSED_RESPONSES
+
+        plain = self.app.get("/api/charts/")
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertIn("Accept-Encoding", plain.headers["Vary"])
+
+        hits_before = COMPRESSED_RESPONSES.hits
+        for _ in range(2):
+            response = self.app.get("/api/charts/", headers={"Accept-Encoding": "gzip"})
+            self.assertEqual(response.headers["Content-Encoding"], "gzip")
+            self.assertEqual(gzip.decompress(response.data), plain.data)
+        self.assertGreater(COMPRESSED_RESPONSES.hits, hits_before)
+
+    def test_conditional_get_if_modified_since(self):
+        """Last-Modified / If-Modified-Since 조건부 요청 테스트"""
+        response = self.app.get("/api/charts/chartjs/area_population")
+        self.assertEqual(response.status_code, 200)
+        last_modified = response.headers["Last-Modified"]
+
+        with mock.patch("app.build_chart") as build_chart:
+            response = self.app.get(
+                "/api/charts/chartjs/area_population",
+                headers={"If-Modified-Since": last_modified},
+            )
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.data, b"")
+            build_chart.assert_not_called()
+
+        response = self.app.get(
+            "/api/charts/chartjs/area_population",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_versioned_urls_and_manifest(self):
+        """매니페스트와 데이터 버전 불변 URL 테스트"""
+        response = self.app.get("/api/manifest")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "no-store")
+        manifest = json.loads(response.data)
+
+        url = manifest["charts"]["chartjs/area_population"]
+        # 사양 코드가 바뀌면 데이터가 같아도 URL이 달라지도록 코드 버전 포함
+        self.assertIn(f".{manifest['code_version']}/charts/", url)
+        response = self.app.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertEqual(json.loads(response.data)["type"], "bar")
+
+        response = self.app.get(manifest["data"]["pie"])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response.headers["Cache-Control"])
+
+        response = self.app.get("/api/v/stale/charts/chartjs/area_population")
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.headers["Location"].endswith(url))
+
+    def test_ndjson_streaming(self):
+        """?stream=1/Accept 헤더로 차트별 NDJSON 스트리밍 테스트"""
+        response = self.app.get(
+            "/api/charts/?stream=1&fields=type", headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertTrue(response.is_streamed)
+        self.assertNotIn("Content-Encoding", response.headers)
+
+        lines = [json.loads(line) for line in response.data.splitlines()]
+        self.assertEqual(len(lines), 20)
+        self.assertEqual(set(lines[0]), {"library", "chart_type", "spec"})
+        chartjs_line = next(
+            line
+            for line in lines
+            if (line["library"], line["chart_type"]) == ("chartjs", "line")
+        )
+        self.assertEqual(chartjs_line["spec"], {"type": "line"})
+
+        response = self.app.get(
+            "/api/charts/", headers={"Accept": "application/x-ndjson"}
+        )
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertEqual(len(response.data.splitlines()), 20)
+
+    def test_sse_reload_events(self):
+        """데이터 재로드 시 SSE로 바뀐 데이터셋과 영향받는 차트가 전달되는지 테스트"""
+        response = self.app.get("/api/events", buffered=False)
+        self.assertEqual(response.mimetype, "text/event-stream")
+        events = iter(response.response)
+        first = next(events).decode("utf-8")
+        self.assertIn("event: versions", first)
+        # 이벤트 ID는 전체 데이터 버전이라 다른 워커에 재연결해도 비교 가능
+        self.assertIn(f"id: {chart_specs.get_data_version()}\n", first)
+        previous_version = chart_specs.get_data_version()
+
+        self.addCleanup(chart_specs.reload_datasets)
+        with mock.patch.object(
+            chart_specs,
+            "load_gender_population_data",
+            return_value={"남성": 1, "여성": 2},
+        ):
+            changed = chart_specs.reload_datasets()
+        self.assertEqual(list(changed), ["pie"])
+
+        message = next(events).decode("utf-8")
+        self.assertIn("event: reload", message)
+        data = json.loads(message.split("data: ", 1)[1])
+        self.assertEqual(data["datasets"], changed)
+        self.assertIn("chartjs/pie", data["charts"])
+        self.assertNotIn("chartjs/line", data["charts"])
+        self.assertIn(f"id: {data['data_version']}\n", message)
+        response.close()
+
+        # 재로드 전 버전으로 재연결하면 빠진 reload 이벤트를 다시 보냄
+        response = self.app.get(
+            "/api/events", headers={"Last-Event-ID": previous_version}, buffered=False
+        )
+        self.assertEqual(next(iter(response.response)).decode("utf-8"), message)
+        response.close()
+
+        # 모르는 ID로 재연결하면 현재 버전 전체를 보냄
+        response = self.app.get(
+            "/api/events", headers={"Last-Event-ID": "unknown"}, buffered=False
+        )
+        message = next(iter(response.response)).decode("utf-8")
+        self.assertIn("event: versions", message)
+        self.assertIn(f"id: {data['data_version']}\n", message)
+        response.close()
+
+        # 재로드된 데이터가 API 응답에 반영
+        self.assertEqual(
+            self.app.get("/api/data/?type=pie").get_json(), {"남성": 1, "여성": 2}
+        )
+
+    def test_sse_connection_limit(self):
+        """워커별 SSE 연결 수가 가득 차면 Retry-After와 함께 503으로 거절하는지 테스트"""
+        with mock.patch.object(app_module, "SSE_CONNECTIONS", ConcurrencyLimiter(1)):
+            first = self.app.get("/api/events", buffered=False)
+            self.assertEqual(first.status_code, 200)
+
+            rejected = self.app.get("/api/events")
+            self.assertEqual(rejected.status_code, 503)
+            self.assertEqual(rejected.headers["Retry-After"], "30")
+            self.assertIn("message", rejected.get_json())
+
+            # 연결을 닫으면 슬롯이 반환됨
+            first.close()
+            second = self.app.get("/api/events", buffered=False)
+            self.assertEqual(second.status_code, 200)
+            second.close()
+
+    def test_api_key_rate_limit_and_load_shedding(self):
+        """API 키 확인(401), 키별 속도 제한(429), 동시 처리 수 제한(503) 테스트"""
+        access_control = AccessController(
+            api_keys=["dashboard", "batch"],
+            rate_limiter=RateLimiter((0, 0), parse_quotas("batch=0.5/2")),
+            concurrency_limiter=ConcurrencyLimiter(1),
+        )
+        with mock.patch.object(app_module, "ACCESS_CONTROL", access_control):
+            self.assertEqual(self.app.get("/api/data/?type=pie").status_code, 401)
+            self.assertEqual(self.app.get("/health").status_code, 200)
+
+            batch = {"X-API-KEY": "batch"}
+            statuses = [
+                self.app.get("/api/data/?type=pie", headers=batch, buffered=True)
+                for _ in range(3)
+            ]
+            self.assertEqual([r.status_code for r in statuses], [200, 200, 429])
+            self.assertEqual(statuses[-1].headers["Retry-After"], "2")
+
+            # 다른 키는 영향을 받지 않음
+            dashboard = {"X-API-KEY": "dashboard"}
+            response = self.app.get(
+                "/api/data/?type=pie", headers=dashboard, buffered=True
+            )
+            self.assertEqual(response.status_code, 200)
+
+            # 스트리밍 중인 요청이 슬롯을 점유하면 다른 요청은 바로 503
+            stream = self.app.get("/api/charts/?stream=1", headers=dashboard)
+            response = self.app.get("/api/data/?type=pie", headers=dashboard)
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["Retry-After"], "1")
+
+            stream.close()
+            self.assertEqual(access_control.concurrency_limiter.active, 0)
+
+    def test_json_encoding_nan_and_numpy(self):
+        """NaN은 null로, NumPy 값은 기본 타입으로 인코딩되는지 테스트"""
+        growth = {"도소매": {2017: float("nan"), 2018: np.float64(2.5)}, "합계": np.int64(7)}
+        expected = {"도소매": {"2017": None, "2018": 2.5}, "합계": 7}
+
+        with mock.patch.object(chart_specs, "GROWTH_RATE_DATA", growth):
+            response = self.app.get("/api/data/?type=growth_rate")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), expected)
+
+        # orjson이 없을 때의 표준 json 경로도 같은 결과
+        with mock.patch.object(json_encoder, "orjson", None):
+            self.assertEqual(json.loads(json_encoder.dumps(growth)), expected)
+
+    def test_swagger_json_cached(self):
+        """Swagger 명세를 한 번만 만들고 ETag/압축과 함께 재사용하는지 테스트"""
+        app_module.swagger_document.cache_clear()
+        response = self.app.get("/swagger.json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/api/charts/", response.get_json()["paths"])
+
+        response = self.app.get("/swagger.json", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        response = self.app.get(
+            "/swagger.json",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": response.headers["ETag"],
+            },
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(app_module.swagger_document.cache_info().misses, 1)
+
     def test_cors_headers(self):
         """CORS 헤더 테스트"""
         response = self.app.get("/health")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+ASGI 앱 테스트 파일
+asgi_app의 엔드포인트가 Flask 앱과 같은 응답을 주는지 테스트
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+from starlette.requests import Request
+from starlette.testclient import TestClient
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import asgi_app as asgi_module  # noqa: E402
+import event_broker  # noqa: E402
+from app import app as flask_app  # noqa: E402
+from asgi_app import app as asgi_app  # noqa: E402
+from event_broker import EventBroker  # noqa: E402
+
+
+class TestASGI(unittest.TestCase):
+    """ASGI 앱 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정 (lifespan으로 스레드 풀 생성)"""
+        self.client = TestClient(asgi_app)
+        self.client.__enter__()
+        self.flask_client = flask_app.test_client()
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+
+    def test_health_endpoint(self):
+        """헬스체크 엔드포인트 테스트"""
+        response = self.client.get("/health")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "healthy")
+
+    def test_metrics_endpoint(self):
+        """/metrics가 Starlette 라우트 경로 템플릿으로 요청을 집계하는지 테스트"""
+        self.client.get("/api/charts/echarts/line")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('route="/api/charts/{library}/{chart_type}"', response.text)
+
+    def test_same_payload_as_flask(self):
+        """차트/데이터 응답이 Flask 앱과 같은지 테스트"""
+        for url in (
+            "/api/charts/",
+            "/api/charts/chartjs?type=area_population&top=3",
+            "/api/charts/echarts/line?fields=series.name",
+            "/api/data/?type=opening_closing_rate&limit=5",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), self.flask_client.get(url).get_json())
+
+    def test_errors_and_compression(self):
+        """잘못된 요청의 에러 응답과 gzip 압축 협상 테스트"""
+        response = self.client.get("/api/charts/unknown")
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("message", response.json())
+
+        response = self.client.get("/api/charts/chartjs/line?max_points=1")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/api/charts/", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertIn("data", response.json())
+
+    def test_split_and_versioned_resources(self):
+        """스타일/데이터 분리, 버전 URL, 매니페스트가 Flask 앱과 같은지 테스트"""
+        response = self.client.get("/api/manifest")
+        self.assertEqual(response.headers["Cache-Control"], "no-store")
+        manifest = response.json()
+        self.assertEqual(manifest, self.flask_client.get("/api/manifest").get_json())
+
+        for url in (
+            "/api/charts/chartjs/area_population/data",
+            manifest["charts"]["echarts/line"],
+            manifest["data"]["pie"],
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                flask_response = self.flask_client.get(url)
+                self.assertEqual(response.json(), flask_response.get_json())
+                self.assertEqual(
+                    response.headers["Cache-Control"],
+                    flask_response.headers["Cache-Control"],
+                )
+
+        response = self.client.get(
+            "/api/v/stale/charts/echarts/line", follow_redirects=False
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            response.headers["Location"], manifest["charts"]["echarts/line"]
+        )
+
+        style_url = self.client.get("/api/charts/echarts/line/data").json()["style_url"]
+        response = self.client.get(style_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        response = self.client.get(
+            style_url, headers={"If-None-Match": response.headers["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(
+            self.client.get("/api/charts/echarts/line/style/0000").status_code, 404
+        )
+
+    def test_conditional_get_if_modified_since(self):
+        """Last-Modified / If-Modified-Since 조건부 요청 테스트"""
+        response = self.client.get("/api/charts/chartjs/area_population")
+        last_modified = response.headers["Last-Modified"]
+        self.assertEqual(
+            last_modified,
+            self.flask_client.get("/api/charts/chartjs/area_population").headers[
+                "Last-Modified"
+            ],
+        )
+
+        with mock.patch.object(asgi_module, "build_chart") as build_chart:
+            response = self.client.get(
+                "/api/charts/chartjs/area_population",
+                headers={"If-Modified-Since": last_modified},
+            )
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b"")
+            build_chart.assert_not_called()
+
+        response = self.client.get(
+            "/api/charts/chartjs/area_population",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_sse_slow_subscriber_is_unsubscribed(self):
+        """대기열이 가득 찬 SSE 구독자를 이벤트 루프에서 구독 해제하는지 테스트"""
+        broker = EventBroker()
+
+        async def scenario():
+            request = Request(
+                {"type": "http", "method": "GET", "path": "/api/events", "headers": []}
+            )
+            response = await asgi_module.data_events(request)
+            body = response.body_iterator
+            self.assertIn(b"event: versions", await body.__anext__())
+            self.assertEqual(broker.subscriber_count, 1)
+
+            # 재로드 스레드에서 대기열 크기보다 많은 이벤트를 발행
+            def publish_many():
+                for index in range(asgi_module.SSE_QUEUE_SIZE + 1):
+                    broker.publish("reload", {}, f"v{index}")
+
+            await asyncio.to_thread(publish_many)
+            await asyncio.sleep(0.01)
+            self.assertEqual(broker.subscriber_count, 0)
+            await body.aclose()
+
+        with mock.patch.object(event_broker, "DATA_EVENTS", broker), mock.patch.object(
+            asgi_module, "DATA_EVENTS", broker
+        ):
+            asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
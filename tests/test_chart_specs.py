@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+차트 사양 모듈 테스트
+데이터 가공(다운샘플링 등) 함수들을 테스트
+"""
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import build_static  # noqa: E402
+import chart_specs  # noqa: E402
+import structured_logging  # noqa: E402
+from chart_registry import CHART_REGISTRY, ChartRegistry, register_chart  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+
+
+class TestDownsampling(unittest.TestCase):
+    """다운샘플링 테스트 클래스"""
+
+    def test_lttb_keeps_endpoints_and_peak(self):
+        """LTTB가 양 끝점과 급격한 피크를 유지하는지 테스트"""
+        values = np.zeros(1000)
+        values[437] = 100.0
+        indices = chart_specs.lttb_indices(values, 20)
+        self.assertEqual(len(indices), 20)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 999)
+        self.assertIn(437, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_minmax_keeps_extremes(self):
+        """min/max 데시메이션이 전체 최솟값/최댓값을 유지하는지 테스트"""
+        values = np.sin(np.linspace(0, 20, 500))
+        indices = chart_specs.minmax_indices(values, 50)
+        self.assertEqual(len(indices), 50)
+        self.assertIn(int(np.argmax(values)), indices)
+        self.assertIn(int(np.argmin(values)), indices)
+
+    def test_minmax_returns_exactly_max_points(self):
+        """홀수 max_points와 값이 일정한 구간에서도 정확히 max_points개를 고르는지 테스트"""
+        series = {
+            "sine": np.sin(np.linspace(0, 20, 101)),
+            "constant": np.full(101, 7.0),
+            "short": np.arange(6, dtype=float),
+        }
+        for name, values in series.items():
+            for max_points in range(1, len(values)):
+                with self.subTest(series=name, max_points=max_points):
+                    indices = chart_specs.minmax_indices(values, max_points)
+                    self.assertEqual(len(indices), max_points)
+                    self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_area_population_max_points(self):
+        """읍면동 차트의 max_points 적용 및 캐시 테스트"""
+        config = chart_specs.get_chartjs_area_population_config(max_points=6)
+        labels = config["data"]["labels"]
+        self.assertEqual(len(labels), 6)
+        self.assertEqual(
+            config["data"]["datasets"][0]["data"],
+            [chart_specs.AREA_POPULATION_DATA[label] for label in labels],
+        )
+
+        for max_points in (3, 5):
+            config = chart_specs.get_chartjs_area_population_config(
+                max_points=max_points
+            )
+            self.assertEqual(len(config["data"]["labels"]), max_points)
+
+        chart_specs.get_chartjs_area_population_config(max_points=6)
+        self.assertGreaterEqual(
+            chart_specs._cached_downsampled_labels.cache_info().hits, 1
+        )
+
+
+class TestTopCategories(unittest.TestCase):
+    """상위 N개 + 기타 묶기 테스트 클래스"""
+
+    def test_top_n_indices_descending(self):
+        """argpartition 기반 상위 N개 선택이 내림차순인지 테스트"""
+        values = np.array([5, 1, 9, 3, 7, 2])
+        self.assertEqual(chart_specs.top_n_indices(values, 3).tolist(), [2, 4, 0])
+
+    def test_area_population_rollup_preserves_total(self):
+        """기타 항목을 포함한 합계가 원래 합계와 같은지 테스트"""
+        labels, (values,) = chart_specs.top_categories("area_population", 3)
+        self.assertEqual(len(labels), 4)
+        self.assertEqual(labels[-1], chart_specs.OTHERS_LABEL)
+        self.assertEqual(sum(values), sum(chart_specs.AREA_POPULATION_DATA.values()))
+
+
+class TestChartRegistry(unittest.TestCase):
+    """차트 레지스트리 테스트 클래스"""
+
+    def test_all_builders_registered(self):
+        """모든 라이브러리/차트 타입 조합이 등록되어 있는지 테스트"""
+        self.assertEqual(
+            CHART_REGISTRY.libraries(), ["vega_lite", "echarts", "plotly", "chartjs"]
+        )
+        self.assertEqual(len(CHART_REGISTRY), 20)
+        entry = CHART_REGISTRY.get("chartjs", "area_population")
+        self.assertEqual(entry.options, frozenset({"max_points", "top"}))
+        self.assertIsNone(CHART_REGISTRY.get("plotly", "area_population"))
+
+    def test_build_cached_per_data_version(self):
+        """같은 데이터 버전에서는 캐시된 사양을 재사용하는지 테스트"""
+        entry = CHART_REGISTRY.get("echarts", "line")
+        first = CHART_REGISTRY.build(entry, {"max_points": 5}, "v1")
+        hits = CHART_REGISTRY.hits
+        self.assertIs(CHART_REGISTRY.build(entry, {}, "v1"), first)
+        self.assertEqual(CHART_REGISTRY.hits, hits + 1)
+        self.assertIsNot(CHART_REGISTRY.build(entry, {}, "v2"), first)
+
+    def test_concurrent_cold_builds_coalesced(self):
+        """캐시 미스일 때 동시에 요청된 같은 사양은 한 번만 생성되는지 테스트"""
+        registry = ChartRegistry()
+        calls = []
+
+        def slow_builder(max_points=None):
+            calls.append(max_points)
+            time.sleep(0.1)
+            return {"max_points": max_points}
+
+        with mock.patch("chart_registry.CHART_REGISTRY", registry):
+            register_chart("test", "slow")(slow_builder)
+        entry = registry.get("test", "slow")
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    registry.build(entry, {"max_points": 5}, "v1")
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, [5])
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(registry.coalesced, 7)
+
+    def test_single_flight_error_and_timeout(self):
+        """먼저 실행한 계산의 예외 전달과 대기 시간 초과 시 직접 계산 테스트"""
+        flight = SingleFlight(timeout=0.05)
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(1)
+            raise ValueError("실패")
+
+        errors = []
+
+        def call_failing():
+            try:
+                flight.do("key", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call_failing)
+        leader.start()
+        started.wait(1)
+
+        # 대기 시간을 넘기면 직접 계산
+        self.assertEqual(flight.do("key", lambda: "직접"), "직접")
+        self.assertEqual(flight.timeouts, 1)
+
+        follower = threading.Thread(target=call_failing)
+        flight.timeout = 1
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(len(errors), 2)
+
+
+class TestReload(unittest.TestCase):
+    """데이터 재로드 테스트 클래스"""
+
+    def test_reload_updates_only_changed_datasets(self):
+        """내용이 바뀐 데이터셋만 버전과 로드 시각이 갱신되는지 테스트"""
+        versions = dict(chart_specs.DATASET_VERSIONS)
+        loaded_at = dict(chart_specs.DATASET_LOADED_AT)
+        self.assertEqual(chart_specs.reload_datasets(), {})
+
+        self.addCleanup(chart_specs.reload_datasets)
+        with mock.patch.object(
+            chart_specs, "load_area_population_data", return_value={"소흘읍": 1}
+        ):
+            changed = chart_specs.reload_datasets()
+
+        self.assertEqual(list(changed), ["area_population"])
+        self.assertEqual(chart_specs.get_dataset("area_population"), {"소흘읍": 1})
+        self.assertNotEqual(changed["area_population"], versions["area_population"])
+        self.assertGreater(
+            chart_specs.DATASET_LOADED_AT["area_population"],
+            loaded_at["area_population"],
+        )
+        self.assertEqual(chart_specs.DATASET_LOADED_AT["line"], loaded_at["line"])
+
+    def test_watcher_reloads_on_file_change(self):
+        """데이터 폴더 파일이 바뀌면 감시 스레드가 재로드하는지 테스트"""
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+            chart_specs, "reload_datasets", return_value={}
+        ) as reload_datasets:
+            stopped = chart_specs.start_data_watcher(0.01, directory)
+            time.sleep(0.05)
+            reload_datasets.assert_not_called()
+
+            with open(os.path.join(directory, "new.csv"), "w") as f:
+                f.write("a,b\n")
+            for _ in range(100):
+                if reload_datasets.called:
+                    break
+                time.sleep(0.01)
+            stopped.set()
+            reload_datasets.assert_called()
+
+
+class TestCsvLoaders(unittest.TestCase):
+    """pandas 없이 읽는 가맹점 현황 CSV 로더 테스트 클래스"""
+
+    FRANCHISE_FILES = (
+        "지역별_도소매별_가맹점수_현황.csv",
+        "지역별_서비스별_가맹점수_현황.csv",
+        "지역별_외식별_가맹점수_현황.csv",
+        "주요도소매별_가맹점_개폐점현황.csv",
+        "주요서비스별_가맹점_개폐점현황.csv",
+        "주요외식별_가맹점_개폐점현황.csv",
+    )
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, "data"))
+        for name in self.FRANCHISE_FILES:
+            with open(
+                os.path.join(directory, "data", name), "w", encoding="utf-8"
+            ) as f:
+                f.write(
+                    "yr,indutyMlsfcNm,frcsCnt,allFrcsCnt,newFrcsRt,endCncltnRt\n"
+                    "2023,편의점,10,100,5.0,1.0\n"
+                    "2023,슈퍼마켓,20,100,3.0,\n"
+                    "2024,편의점,30,125,6.0,2.0\n"
+                    "2024,슈퍼마켓,40,125,4.0,4.0\n"
+                )
+        cwd = os.getcwd()
+        os.chdir(directory)
+        self.addCleanup(os.chdir, cwd)
+
+    def test_franchise_aggregations(self):
+        """연도별 집계가 pandas groupby와 같은 규칙(결측값 제외)으로 계산되는지 테스트"""
+        line_data, bar_data = chart_specs.load_chart_data()
+        self.assertEqual(line_data["도소매"], {2023: 100, 2024: 125})
+        self.assertEqual(bar_data["외식"], 25)
+
+        growth = chart_specs.load_growth_rate_data()["서비스"]
+        self.assertTrue(np.isnan(growth[2023]))
+        self.assertAlmostEqual(growth[2024], 25.0)
+
+        self.assertEqual(
+            chart_specs.load_closing_rate_data()["도소매"], {2023: 1.0, 2024: 3.0}
+        )
+        self.assertEqual(
+            chart_specs.load_net_growth_rate_data()["외식"], {2023: 4.0, 2024: 2.0}
+        )
+        self.assertEqual(
+            chart_specs.load_opening_closing_rate_data()["도소매"],
+            {"업종": ["편의점", "슈퍼마켓"], "개점률": [6.0, 4.0], "폐점률": [2.0, 4.0]},
+        )
+
+    def test_import_does_not_load_pandas(self):
+        """가맹점 현황 CSV만 있으면 app import 시 pandas를 불러오지 않는지 테스트"""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, app; print('pandas' in sys.modules)"],
+            env={
+                **os.environ,
+                "PYTHONPATH": os.path.abspath(
+                    os.path.join(os.path.dirname(__file__), "..")
+                ),
+            },
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split()[-1], "False")
+
+    def test_load_is_logged_with_details(self):
+        """로드 결과가 데이터셋, 파일, 행 수, 크기, 소요 시간과 함께 기록되는지 테스트"""
+        with mock.patch.dict(chart_specs.DATASET_LOAD_STATUS), self.assertLogs(
+            "chart_api.loader", "INFO"
+        ) as logs:
+            chart_specs._run_loader(("line", "bar"), chart_specs.load_chart_data)
+
+        self.assertEqual([record.dataset for record in logs.records], ["line", "bar"])
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.source, "csv")
+        self.assertEqual(record.rows, 12)
+        self.assertEqual(len(record.files), 3)
+        self.assertGreater(record.file_bytes, 0)
+        self.assertIsNone(record.fallback_reason)
+
+    def test_load_error_is_logged_with_exception(self):
+        """CSV 파싱 실패 시 대체 사유와 예외가 JSON 로그에 남는지 테스트"""
+        with mock.patch.dict(chart_specs.DATASET_LOAD_STATUS), mock.patch.object(
+            chart_specs.csv_tables, "read_rows", side_effect=ValueError("잘못된 CSV")
+        ), self.assertLogs("chart_api.loader", "WARNING") as logs:
+            chart_specs._run_loader(
+                ("closing_rate",), chart_specs.load_closing_rate_data
+            )
+
+        # 큐를 거쳐 출력되는 형태와 같게 변환
+        handler = structured_logging._NonBlockingQueueHandler(None)
+        line = json.loads(
+            structured_logging.JSONFormatter().format(handler.prepare(logs.records[0]))
+        )
+        self.assertEqual(line["dataset"], "closing_rate")
+        self.assertEqual(line["source"], "hardcoded")
+        self.assertEqual(line["fallback_reason"], "load_error: 잘못된 CSV")
+        self.assertIn("ValueError: 잘못된 CSV", line["exception"])
+        self.assertNotIn("Traceback", line["message"])
+
+
+class TestStaticBuild(unittest.TestCase):
+    """정적 파일 빌드 테스트 클래스"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+    def read(self, path):
+        with open(os.path.join(self.output_dir, path), "rb") as f:
+            return f.read()
+
+    def test_build_writes_hashed_compressed_files(self):
+        """모든 차트 사양을 해시 이름의 최소화/압축 파일과 manifest로 쓰는지 테스트"""
+        manifest, rendered, skipped, _ = build_static.build_static(self.output_dir, 2)
+        self.assertEqual((rendered, skipped), (len(manifest["files"]), 0))
+        for entry in CHART_REGISTRY:
+            self.assertIn(
+                f"charts/{entry.library}/{entry.chart_type}", manifest["files"]
+            )
+
+        item = manifest["files"]["charts/echarts/line"]
+        self.assertIn(item["etag"], item["path"])
+        body = self.read(item["path"])
+        self.assertNotIn(b"\n", body)
+        entry = CHART_REGISTRY.get("echarts", "line")
+        self.assertEqual(json.loads(body), entry.builder())
+        self.assertEqual(
+            gzip.decompress(self.read(item["encodings"]["gzip"]["path"])), body
+        )
+
+    def test_rebuild_skips_unchanged_datasets(self):
+        """데이터셋 버전이 그대로인 항목은 건너뛰고 바뀐 항목만 다시 렌더링하는지 테스트"""
+        manifest, _, _, _ = build_static.build_static(self.output_dir, 1)
+        _, rendered, _, removed = build_static.build_static(self.output_dir, 1)
+        self.assertEqual((rendered, removed), (0, 0))
+
+        self.addCleanup(chart_specs.reload_datasets)
+        with mock.patch.object(
+            chart_specs, "load_area_population_data", return_value={"소흘읍": 1}
+        ):
+            chart_specs.reload_datasets()
+        rebuilt, rendered, _, removed = build_static.build_static(self.output_dir, 1)
+
+        changed = {
+            key
+            for key, item in rebuilt["files"].items()
+            if item["path"] != manifest["files"][key]["path"]
+        }
+        self.assertIn("data/area_population", changed)
+        self.assertNotIn("charts/echarts/line", changed)
+        self.assertEqual(
+            rendered,
+            sum(
+                "area_population" in item["datasets"]
+                for item in rebuilt["files"].values()
+            ),
+        )
+        self.assertGreater(removed, 0)
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(
+                    self.output_dir, manifest["files"]["data/area_population"]["path"]
+                )
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+정적 서버 테스트 파일
+static_server가 미리 만든 파일을 동적 API와 같은 내용으로 전송하는지 테스트
+"""
+
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+import static_server  # noqa: E402
+from app import app as flask_app  # noqa: E402
+from build_static import build_static  # noqa: E402
+
+
+class TestStaticServer(unittest.TestCase):
+    """정적 서버 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.output_dir = tempfile.mkdtemp()
+        build_static(cls.output_dir, 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.output_dir)
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            static_server, "MANIFEST", static_server.StaticManifest(self.output_dir)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = static_server.app.test_client()
+        self.flask_client = flask_app.test_client()
+
+    def get(self, url, **kwargs):
+        response = self.client.get(url, **kwargs)
+        response.close()
+        return response
+
+    def test_same_payload_as_dynamic_api(self):
+        """미리 만든 응답이 동적 API 응답과 같은지 테스트"""
+        for url in (
+            "/api/charts/",
+            "/api/charts/echarts",
+            "/api/charts/plotly?type=bar",
+            "/api/charts/chartjs/line",
+            "/api/data/",
+            "/api/data/?type=pie",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url, buffered=True)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.get_json(), self.flask_client.get(url).get_json()
+                )
+
+    def test_precompressed_file_and_etag(self):
+        """압축 파일 전송과 인코딩별 ETag 재검증을 테스트"""
+        response = self.client.get(
+            "/api/charts/", headers={"Accept-Encoding": "gzip"}, buffered=True
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertNotIn("Content-Disposition", response.headers)
+        self.assertEqual(
+            gzip.decompress(response.data), self.get("/api/charts/", buffered=True).data
+        )
+
+        etag = response.headers["ETag"]
+        self.assertTrue(etag.endswith('-gzip"'))
+        response = self.get(
+            "/api/charts/",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_chart_and_dynamic_params(self):
+        """없는 차트는 404, 미리 만들 수 없는 파라미터는 400을 반환하는지 테스트"""
+        self.assertEqual(self.get("/api/charts/echarts/unknown").status_code, 404)
+        response = self.get("/api/charts/echarts/line?max_points=10")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("max_points", response.get_json()["message"])
+
+    def test_does_not_import_pandas(self):
+        """정적 모드 WSGI 앱이 pandas와 chart_specs를 import하지 않는지 테스트"""
+        code = (
+            "import sys, wsgi; "
+            "print(wsgi.app.name, 'pandas' in sys.modules, "
+            "'chart_specs' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT_DIR,
+            env={**os.environ, "SERVING_MODE": "static"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split(), ["static_server", "False", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
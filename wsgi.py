@@ -0,0 +1,30 @@
+"""
+프로덕션 WSGI 진입점
+gunicorn 등 WSGI 서버에서 `wsgi:app`으로 불러 사용합니다.
+
+preload_app 설정 시 마스터 프로세스에서 한 번만 import되어
+데이터셋 로드와 기본 차트 사양 생성이 fork 전에 끝나고,
+워커들은 이 메모리를 copy-on-write로 공유합니다.
+
+SERVING_MODE=static이면 build_static.py로 미리 만든 파일만 전송하는
+static_server 앱을 사용하며, pandas와 chart_specs를 import하지 않습니다.
+"""
+
+import os
+
+SERVING_MODE = os.environ.get("SERVING_MODE", "dynamic")
+
+if SERVING_MODE == "static":
+    from static_server import app
+else:
+    from app import app
+    from chart_specs import warm_up_spec_cache
+    from metrics import sync_cache_counters
+
+    # 기본 옵션의 모든 차트 사양을 미리 생성 (끝나야 /health/ready가 200)
+    warm_up_spec_cache()
+
+    # 예열 중의 캐시 미스를 fork 전에 마스터 값으로 반영해 워커마다 중복 집계되지 않게 함
+    sync_cache_counters()
+
+__all__ = ["app"]